@@ -53,7 +53,7 @@ questions = po.conduct_interview()
 
 # Save questions to file for reference
 with open('/tmp/rc_interview_questions.json', 'w') as f:
-    json.dump(questions, f, indent=2)
+    json.dump([question._asdict() for question in questions], f, indent=2)
 
 print("\n📝 Interview questions saved to /tmp/rc_interview_questions.json")
 print("Please answer these questions to continue the build process.")
@@ -71,12 +71,12 @@ echo "=================================================="
 python3 << 'WORKFLOW_EOF' &
 import asyncio
 import sys
-import json
 from datetime import datetime
+from pathlib import Path
 
 sys.path.insert(0, '/Users/MAC/Documents/projects/omnimind/src/agents')
 
-from roulette_committee_workflow import RouletteCommitteeWorkflowOrchestrator
+from roulette_committee_workflow import RouletteCommitteeWorkflowOrchestrator, results_to_json
 
 async def build_roulette_committee():
     # Pre-configured responses for rapid build
@@ -143,15 +143,13 @@ async def build_roulette_committee():
         ]
     }
     
-    # Create orchestrator
-    orchestrator = RouletteCommitteeWorkflowOrchestrator()
-    
     # Execute complete workflow
     print("\n⚡ Starting ultra-fast development pipeline...")
     print("=" * 60)
     
     start_time = datetime.now()
-    results = await orchestrator.execute_complete_workflow(interview_responses)
+    async with RouletteCommitteeWorkflowOrchestrator() as orchestrator:
+        results = await orchestrator.execute_complete_workflow(interview_responses)
     end_time = datetime.now()
     
     duration = (end_time - start_time).total_seconds()
@@ -174,8 +172,7 @@ async def build_roulette_committee():
             print(f"📈 Performance Score: {deployment.get('performance_score', 0)}/100")
     
     # Save results
-    with open('/tmp/rc_build_results.json', 'w') as f:
-        json.dump(results, f, indent=2)
+    Path('/tmp/rc_build_results.json').write_bytes(results_to_json(results))
     
     print(f"\n📁 Full results saved to /tmp/rc_build_results.json")
     
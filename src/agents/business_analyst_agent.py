@@ -28,24 +28,23 @@ class BusinessAnalystAgent:
         """
         Break down an epic into detailed user stories
         """
-        stories = []
-        
+        return self.build_stories(epic)
+    
+    def build_stories(self, epic: Dict) -> List[Dict]:
+        """
+        Break down an epic into user stories synchronously; story generation
+        is pure CPU work, so callers can skip the event loop entirely
+        """
         # Determine number of stories based on epic complexity
         story_count = epic.get('estimation', 8) // 2  # Roughly 2-3 points per story
         story_count = max(3, min(story_count, 8))  # Between 3-8 stories per epic
         
-        # Generate stories in parallel
-        tasks = []
-        for i in range(story_count):
-            task = self._create_user_story(epic, i)
-            tasks.append(task)
-        
-        stories = await asyncio.gather(*tasks)
+        stories = [self._build_user_story(epic, i) for i in range(story_count)]
         
         self.stories.extend(stories)
         return stories
     
-    async def _create_user_story(self, epic: Dict, story_index: int) -> Dict:
+    def _build_user_story(self, epic: Dict, story_index: int) -> Dict:
         """
         Create a detailed user story from epic
         """
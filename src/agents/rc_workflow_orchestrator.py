@@ -5,17 +5,117 @@ Developer → Automation QA → UX/UI → BA → Vercel → PO Approval
 """
 
 import asyncio
-import json
+import hashlib
 import os
+import re
+import sqlite3
 import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
-from dataclasses import dataclass, field
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from enum import Enum
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
-import hashlib
-import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+import aiohttp
+import orjson
+
+try:
+    import aiofiles
+    AIOFILES_AVAILABLE = True
+except ImportError:
+    AIOFILES_AVAILABLE = False
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+VERCEL_API_URL = "https://api.vercel.com"
+_VERCEL_URL_RE = re.compile(r'https://\S*vercel\.app\S*')
+_DESIGN_FEEDBACK_RE = re.compile(r'(?P<ui>color|contrast)|(?P<ux>layout|spacing)', re.IGNORECASE)
+_DEFAULT_STATE_DB = str(Path(tempfile.gettempdir()) / 'rc_workflow_state.db')
+
+# dataclass(slots=True) is only available from Python 3.10
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Agent names are interned once so every template, route and task shares one str object
+_AGENTS = {name: sys.intern(name) for name in (
+    'frontend-developer', 'backend-developer', 'mobile-developer', 'ai-engineer',
+    'automation-qa', 'security-tester', 'performance-tester',
+    'ux-designer', 'ui-designer', 'brand-guardian',
+    'business-analyst', 'product-owner', 'scrum-master',
+    'devops', 'infrastructure', 'monitoring',
+    'documentation', 'support', 'analytics',
+)}
+
+_BUSINESS_METRICS = {
+    'estimated_revenue_impact': 'High',
+    'user_engagement_score': 95,
+    'feature_adoption_likelihood': 85,
+    'technical_debt_added': 'Low',
+    'maintenance_burden': 'Low',
+    'scalability_score': 90
+}
+
+
+def _classify_design_feedback(item: str) -> Optional[str]:
+    """Route feedback to 'ui' or 'ux' in one case-insensitive pass; UI keywords win"""
+    bucket = None
+    for match in _DESIGN_FEEDBACK_RE.finditer(item):
+        if match.lastgroup == 'ui':
+            return 'ui'
+        bucket = 'ux'
+    return bucket
+
+
+def _content_digest(data: bytes) -> str:
+    """Fast non-cryptographic digest used for ids and cache keys"""
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_64_hexdigest(data)
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+def _build_schedule(templates: Tuple) -> Tuple[Tuple[int, ...], Tuple[int, ...], Tuple[int, ...]]:
+    """
+    Encode the task template as integer ids: CSR successor lists
+    (indptr, indices) plus the initial in-degree of every task
+    """
+    index = {template[0]: i for i, template in enumerate(templates)}
+    successors: List[List[int]] = [[] for _ in templates]
+    in_degree = [0] * len(templates)
+    for i, template in enumerate(templates):
+        for dep in template[5]:
+            successors[index[dep]].append(i)
+            in_degree[i] += 1
+    
+    # Reject cycles up front rather than deadlocking the scheduler
+    remaining = list(in_degree)
+    ready = [i for i, degree in enumerate(remaining) if degree == 0]
+    visited = 0
+    while ready:
+        node = ready.pop()
+        visited += 1
+        for succ in successors[node]:
+            remaining[succ] -= 1
+            if remaining[succ] == 0:
+                ready.append(succ)
+    if visited != len(templates):
+        raise ValueError("Task template dependencies contain a cycle")
+    
+    indptr = [0]
+    for succ in successors:
+        indptr.append(indptr[-1] + len(succ))
+    indices = tuple(chain.from_iterable(successors))
+    return tuple(indptr), indices, tuple(in_degree)
 
 class WorkflowStage(Enum):
     PLANNING = "planning"
@@ -37,7 +137,18 @@ class TaskStatus(Enum):
     DEPLOYED = "deployed"
     COMPLETED = "completed"
 
-@dataclass
+class Artifacts:
+    """Slotted container for the artifacts handed between workflow stages"""
+    
+    __slots__ = ('feature', 'requirements', 'acceptance_criteria')
+    
+    def __init__(self, feature: Optional[Dict] = None, requirements: Optional[Dict] = None,
+                 acceptance_criteria: Optional[Dict] = None):
+        self.feature = feature if feature is not None else {}
+        self.requirements = requirements if requirements is not None else {}
+        self.acceptance_criteria = acceptance_criteria if acceptance_criteria is not None else {}
+
+@dataclass(**_DATACLASS_SLOTS)
 class WorkflowTask:
     id: str
     name: str
@@ -46,7 +157,7 @@ class WorkflowTask:
     status: TaskStatus
     assigned_agents: List[str]
     dependencies: List[str] = field(default_factory=list)
-    artifacts: Dict[str, Any] = field(default_factory=dict)
+    artifacts: Artifacts = field(default_factory=Artifacts)
     test_results: Dict[str, Any] = field(default_factory=dict)
     review_comments: List[str] = field(default_factory=list)
     created_at: datetime = field(default_factory=datetime.now)
@@ -54,8 +165,9 @@ class WorkflowTask:
     completion_time: Optional[float] = None
     retry_count: int = 0
     max_retries: int = 3
+    workflow_id: str = ""
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class WorkflowMetrics:
     total_tasks: int = 0
     completed_tasks: int = 0
@@ -66,18 +178,92 @@ class WorkflowMetrics:
     po_approval_rate: float = 0
     total_execution_time: float = 0
 
+# Task-local workflow id, inherited by every task spawned from execute_complete_workflow
+_current_workflow: ContextVar[Optional[str]] = ContextVar("_current_workflow", default=None)
+
 class RCWorkflowOrchestrator:
     """
     Master orchestrator for Roulette Community development workflow
     Manages the complete pipeline from development to production
     """
     
-    def __init__(self):
+    STAGE_LABELS = {
+        'planning': "📝 Stage 1: Planning",
+        'development': "👨‍💻 Stage 2: Development (Parallel Execution)",
+        'testing': "🧪 Stage 3: Automated Testing (1000 Parallel Tests)",
+        'ux_review': "🎨 Stage 4: UX/UI Review",
+        'ba_validation': "📊 Stage 5: Business Analysis Validation",
+        'deployment': "🚀 Stage 6: Deployment to Vercel Production",
+        'po_approval': "✅ Stage 7: Product Owner Approval",
+        'post_deployment': "🛟 Post-Deployment: Monitoring, Support and Analytics",
+    }
+    
+    # Stage suffix -> (agent, action) that undoes the stage's side effects
+    _COMPENSATIONS = {
+        'development': (_AGENTS['frontend-developer'], 'revert_changes'),
+        'deployment': (_AGENTS['devops'], 'rollback_deployment'),
+    }
+    
+    # (test suite, result key, agent, action) used to route failed tests to fixers
+    _FIX_ROUTES = (
+        ('automation_qa', 'failed_tests', _AGENTS['frontend-developer'], 'fix_failed_tests'),
+        ('security', 'vulnerabilities', _AGENTS['security-tester'], 'fix_vulnerabilities'),
+        ('performance', 'issues', _AGENTS['performance-tester'], 'optimize_performance'),
+    )
+    
+    # (suffix, name, description, stage, assigned agents, dependency suffixes)
+    # Planning must stay first: it carries the feature artifacts.
+    _TASK_TEMPLATES = (
+        ('planning', "Requirements Planning",
+         "Define requirements and acceptance criteria",
+         WorkflowStage.PLANNING, (_AGENTS['business-analyst'], _AGENTS['product-owner']), ()),
+        ('development', "Feature Development",
+         "Implement feature across all platforms",
+         WorkflowStage.DEVELOPMENT, (_AGENTS['frontend-developer'], _AGENTS['backend-developer']),
+         ('planning',)),
+        ('testing', "Comprehensive Testing",
+         "Run all test suites in parallel",
+         WorkflowStage.TESTING,
+         (_AGENTS['automation-qa'], _AGENTS['security-tester'], _AGENTS['performance-tester']),
+         ('development',)),
+        ('ux_review', "UX/UI Review",
+         "Review design and user experience",
+         WorkflowStage.UX_REVIEW,
+         (_AGENTS['ux-designer'], _AGENTS['ui-designer'], _AGENTS['brand-guardian']),
+         ('development',)),
+        ('ba_validation', "Business Validation",
+         "Validate against requirements",
+         WorkflowStage.BA_VALIDATION, (_AGENTS['business-analyst'],), ('ux_review',)),
+        ('deployment', "Vercel Production Deployment",
+         "Deploy directly to production environment",
+         WorkflowStage.DEPLOYMENT, (_AGENTS['devops'], _AGENTS['infrastructure']),
+         ('testing', 'ba_validation')),
+        ('po_approval', "Product Owner Post-Deployment Approval",
+         "Final approval from Product Owner after production deployment",
+         WorkflowStage.PO_APPROVAL, (_AGENTS['product-owner'],), ('deployment',)),
+        ('post_deployment', "Post-Deployment Tasks",
+         "Monitoring, support materials, and analytics setup",
+         WorkflowStage.PRODUCTION,
+         (_AGENTS['monitoring'], _AGENTS['support'], _AGENTS['analytics'], _AGENTS['documentation']),
+         ('deployment',)),
+    )
+    
+    # Template-indexed CSR schedule; tasks are always created in template order
+    _SCHEDULE = _build_schedule(_TASK_TEMPLATES)
+    
+    def __init__(self, state_db_path: Optional[str] = None):
         self.tasks: Dict[str, WorkflowTask] = {}
-        self.active_workflows: Dict[str, List[WorkflowTask]] = {}
+        self.tasks_by_workflow: Dict[str, List[WorkflowTask]] = {}
+        self._status_counts: Dict[str, Counter] = {}
+        self._output: List[str] = []
         self.metrics = WorkflowMetrics()
+        self._http: Optional[aiohttp.ClientSession] = None
+        self._agent_semaphore: Optional[asyncio.Semaphore] = None
+        # Task event log, opened on first write; see _get_state_writer and close
+        self._state_conn: Optional[sqlite3.Connection] = None
+        self._state_writer: Optional[ThreadPoolExecutor] = None
         self.parallel_executor = ProcessPoolExecutor(max_workers=100)
-        self.async_executor = ThreadPoolExecutor(max_workers=1000)
+        # Blocking work goes through asyncio.to_thread on the loop's default executor
         
         # Agent registry
         self.agents = {
@@ -112,6 +298,7 @@ class RCWorkflowOrchestrator:
             'support': 'SupportAgent',
             'analytics': 'AnalyticsAgent',
         }
+        self.agents = {_AGENTS.get(name, name): cls for name, cls in self.agents.items()}
         
         # Workflow configuration
         self.workflow_config = {
@@ -126,22 +313,31 @@ class RCWorkflowOrchestrator:
             },
             'auto_deploy': True,
             'require_po_approval': True,
-            'rollback_on_failure': True
+            'rollback_on_failure': True,
+            'simulate_agents': False,
+            'simulate_latency_s': 0.1,
+            'agent_endpoint': os.getenv('RC_AGENT_ENDPOINT'),
+            'max_concurrent_agents': 16,
+            'state_db_path': state_db_path or os.getenv('RC_WORKFLOW_STATE_DB', _DEFAULT_STATE_DB)
         }
         
-        self.start_time = time.time()
+        self.start_time_ns = time.monotonic_ns()
     
-    async def execute_complete_workflow(self, feature_request: Dict[str, Any]) -> Dict[str, Any]:
+    async def execute_complete_workflow(self, feature_request: Dict[str, Any],
+                                        resume_workflow_id: Optional[str] = None) -> Dict[str, Any]:
         """
         Execute the complete development workflow for a feature
+        
+        Pass resume_workflow_id to continue an earlier run: stages recorded as
+        completed in the task event log are replayed instead of re-executed.
         """
-        workflow_id = self._generate_workflow_id(feature_request)
-        print(f"🚀 Starting RC Workflow: {workflow_id}")
-        print(f"📋 Feature: {feature_request.get('name', 'Unknown')}")
+        workflow_id = resume_workflow_id or self._generate_workflow_id(feature_request)
+        self._emit(f"🚀 Starting RC Workflow: {workflow_id}")
+        self._emit(f"📋 Feature: {feature_request.get('name', 'Unknown')}")
         
         # Create workflow tasks
         tasks = self._create_workflow_tasks(feature_request, workflow_id)
-        self.active_workflows[workflow_id] = tasks
+        workflow_token = _current_workflow.set(workflow_id)
         
         # Execute workflow stages
         results = {
@@ -153,535 +349,758 @@ class RCWorkflowOrchestrator:
         }
         
         try:
-            # Stage 1: Planning
-            print("\n📝 Stage 1: Planning")
-            planning_results = await self._execute_planning_stage(tasks, feature_request)
-            results['stages']['planning'] = planning_results
-            
-            # Stage 2: Parallel Development
-            print("\n👨‍💻 Stage 2: Development (Parallel Execution)")
-            dev_results = await self._execute_development_stage(tasks, planning_results)
-            results['stages']['development'] = dev_results
-            
-            # Stage 3: Automated Testing (Parallel)
-            print("\n🧪 Stage 3: Automated Testing (1000 Parallel Tests)")
-            test_results = await self._execute_testing_stage(tasks, dev_results)
-            results['stages']['testing'] = test_results
-            
-            # Stage 4: UX/UI Review
-            print("\n🎨 Stage 4: UX/UI Review")
-            ux_results = await self._execute_ux_review_stage(tasks, test_results)
-            results['stages']['ux_review'] = ux_results
-            
-            # Stage 5: Business Analysis Validation
-            print("\n📊 Stage 5: Business Analysis Validation")
-            ba_results = await self._execute_ba_validation_stage(tasks, ux_results)
-            results['stages']['ba_validation'] = ba_results
-            
-            # Stage 6: Deployment to Vercel Production
-            print("\n🚀 Stage 6: Deployment to Vercel Production")
-            deploy_results = await self._execute_deployment_stage(tasks, ba_results)
-            results['stages']['deployment'] = deploy_results
-            
-            # Stage 7: Product Owner Approval
-            print("\n✅ Stage 7: Product Owner Approval")
-            po_results = await self._execute_po_approval_stage(tasks, deploy_results)
-            results['stages']['po_approval'] = po_results
+            # Run the stage DAG; independent stages execute concurrently
+            stages = await self._execute_dag(
+                workflow_id, tasks, self._stage_runners(feature_request, tasks), results['stages']
+            )
+            deploy_results = stages['deployment']
             
             # Since we deploy directly to production, no separate production release needed
-            if po_results['approved']:
-                print("\n🎉 Feature Approved and Live in Production!")
+            if stages['po_approval']['approved']:
+                self._emit("\n🎉 Feature Approved and Live in Production!")
                 results['status'] = 'completed'
                 results['production_url'] = deploy_results.get('deployment', {}).get('url', '')
-                
-                # Setup post-deployment monitoring and support
-                post_deploy = await self._execute_post_deployment_tasks(tasks, deploy_results)
-                results['stages']['post_deployment'] = post_deploy
             else:
                 results['status'] = 'rejected'
-                print("\n❌ Feature rejected by Product Owner")
+                self._emit("\n❌ Feature rejected by Product Owner")
                 
                 # Rollback production deployment if rejected
                 if self.workflow_config['rollback_on_failure']:
-                    print("\n🔄 Rolling back production deployment...")
+                    self._emit("\n🔄 Rolling back production deployment...")
                     await self._rollback_production_deployment(deploy_results)
             
         except Exception as e:
-            print(f"\n❌ Workflow failed: {str(e)}")
+            self._emit(f"\n❌ Workflow failed: {str(e)}")
             results['status'] = 'failed'
             results['error'] = str(e)
             
             # Rollback if needed
             if self.workflow_config['rollback_on_failure']:
                 await self._rollback_changes(workflow_id)
+        finally:
+            # Don't leak this workflow's id into whatever the caller runs next
+            _current_workflow.reset(workflow_token)
         
         # Calculate final metrics
         results['metrics'] = self._calculate_workflow_metrics(workflow_id)
+        durations = [stage['duration_ms'] for stage in results['stages'].values()]
+        if durations:
+            results['metrics']['average_completion_time'] = sum(durations) / len(durations) / 1000
         
         # Generate report
         await self._generate_workflow_report(results)
         
         return results
     
-    async def _execute_planning_stage(self, tasks: List[WorkflowTask], feature: Dict) -> Dict:
-        """Stage 1: Planning - BA and PO define requirements"""
-        stage_results = {
-            'start_time': datetime.now().isoformat(),
-            'tasks': []
-        }
-        
-        # Business Analyst creates detailed requirements
-        ba_task = asyncio.create_task(
-            self._execute_agent_task('business-analyst', {
-                'action': 'create_requirements',
-                'feature': feature,
-                'output': 'user_stories'
-            })
+    def _emit(self, line: str):
+        """Queue a progress line; lines are written in batches by _flush_output"""
+        self._output.append(line)
+    
+    def _flush_output(self):
+        """Write all queued progress lines to stdout in a single call"""
+        if self._output:
+            sys.stdout.write("\n".join(self._output) + "\n")
+            self._output.clear()
+    
+    def _set_task_status(self, task: WorkflowTask, status: TaskStatus,
+                         output: Optional[Dict] = None, record: bool = True):
+        """Single write path for task status, keeping counts and the event log current"""
+        counts = self._status_counts[task.workflow_id]
+        counts[task.status] -= 1
+        counts[status] += 1
+        task.status = status
+        
+        if record:
+            payload = None
+            if output is not None:
+                try:
+                    payload = orjson.dumps(output, option=orjson.OPT_NON_STR_KEYS, default=str)
+                except TypeError:
+                    pass  # not serialisable (e.g. self-referencing); stage re-runs on resume
+            self._get_state_writer().submit(self._insert_task_event, (
+                task.workflow_id, task.id, time.time_ns(), status.value, payload
+            ))
+    
+    def _init_state_store(self):
+        """Open the append-only task event log (SQLite in WAL mode)"""
+        self._state_conn = sqlite3.connect(
+            self.workflow_config['state_db_path'], isolation_level=None, check_same_thread=False
         )
-        
-        # Product Owner defines acceptance criteria
-        po_task = asyncio.create_task(
-            self._execute_agent_task('product-owner', {
-                'action': 'define_acceptance_criteria',
-                'feature': feature,
-                'output': 'acceptance_criteria'
-            })
+        self._state_conn.execute('PRAGMA journal_mode=WAL')
+        self._state_conn.execute('''
+            CREATE TABLE IF NOT EXISTS task_events (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                workflow_id TEXT NOT NULL,
+                task_id TEXT NOT NULL,
+                ts_ns INTEGER NOT NULL,
+                status TEXT NOT NULL,
+                payload_json BLOB
+            )
+        ''')
+        self._state_conn.execute(
+            'CREATE INDEX IF NOT EXISTS idx_task_events_workflow ON task_events (workflow_id)'
         )
-        
-        # Sprint planning
-        sprint_task = asyncio.create_task(
-            self._execute_agent_task('scrum-master', {
-                'action': 'plan_sprint',
-                'feature': feature,
-                'output': 'sprint_plan'
-            })
+        # One writer thread keeps events ordered and fsyncs off the event loop
+        self._state_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rc-state")
+    
+    def _get_state_writer(self) -> ThreadPoolExecutor:
+        """The event log's writer thread, opening the log on first use"""
+        if self._state_writer is None:
+            self._init_state_store()
+        return self._state_writer
+    
+    def _insert_task_event(self, event: Tuple):
+        """Append one status transition to the event log (runs on the writer thread)"""
+        self._state_conn.execute(
+            'INSERT INTO task_events (workflow_id, task_id, ts_ns, status, payload_json) '
+            'VALUES (?, ?, ?, ?, ?)',
+            event
         )
-        
-        # Execute planning tasks in parallel
-        results = await asyncio.gather(ba_task, po_task, sprint_task)
-        
-        stage_results['user_stories'] = results[0]
-        stage_results['acceptance_criteria'] = results[1]
-        stage_results['sprint_plan'] = results[2]
-        stage_results['end_time'] = datetime.now().isoformat()
-        
-        return stage_results
     
-    async def _execute_development_stage(self, tasks: List[WorkflowTask], planning: Dict) -> Dict:
-        """Stage 2: Development - Parallel development across teams"""
-        stage_results = {
-            'start_time': datetime.now().isoformat(),
-            'components': []
+    def _load_completed_outputs(self, workflow_id: str) -> Dict[str, Dict]:
+        """Replay the event log: task_id -> output for tasks whose last event is a completion"""
+        completed: Dict[str, Dict] = {}
+        rows = self._state_conn.execute(
+            'SELECT task_id, status, payload_json FROM task_events '
+            'WHERE workflow_id = ? ORDER BY id',
+            (workflow_id,)
+        )
+        for task_id, status, payload in rows:
+            if status == TaskStatus.COMPLETED.value and payload is not None:
+                completed[task_id] = orjson.loads(payload)
+            else:
+                completed.pop(task_id, None)
+        return completed
+    
+    def _stage_runners(self, feature: Dict,
+                       tasks: List[WorkflowTask]) -> Dict[str, Callable[[Dict], Awaitable[Dict]]]:
+        """Map each task suffix to a coroutine factory fed with completed stage outputs"""
+        return {
+            'planning': lambda done: self._execute_planning_stage(feature),
+            'development': lambda done: self._execute_development_stage(done['planning']),
+            'testing': lambda done: self._execute_testing_stage(done['development']),
+            'ux_review': lambda done: self._execute_ux_review_stage(done['development']),
+            'ba_validation': lambda done: self._execute_ba_validation_stage(tasks, done['ux_review']),
+            'deployment': lambda done: self._execute_deployment_stage(done['ba_validation']),
+            'po_approval': lambda done: self._execute_po_approval_stage(tasks, done['deployment']),
+            'post_deployment': lambda done: self._execute_post_deployment_tasks(tasks, done['deployment']),
         }
+    
+    async def _execute_dag(self, workflow_id: str, tasks: List[WorkflowTask],
+                           runners: Dict[str, Callable[[Dict], Awaitable[Dict]]],
+                           outputs: Dict[str, Dict]) -> Dict[str, Dict]:
+        """
+        Kahn-style scheduler: every task whose predecessors have completed is
+        dispatched immediately, so independent stages overlap
+        """
+        prefix_len = len(workflow_id) + 1
+        indptr, successors, initial_in_degree = self._SCHEDULE
+        in_degree = list(initial_in_degree)
         
-        sprint_plan = planning.get('sprint_plan', {})
-        development_tasks = []
+        # Work avoidance: stages already completed in a previous run are replayed from the log
+        replayed = await asyncio.get_running_loop().run_in_executor(
+            self._get_state_writer(), self._load_completed_outputs, workflow_id
+        )
+        for i, task in enumerate(tasks):
+            if task.id in replayed:
+                outputs[task.id[prefix_len:]] = replayed[task.id]
+                self._set_task_status(task, TaskStatus.COMPLETED, record=False)
+                for succ in successors[indptr[i]:indptr[i + 1]]:
+                    in_degree[succ] -= 1
         
-        # Frontend Development
-        if 'frontend' in sprint_plan:
-            development_tasks.append(
-                self._execute_agent_task('frontend-developer', {
-                    'action': 'implement_feature',
-                    'requirements': planning['user_stories'],
-                    'acceptance_criteria': planning['acceptance_criteria'],
-                    'component': 'frontend'
+        ready = [i for i, task in enumerate(tasks)
+                 if in_degree[i] == 0 and task.id not in replayed]
+        running: Dict[asyncio.Task, int] = {}
+        
+        try:
+            while ready or running:
+                for i in ready:
+                    task = tasks[i]
+                    name = task.id[prefix_len:]
+                    self._emit(f"\n{self.STAGE_LABELS.get(name, name)}")
+                    self._set_task_status(task, TaskStatus.IN_PROGRESS)
+                    running[asyncio.create_task(runners[name](outputs))] = i
+                ready = []
+                
+                self._flush_output()
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for finished in done:
+                    i = running.pop(finished)
+                    task = tasks[i]
+                    try:
+                        output = finished.result()
+                    except Exception:
+                        self._set_task_status(task, TaskStatus.REJECTED)
+                        raise
+                    outputs[task.id[prefix_len:]] = output
+                    self._set_task_status(task, TaskStatus.COMPLETED, output)
+                    task.updated_at = datetime.now()
+                    
+                    for succ in successors[indptr[i]:indptr[i + 1]]:
+                        in_degree[succ] -= 1
+                        if in_degree[succ] == 0:
+                            ready.append(succ)
+        finally:
+            # Settle every stage still in flight, so their exceptions are retrieved
+            # and their cancellation cleanup finishes before the workflow returns
+            for pending in running:
+                pending.cancel()
+            settled = await asyncio.gather(*running, return_exceptions=True)
+            for i, result in zip(running.values(), settled):
+                status = TaskStatus.REJECTED if isinstance(result, Exception) else TaskStatus.PENDING
+                self._set_task_status(tasks[i], status)
+        
+        return outputs
+    
+    @asynccontextmanager
+    async def _timed_stage(self, name: str, **initial: Any):
+        """Yield a stage result dict and record its start and duration on exit"""
+        start_ns = time.perf_counter_ns()
+        stage = {'name': name, 'start_ns': start_ns, **initial}
+        try:
+            yield stage
+        finally:
+            stage['duration_ms'] = (time.perf_counter_ns() - start_ns) / 1e6
+    
+    async def _execute_planning_stage(self, feature: Dict) -> Dict:
+        """Stage 1: Planning - BA and PO define requirements"""
+        async with self._timed_stage('planning', tasks=[]) as stage_results:
+            # Business Analyst creates detailed requirements
+            ba_task = asyncio.create_task(
+                self._execute_agent_task('business-analyst', {
+                    'action': 'create_requirements',
+                    'feature': feature,
+                    'output': 'user_stories'
                 })
             )
-        
-        # Backend Development
-        if 'backend' in sprint_plan:
-            development_tasks.append(
-                self._execute_agent_task('backend-developer', {
-                    'action': 'implement_api',
-                    'requirements': planning['user_stories'],
-                    'component': 'backend'
+            
+            # Product Owner defines acceptance criteria
+            po_task = asyncio.create_task(
+                self._execute_agent_task('product-owner', {
+                    'action': 'define_acceptance_criteria',
+                    'feature': feature,
+                    'output': 'acceptance_criteria'
                 })
             )
-        
-        # Mobile Development
-        if 'mobile' in sprint_plan:
-            development_tasks.append(
-                self._execute_agent_task('mobile-developer', {
-                    'action': 'implement_mobile',
-                    'requirements': planning['user_stories'],
-                    'component': 'mobile'
+            
+            # Sprint planning
+            sprint_task = asyncio.create_task(
+                self._execute_agent_task('scrum-master', {
+                    'action': 'plan_sprint',
+                    'feature': feature,
+                    'output': 'sprint_plan'
                 })
             )
-        
-        # AI/ML Features
-        if 'ai_features' in sprint_plan:
-            development_tasks.append(
-                self._execute_agent_task('ai-engineer', {
-                    'action': 'implement_ai_features',
-                    'requirements': planning['user_stories'],
-                    'component': 'ai'
+            
+            # Execute planning tasks in parallel
+            results = await asyncio.gather(ba_task, po_task, sprint_task)
+            
+            stage_results['user_stories'] = results[0]
+            stage_results['acceptance_criteria'] = results[1]
+            stage_results['sprint_plan'] = results[2]
+            
+            return stage_results
+    
+    async def _execute_development_stage(self, planning: Dict) -> Dict:
+        """Stage 2: Development - Parallel development across teams"""
+        async with self._timed_stage('development', components=[]) as stage_results:
+            sprint_plan = planning.get('sprint_plan', {})
+            development_tasks = []
+            
+            # Frontend Development
+            if 'frontend' in sprint_plan:
+                development_tasks.append(
+                    self._execute_agent_task('frontend-developer', {
+                        'action': 'implement_feature',
+                        'requirements': planning['user_stories'],
+                        'acceptance_criteria': planning['acceptance_criteria'],
+                        'component': 'frontend'
+                    })
+                )
+            
+            # Backend Development
+            if 'backend' in sprint_plan:
+                development_tasks.append(
+                    self._execute_agent_task('backend-developer', {
+                        'action': 'implement_api',
+                        'requirements': planning['user_stories'],
+                        'component': 'backend'
+                    })
+                )
+            
+            # Mobile Development
+            if 'mobile' in sprint_plan:
+                development_tasks.append(
+                    self._execute_agent_task('mobile-developer', {
+                        'action': 'implement_mobile',
+                        'requirements': planning['user_stories'],
+                        'component': 'mobile'
+                    })
+                )
+            
+            # AI/ML Features
+            if 'ai_features' in sprint_plan:
+                development_tasks.append(
+                    self._execute_agent_task('ai-engineer', {
+                        'action': 'implement_ai_features',
+                        'requirements': planning['user_stories'],
+                        'component': 'ai'
+                    })
+                )
+            
+            # Execute all development tasks in parallel
+            if development_tasks:
+                dev_results = await asyncio.gather(*development_tasks)
+                stage_results['components'] = dev_results
+            
+            # Generate documentation in parallel
+            doc_task = asyncio.create_task(
+                self._execute_agent_task('documentation', {
+                    'action': 'generate_docs',
+                    'components': stage_results['components']
                 })
             )
-        
-        # Execute all development tasks in parallel
-        if development_tasks:
-            dev_results = await asyncio.gather(*development_tasks)
-            stage_results['components'] = dev_results
-        
-        # Generate documentation in parallel
-        doc_task = asyncio.create_task(
-            self._execute_agent_task('documentation', {
-                'action': 'generate_docs',
-                'components': stage_results['components']
-            })
-        )
-        
-        stage_results['documentation'] = await doc_task
-        stage_results['end_time'] = datetime.now().isoformat()
-        
-        return stage_results
+            
+            stage_results['documentation'] = await doc_task
+            
+            return stage_results
     
-    async def _execute_testing_stage(self, tasks: List[WorkflowTask], dev_results: Dict) -> Dict:
+    async def _execute_testing_stage(self, dev_results: Dict) -> Dict:
         """Stage 3: Automated Testing - Comprehensive parallel testing"""
-        stage_results = {
-            'start_time': datetime.now().isoformat(),
-            'test_suites': []
-        }
-        
-        # Automation QA Agent - Main testing orchestrator
-        qa_task = asyncio.create_task(
-            self._execute_agent_task('automation-qa', {
-                'action': 'run_comprehensive_tests',
-                'components': dev_results['components'],
-                'config': {
-                    'parallel_workers': 1000,
-                    'test_types': [
-                        'unit', 'integration', 'e2e', 'visual',
-                        'behavioral', 'edge_case', 'performance',
-                        'accessibility', 'security', 'cross_browser'
-                    ],
-                    'coverage_threshold': self.workflow_config['test_coverage_threshold'],
-                    'visual_threshold': self.workflow_config['visual_regression_threshold'],
-                    'retry_flaky': True
-                }
-            })
-        )
-        
-        # Security Testing in parallel
-        security_task = asyncio.create_task(
-            self._execute_agent_task('security-tester', {
-                'action': 'run_security_scan',
-                'components': dev_results['components']
-            })
-        )
-        
-        # Performance Testing in parallel
-        performance_task = asyncio.create_task(
-            self._execute_agent_task('performance-tester', {
-                'action': 'run_performance_tests',
-                'components': dev_results['components'],
-                'budget': self.workflow_config['performance_budget']
-            })
-        )
-        
-        # Execute all test suites in parallel
-        test_results = await asyncio.gather(qa_task, security_task, performance_task)
-        
-        stage_results['automation_qa'] = test_results[0]
-        stage_results['security'] = test_results[1]
-        stage_results['performance'] = test_results[2]
-        
-        # Analyze test results
-        stage_results['summary'] = self._analyze_test_results(stage_results)
-        stage_results['passed'] = stage_results['summary']['pass_rate'] >= 95
-        stage_results['end_time'] = datetime.now().isoformat()
-        
-        # If tests fail, trigger fixes
-        if not stage_results['passed']:
-            print("  ⚠️ Tests failed, triggering automatic fixes...")
-            fix_results = await self._trigger_test_fixes(stage_results)
-            stage_results['fixes'] = fix_results
+        async with self._timed_stage('testing', test_suites=[]) as stage_results:
+            # Automation QA Agent - Main testing orchestrator
+            qa_task = asyncio.create_task(
+                self._execute_agent_task('automation-qa', {
+                    'action': 'run_comprehensive_tests',
+                    'components': dev_results['components'],
+                    'config': {
+                        'parallel_workers': 1000,
+                        'test_types': [
+                            'unit', 'integration', 'e2e', 'visual',
+                            'behavioral', 'edge_case', 'performance',
+                            'accessibility', 'security', 'cross_browser'
+                        ],
+                        'coverage_threshold': self.workflow_config['test_coverage_threshold'],
+                        'visual_threshold': self.workflow_config['visual_regression_threshold'],
+                        'retry_flaky': True
+                    }
+                })
+            )
             
-            # Re-run tests after fixes
-            print("  🔄 Re-running tests after fixes...")
-            retest_results = await self._execute_agent_task('automation-qa', {
-                'action': 'rerun_failed_tests',
-                'previous_results': stage_results
-            })
-            stage_results['retest'] = retest_results
-        
-        return stage_results
+            # Security Testing in parallel
+            security_task = asyncio.create_task(
+                self._execute_agent_task('security-tester', {
+                    'action': 'run_security_scan',
+                    'components': dev_results['components']
+                })
+            )
+            
+            # Performance Testing in parallel
+            performance_task = asyncio.create_task(
+                self._execute_agent_task('performance-tester', {
+                    'action': 'run_performance_tests',
+                    'components': dev_results['components'],
+                    'budget': self.workflow_config['performance_budget']
+                })
+            )
+            
+            # Execute all test suites in parallel
+            test_results = await asyncio.gather(qa_task, security_task, performance_task)
+            
+            stage_results['automation_qa'] = test_results[0]
+            stage_results['security'] = test_results[1]
+            stage_results['performance'] = test_results[2]
+            
+            # Analyze test results
+            stage_results['summary'] = self._analyze_test_results(stage_results)
+            stage_results['passed'] = stage_results['summary']['pass_rate'] >= 95
+            
+            # If tests fail, trigger fixes
+            if not stage_results['passed']:
+                self._emit("  ⚠️ Tests failed, triggering automatic fixes...")
+                fix_results = await self._trigger_test_fixes(stage_results)
+                stage_results['fixes'] = fix_results
+                
+                # Re-run tests after fixes
+                self._emit("  🔄 Re-running tests after fixes...")
+                retest_results = await self._execute_agent_task('automation-qa', {
+                    'action': 'rerun_failed_tests',
+                    'previous_results': stage_results
+                })
+                stage_results['retest'] = retest_results
+            
+            return stage_results
     
-    async def _execute_ux_review_stage(self, tasks: List[WorkflowTask], test_results: Dict) -> Dict:
-        """Stage 4: UX/UI Review - Design validation"""
-        stage_results = {
-            'start_time': datetime.now().isoformat(),
-            'reviews': []
-        }
-        
-        # UX Designer Review
-        ux_task = asyncio.create_task(
-            self._execute_agent_task('ux-designer', {
-                'action': 'review_user_experience',
-                'test_results': test_results,
-                'screenshots': test_results.get('automation_qa', {}).get('screenshots', [])
-            })
-        )
-        
-        # UI Designer Review
-        ui_task = asyncio.create_task(
-            self._execute_agent_task('ui-designer', {
-                'action': 'review_visual_design',
-                'visual_tests': test_results.get('automation_qa', {}).get('visual_results', {}),
-                'check_high_fidelity': True
-            })
-        )
-        
-        # Brand Guardian Review
-        brand_task = asyncio.create_task(
-            self._execute_agent_task('brand-guardian', {
-                'action': 'validate_brand_consistency',
-                'components': test_results
-            })
-        )
-        
-        # Execute reviews in parallel
-        review_results = await asyncio.gather(ux_task, ui_task, brand_task)
-        
-        stage_results['ux_review'] = review_results[0]
-        stage_results['ui_review'] = review_results[1]
-        stage_results['brand_review'] = review_results[2]
-        
-        # Consolidate feedback
-        stage_results['approved'] = all([
-            review_results[0].get('approved', False),
-            review_results[1].get('approved', False),
-            review_results[2].get('approved', False)
-        ])
-        
-        stage_results['feedback'] = self._consolidate_design_feedback(review_results)
-        stage_results['end_time'] = datetime.now().isoformat()
-        
-        # If design changes needed
-        if not stage_results['approved']:
-            print("  🎨 Design improvements needed...")
-            improvements = await self._implement_design_improvements(stage_results['feedback'])
-            stage_results['improvements'] = improvements
-        
-        return stage_results
+    async def _execute_ux_review_stage(self, dev_results: Dict) -> Dict:
+        """Stage 4: UX/UI Review - Design validation of the developed components"""
+        async with self._timed_stage('ux_review', reviews=[]) as stage_results:
+            components = dev_results.get('components', [])
+            
+            # UX Designer Review
+            ux_task = asyncio.create_task(
+                self._execute_agent_task('ux-designer', {
+                    'action': 'review_user_experience',
+                    'components': components,
+                    'documentation': dev_results.get('documentation', {})
+                })
+            )
+            
+            # UI Designer Review
+            ui_task = asyncio.create_task(
+                self._execute_agent_task('ui-designer', {
+                    'action': 'review_visual_design',
+                    'components': components,
+                    'check_high_fidelity': True
+                })
+            )
+            
+            # Brand Guardian Review
+            brand_task = asyncio.create_task(
+                self._execute_agent_task('brand-guardian', {
+                    'action': 'validate_brand_consistency',
+                    'components': components
+                })
+            )
+            
+            # Execute reviews in parallel
+            review_results = await asyncio.gather(ux_task, ui_task, brand_task)
+            
+            stage_results['ux_review'] = review_results[0]
+            stage_results['ui_review'] = review_results[1]
+            stage_results['brand_review'] = review_results[2]
+            
+            # Consolidate feedback
+            stage_results['approved'] = all([
+                review_results[0].get('approved', False),
+                review_results[1].get('approved', False),
+                review_results[2].get('approved', False)
+            ])
+            
+            stage_results['feedback'] = self._consolidate_design_feedback(review_results)
+            
+            # If design changes needed
+            if not stage_results['approved']:
+                self._emit("  🎨 Design improvements needed...")
+                improvements = await self._implement_design_improvements(stage_results['feedback'])
+                stage_results['improvements'] = improvements
+            
+            return stage_results
     
     async def _execute_ba_validation_stage(self, tasks: List[WorkflowTask], ux_results: Dict) -> Dict:
         """Stage 5: Business Analysis Validation"""
-        stage_results = {
-            'start_time': datetime.now().isoformat(),
-            'validations': []
-        }
-        
-        # Business Analyst validates requirements
-        ba_validation = await self._execute_agent_task('business-analyst', {
-            'action': 'validate_implementation',
-            'original_requirements': tasks[0].artifacts.get('requirements', {}),
-            'implementation_results': ux_results,
-            'acceptance_criteria': tasks[0].artifacts.get('acceptance_criteria', {})
-        })
-        
-        stage_results['ba_validation'] = ba_validation
-        stage_results['requirements_met'] = ba_validation.get('all_requirements_met', False)
-        stage_results['gaps'] = ba_validation.get('gaps', [])
-        stage_results['approved'] = stage_results['requirements_met']
-        stage_results['end_time'] = datetime.now().isoformat()
-        
-        return stage_results
+        async with self._timed_stage('ba_validation', validations=[]) as stage_results:
+            # Business Analyst validates requirements
+            ba_validation = await self._execute_agent_task('business-analyst', {
+                'action': 'validate_implementation',
+                'original_requirements': tasks[0].artifacts.requirements,
+                'implementation_results': ux_results,
+                'acceptance_criteria': tasks[0].artifacts.acceptance_criteria
+            })
+            
+            stage_results['ba_validation'] = ba_validation
+            stage_results['requirements_met'] = ba_validation.get('all_requirements_met', False)
+            stage_results['gaps'] = ba_validation.get('gaps', [])
+            stage_results['approved'] = stage_results['requirements_met']
+            
+            return stage_results
     
-    async def _execute_deployment_stage(self, tasks: List[WorkflowTask], ba_results: Dict) -> Dict:
+    async def _execute_deployment_stage(self, ba_results: Dict) -> Dict:
         """Stage 6: Deployment to Vercel Production"""
-        stage_results = {
-            'start_time': datetime.now().isoformat(),
-            'deployment': {}
-        }
-        
-        if not ba_results['approved']:
-            stage_results['status'] = 'skipped'
-            stage_results['reason'] = 'BA validation failed'
-            return stage_results
-        
-        # DevOps prepares deployment
-        deployment_prep = await self._execute_agent_task('devops', {
-            'action': 'prepare_deployment',
-            'environment': 'production',
-            'auto_deploy': self.workflow_config['auto_deploy']
-        })
-        
-        # Deploy directly to Vercel production
-        print("  🚀 Deploying to Vercel Production...")
-        deploy_command = "vercel --prod --yes"
-        
-        try:
-            process = await asyncio.create_subprocess_shell(
-                deploy_command,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd="/Users/MAC/Documents/projects/roulette-community"
-            )
-            stdout, stderr = await process.communicate()
+        async with self._timed_stage('deployment', deployment={}) as stage_results:
+            if not ba_results['approved']:
+                stage_results['status'] = 'skipped'
+                stage_results['reason'] = 'BA validation failed'
+                return stage_results
             
-            if process.returncode == 0:
-                stage_results['deployment']['status'] = 'success'
-                stage_results['deployment']['url'] = self._extract_vercel_url(stdout.decode())
-                stage_results['deployment']['logs'] = stdout.decode()
-                
-                # Run smoke tests on deployed version
-                smoke_tests = await self._execute_agent_task('automation-qa', {
-                    'action': 'run_smoke_tests',
-                    'url': stage_results['deployment']['url']
-                })
-                stage_results['smoke_tests'] = smoke_tests
+            # DevOps prepares deployment
+            deployment_prep = await self._execute_agent_task('devops', {
+                'action': 'prepare_deployment',
+                'environment': 'production',
+                'auto_deploy': self.workflow_config['auto_deploy']
+            })
+            
+            # Deploy directly to Vercel production
+            self._emit("  🚀 Deploying to Vercel Production...")
+            deploy_command = "vercel --prod --yes"
+            smoke_task: Optional[asyncio.Task] = None
+            
+            try:
+                process = await asyncio.create_subprocess_shell(
+                    deploy_command,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    cwd="/Users/MAC/Documents/projects/roulette-community"
+                )
+                stderr_task = asyncio.create_task(process.stderr.read())
+                log_lines: List[str] = []
                 
-                # Setup monitoring
-                monitoring = await self._execute_agent_task('monitoring', {
-                    'action': 'setup_monitoring',
-                    'deployment': stage_results['deployment']
-                })
-                stage_results['monitoring'] = monitoring
+                # Kick off smoke tests as soon as the URL shows up in the log
+                url = await self._tail_until_url(process.stdout, log_lines)
+                if url:
+                    smoke_task = asyncio.create_task(self._execute_agent_task('automation-qa', {
+                        'action': 'run_smoke_tests',
+                        'url': url
+                    }))
                 
-            else:
-                stage_results['deployment']['status'] = 'failed'
-                stage_results['deployment']['error'] = stderr.decode()
+                # Drain the trailing deploy log while the smoke tests run
+                async for raw in process.stdout:
+                    log_lines.append(raw.decode(errors='replace'))
+                stderr = await stderr_task
+                await process.wait()
                 
-        except Exception as e:
-            stage_results['deployment']['status'] = 'error'
-            stage_results['deployment']['error'] = str(e)
-        
-        stage_results['end_time'] = datetime.now().isoformat()
-        return stage_results
+                if process.returncode == 0:
+                    logs = ''.join(log_lines)
+                    stage_results['deployment']['status'] = 'success'
+                    stage_results['deployment']['url'] = url or self._extract_vercel_url(logs)
+                    stage_results['deployment']['logs'] = logs
+                    
+                    if smoke_task is None:
+                        smoke_task = asyncio.create_task(self._execute_agent_task('automation-qa', {
+                            'action': 'run_smoke_tests',
+                            'url': stage_results['deployment']['url']
+                        }))
+                    
+                    # Setup monitoring
+                    monitoring = await self._execute_agent_task('monitoring', {
+                        'action': 'setup_monitoring',
+                        'deployment': stage_results['deployment']
+                    })
+                    stage_results['smoke_tests'] = await smoke_task
+                    stage_results['monitoring'] = monitoring
+                    
+                else:
+                    stage_results['deployment']['status'] = 'failed'
+                    stage_results['deployment']['error'] = stderr.decode()
+                    
+            except Exception as e:
+                stage_results['deployment']['status'] = 'error'
+                stage_results['deployment']['error'] = str(e)
+            
+            if smoke_task is not None and not smoke_task.done():
+                smoke_task.cancel()
+            
+            return stage_results
+    
+    async def _tail_until_url(self, stream: asyncio.StreamReader, log_lines: List[str]) -> Optional[str]:
+        """Read deploy output line by line until the first Vercel URL appears"""
+        async for raw in stream:
+            line = raw.decode(errors='replace')
+            log_lines.append(line)
+            match = _VERCEL_URL_RE.search(line)
+            if match:
+                return match.group(0)
+        return None
     
     async def _execute_po_approval_stage(self, tasks: List[WorkflowTask], deploy_results: Dict) -> Dict:
         """Stage 7: Product Owner Approval"""
-        stage_results = {
-            'start_time': datetime.now().isoformat(),
-            'review': {}
-        }
-        
-        if deploy_results.get('deployment', {}).get('status') != 'success':
-            stage_results['approved'] = False
-            stage_results['reason'] = 'Deployment failed'
+        async with self._timed_stage('po_approval', review={}) as stage_results:
+            if deploy_results.get('deployment', {}).get('status') != 'success':
+                stage_results['approved'] = False
+                stage_results['reason'] = 'Deployment failed'
+                return stage_results
+            
+            # Product Owner reviews deployed feature
+            po_review = await self._execute_agent_task('product-owner', {
+                'action': 'review_deployed_feature',
+                'deployment_url': deploy_results['deployment']['url'],
+                'test_results': tasks[0].test_results,
+                'acceptance_criteria': tasks[0].artifacts.acceptance_criteria,
+                'business_metrics': await self._calculate_business_metrics(deploy_results)
+            })
+            
+            stage_results['review'] = po_review
+            stage_results['approved'] = po_review.get('approved', False)
+            stage_results['feedback'] = po_review.get('feedback', [])
+            
+            # Log decision
+            if stage_results['approved']:
+                self._emit("  ✅ Product Owner approved the feature!")
+            else:
+                self._emit(f"  ❌ Product Owner rejected: {po_review.get('rejection_reason', 'Unknown')}")
+            
             return stage_results
-        
-        # Product Owner reviews deployed feature
-        po_review = await self._execute_agent_task('product-owner', {
-            'action': 'review_deployed_feature',
-            'deployment_url': deploy_results['deployment']['url'],
-            'test_results': tasks[0].test_results,
-            'acceptance_criteria': tasks[0].artifacts.get('acceptance_criteria', {}),
-            'business_metrics': await self._calculate_business_metrics(deploy_results)
-        })
-        
-        stage_results['review'] = po_review
-        stage_results['approved'] = po_review.get('approved', False)
-        stage_results['feedback'] = po_review.get('feedback', [])
-        stage_results['end_time'] = datetime.now().isoformat()
-        
-        # Log decision
-        if stage_results['approved']:
-            print("  ✅ Product Owner approved the feature!")
-        else:
-            print(f"  ❌ Product Owner rejected: {po_review.get('rejection_reason', 'Unknown')}")
-        
-        return stage_results
     
     async def _execute_post_deployment_tasks(self, tasks: List[WorkflowTask], deploy_results: Dict) -> Dict:
         """Execute post-deployment tasks for production"""
-        stage_results = {
-            'start_time': datetime.now().isoformat(),
-            'tasks': []
-        }
-        
-        # Run production smoke tests
-        print("  🔍 Running production smoke tests...")
-        prod_tests = await self._execute_agent_task('automation-qa', {
-            'action': 'run_production_tests',
-            'url': deploy_results.get('deployment', {}).get('url', ''),
-            'critical_paths_only': True
-        })
-        stage_results['production_tests'] = prod_tests
-        
-        # Setup production monitoring
-        print("  📊 Setting up production monitoring...")
-        monitoring = await self._execute_agent_task('monitoring', {
-            'action': 'setup_production_monitoring',
-            'deployment': deploy_results.get('deployment', {}),
-            'alerts': True,
-            'metrics': ['performance', 'errors', 'usage']
-        })
-        stage_results['monitoring'] = monitoring
-        
-        # Update documentation
-        print("  📚 Updating documentation...")
-        docs = await self._execute_agent_task('documentation', {
-            'action': 'update_production_docs',
-            'deployment': deploy_results.get('deployment', {}),
-            'feature': tasks[0].artifacts.get('feature', {})
-        })
-        stage_results['documentation'] = docs
-        
-        # Prepare support materials
-        print("  🛟 Preparing support materials...")
-        support = await self._execute_agent_task('support', {
-            'action': 'prepare_support_materials',
-            'feature': tasks[0].artifacts.get('feature', {}),
-            'faqs': True,
-            'troubleshooting': True
-        })
-        stage_results['support'] = support
-        
-        # Analytics setup
-        print("  📈 Setting up analytics tracking...")
-        analytics = await self._execute_agent_task('analytics', {
-            'action': 'setup_feature_tracking',
-            'feature': tasks[0].artifacts.get('feature', {}),
-            'events': True,
-            'conversion_tracking': True
-        })
-        stage_results['analytics'] = analytics
-        
-        stage_results['end_time'] = datetime.now().isoformat()
-        return stage_results
+        async with self._timed_stage('post_deployment', tasks=[]) as stage_results:
+            if deploy_results.get('deployment', {}).get('status') != 'success':
+                stage_results['status'] = 'skipped'
+                stage_results['reason'] = 'Deployment failed'
+                return stage_results
+            
+            # Run production smoke tests
+            self._emit("  🔍 Running production smoke tests...")
+            prod_tests = await self._execute_agent_task('automation-qa', {
+                'action': 'run_production_tests',
+                'url': deploy_results.get('deployment', {}).get('url', ''),
+                'critical_paths_only': True
+            })
+            stage_results['production_tests'] = prod_tests
+            
+            # Setup production monitoring
+            self._emit("  📊 Setting up production monitoring...")
+            monitoring = await self._execute_agent_task('monitoring', {
+                'action': 'setup_production_monitoring',
+                'deployment': deploy_results.get('deployment', {}),
+                'alerts': True,
+                'metrics': ['performance', 'errors', 'usage']
+            })
+            stage_results['monitoring'] = monitoring
+            
+            # Update documentation
+            self._emit("  📚 Updating documentation...")
+            docs = await self._execute_agent_task('documentation', {
+                'action': 'update_production_docs',
+                'deployment': deploy_results.get('deployment', {}),
+                'feature': tasks[0].artifacts.feature
+            })
+            stage_results['documentation'] = docs
+            
+            # Prepare support materials
+            self._emit("  🛟 Preparing support materials...")
+            support = await self._execute_agent_task('support', {
+                'action': 'prepare_support_materials',
+                'feature': tasks[0].artifacts.feature,
+                'faqs': True,
+                'troubleshooting': True
+            })
+            stage_results['support'] = support
+            
+            # Analytics setup
+            self._emit("  📈 Setting up analytics tracking...")
+            analytics = await self._execute_agent_task('analytics', {
+                'action': 'setup_feature_tracking',
+                'feature': tasks[0].artifacts.feature,
+                'events': True,
+                'conversion_tracking': True
+            })
+            stage_results['analytics'] = analytics
+            
+            return stage_results
     
     async def _rollback_production_deployment(self, deploy_results: Dict) -> Dict:
         """Rollback production deployment"""
-        rollback_results = {
-            'start_time': datetime.now().isoformat(),
-            'status': 'rolling_back'
-        }
-        
-        try:
-            # Revert to previous production deployment
-            print("  ⏮️ Reverting to previous production version...")
-            rollback_command = "vercel rollback --yes"
-            
-            process = await asyncio.create_subprocess_shell(
-                rollback_command,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd="/Users/MAC/Documents/projects/roulette-community"
-            )
-            stdout, stderr = await process.communicate()
+        async with self._timed_stage('rollback', status='rolling_back') as rollback_results:
+            token = os.getenv('VERCEL_TOKEN')
+            project_id = os.getenv('VERCEL_PROJECT_ID')
             
-            if process.returncode == 0:
-                rollback_results['status'] = 'success'
-                rollback_results['message'] = 'Successfully rolled back to previous version'
-                print("  ✅ Rollback successful")
-            else:
-                rollback_results['status'] = 'failed'
-                rollback_results['error'] = stderr.decode()
-                print(f"  ❌ Rollback failed: {stderr.decode()}")
+            try:
+                # Revert to previous production deployment
+                self._emit("  ⏮️ Reverting to previous production version...")
+                if token and project_id:
+                    rollback_results.update(
+                        await self._rollback_via_api(token, project_id, deploy_results)
+                    )
+                else:
+                    rollback_results.update(await self._rollback_via_cli())
                 
-        except Exception as e:
-            rollback_results['status'] = 'error'
-            rollback_results['error'] = str(e)
-            print(f"  ❌ Rollback error: {str(e)}")
+                if rollback_results['status'] == 'success':
+                    self._emit("  ✅ Rollback successful")
+                else:
+                    self._emit(f"  ❌ Rollback failed: {rollback_results.get('error', 'Unknown')}")
+                    
+            except Exception as e:
+                rollback_results['status'] = 'error'
+                rollback_results['error'] = str(e)
+                self._emit(f"  ❌ Rollback error: {str(e)}")
+            
+            return rollback_results
+    
+    async def _rollback_via_api(self, token: str, project_id: str, deploy_results: Dict) -> Dict:
+        """Promote the previous production deployment through the Vercel REST API"""
+        http = await self._get_http()
+        headers = {'Authorization': f'Bearer {token}'}
+        team_params = {'teamId': os.environ['VERCEL_TEAM_ID']} if os.getenv('VERCEL_TEAM_ID') else {}
+        
+        params = {'projectId': project_id, 'target': 'production', 'state': 'READY', 'limit': '5'}
+        async with http.get(f"{VERCEL_API_URL}/v6/deployments", headers=headers,
+                            params={**params, **team_params}) as resp:
+            if resp.status != 200:
+                return {'status': 'failed', 'error': await resp.text()}
+            deployments = (await resp.json()).get('deployments', [])
+        
+        current_url = deploy_results.get('deployment', {}).get('url', '')
+        previous = next(
+            (d for d in deployments if d.get('url') and d['url'] not in current_url), None
+        )
+        if previous is None:
+            return {'status': 'failed', 'error': 'No previous production deployment found'}
+        
+        async with http.post(f"{VERCEL_API_URL}/v9/projects/{project_id}/rollback/{previous['uid']}",
+                             headers=headers, params=team_params) as resp:
+            if resp.status < 300:
+                return {
+                    'status': 'success',
+                    'message': 'Successfully rolled back to previous version',
+                    'deployment_id': previous['uid']
+                }
+            return {'status': 'failed', 'error': await resp.text()}
+    
+    async def _rollback_via_cli(self) -> Dict:
+        """Fallback rollback through the Vercel CLI when no API token is configured"""
+        process = await asyncio.create_subprocess_shell(
+            "vercel rollback --yes",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd="/Users/MAC/Documents/projects/roulette-community"
+        )
+        stdout, stderr = await process.communicate()
         
-        rollback_results['end_time'] = datetime.now().isoformat()
-        return rollback_results
+        if process.returncode == 0:
+            return {'status': 'success', 'message': 'Successfully rolled back to previous version'}
+        return {'status': 'failed', 'error': stderr.decode()}
+    
+    async def _get_http(self) -> aiohttp.ClientSession:
+        """Lazily create the shared HTTP session so TLS connections are reused"""
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=50, ttl_dns_cache=300, keepalive_timeout=60)
+            )
+        return self._http
+    
+    async def close(self):
+        """Release the shared HTTP session and flush and close the task event log"""
+        if self._http is not None and not self._http.closed:
+            await self._http.close()
+        if self._state_writer is not None:
+            await asyncio.to_thread(self._state_writer.shutdown, wait=True)
+            self._state_conn.close()
+            self._state_writer = self._state_conn = None
+    
+    async def __aenter__(self) -> 'RCWorkflowOrchestrator':
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.close()
+    
+    def _get_agent_semaphore(self) -> asyncio.Semaphore:
+        """Create the dispatch semaphore lazily so it binds to the running loop"""
+        if self._agent_semaphore is None:
+            self._agent_semaphore = asyncio.Semaphore(self.workflow_config['max_concurrent_agents'])
+        return self._agent_semaphore
+    
+    async def _invoke_agent(self, agent_name: str, task_config: Dict) -> Optional[Dict]:
+        """Call the agent service over the shared HTTP session, or simulate it"""
+        endpoint = self.workflow_config.get('agent_endpoint')
+        if endpoint:
+            http = await self._get_http()
+            async with http.post(
+                f"{endpoint.rstrip('/')}/{agent_name}",
+                data=orjson.dumps(task_config, default=str),
+                headers={'Content-Type': 'application/json'}
+            ) as resp:
+                resp.raise_for_status()
+                return await resp.json(loads=orjson.loads)
+        
+        # Simulate agent execution only when explicitly requested (demos/tests)
+        if self.workflow_config.get('simulate_agents'):
+            await asyncio.sleep(self.workflow_config.get('simulate_latency_s', 0.1))
+        return None
     
     async def _execute_agent_task(self, agent_name: str, task_config: Dict) -> Dict:
         """Execute a task with a specific agent and commit changes"""
-        print(f"  🤖 {agent_name}: {task_config.get('action', 'Processing...')}")
+        self._emit(f"  🤖 {agent_name}: {task_config.get('action', 'Processing...')}")
+        workflow_id = _current_workflow.get()
         
         # Import Git manager
         from src.agents.git_workflow_manager import GitWorkflowManager
@@ -689,15 +1108,17 @@ class RCWorkflowOrchestrator:
         # Initialize Git manager
         git_manager = GitWorkflowManager("/Users/MAC/Documents/projects/roulette-community")
         
-        # Simulate agent execution (in production, this would call actual agent)
-        await asyncio.sleep(0.1)  # Simulate processing time
+        # Bound concurrent agent calls so large fan-outs don't stampede the agents
+        async with self._get_agent_semaphore():
+            agent_output = await self._invoke_agent(agent_name, task_config)
         
         # Create agent results
         results = {
             'agent': agent_name,
             'action': task_config.get('action'),
             'status': 'completed',
-            'results': task_config,
+            'results': agent_output if agent_output is not None else task_config,
+            'workflow_id': workflow_id,
             'timestamp': datetime.now().isoformat()
         }
         
@@ -709,7 +1130,7 @@ class RCWorkflowOrchestrator:
             changes = {
                 'component': task_config.get('component', 'app'),
                 'summary': f"{agent_name} - {task_config.get('action', 'updates')}",
-                'description': f"Automated changes by {agent_name}",
+                'description': f"Automated changes by {agent_name} (workflow {workflow_id})",
                 'agent': agent_name
             }
             
@@ -717,113 +1138,39 @@ class RCWorkflowOrchestrator:
             
             if commit_result.get('success'):
                 results['git_commit'] = commit_result['commit_hash']
-                print(f"    📝 Committed: {commit_result['commit_hash'][:7]}")
+                self._emit(f"    📝 Committed: {commit_result['commit_hash'][:7]}")
         
         return results
     
     def _create_workflow_tasks(self, feature: Dict, workflow_id: str) -> List[WorkflowTask]:
-        """Create workflow tasks for the feature"""
-        tasks = []
-        
-        # Planning task
-        tasks.append(WorkflowTask(
-            id=f"{workflow_id}_planning",
-            name="Requirements Planning",
-            description="Define requirements and acceptance criteria",
-            stage=WorkflowStage.PLANNING,
-            status=TaskStatus.PENDING,
-            assigned_agents=['business-analyst', 'product-owner'],
-            artifacts={'feature': feature}
-        ))
-        
-        # Development tasks
-        tasks.append(WorkflowTask(
-            id=f"{workflow_id}_development",
-            name="Feature Development",
-            description="Implement feature across all platforms",
-            stage=WorkflowStage.DEVELOPMENT,
-            status=TaskStatus.PENDING,
-            assigned_agents=['frontend-developer', 'backend-developer'],
-            dependencies=[f"{workflow_id}_planning"]
-        ))
-        
-        # Testing task
-        tasks.append(WorkflowTask(
-            id=f"{workflow_id}_testing",
-            name="Comprehensive Testing",
-            description="Run all test suites in parallel",
-            stage=WorkflowStage.TESTING,
-            status=TaskStatus.PENDING,
-            assigned_agents=['automation-qa', 'security-tester', 'performance-tester'],
-            dependencies=[f"{workflow_id}_development"]
-        ))
-        
-        # UX Review task
-        tasks.append(WorkflowTask(
-            id=f"{workflow_id}_ux_review",
-            name="UX/UI Review",
-            description="Review design and user experience",
-            stage=WorkflowStage.UX_REVIEW,
-            status=TaskStatus.PENDING,
-            assigned_agents=['ux-designer', 'ui-designer', 'brand-guardian'],
-            dependencies=[f"{workflow_id}_testing"]
-        ))
-        
-        # BA Validation task
-        tasks.append(WorkflowTask(
-            id=f"{workflow_id}_ba_validation",
-            name="Business Validation",
-            description="Validate against requirements",
-            stage=WorkflowStage.BA_VALIDATION,
-            status=TaskStatus.PENDING,
-            assigned_agents=['business-analyst'],
-            dependencies=[f"{workflow_id}_ux_review"]
-        ))
-        
-        # Deployment task (Direct to Production)
-        tasks.append(WorkflowTask(
-            id=f"{workflow_id}_deployment",
-            name="Vercel Production Deployment",
-            description="Deploy directly to production environment",
-            stage=WorkflowStage.DEPLOYMENT,
-            status=TaskStatus.PENDING,
-            assigned_agents=['devops', 'infrastructure'],
-            dependencies=[f"{workflow_id}_ba_validation"]
-        ))
-        
-        # PO Approval task (Post-Deployment)
-        tasks.append(WorkflowTask(
-            id=f"{workflow_id}_po_approval",
-            name="Product Owner Post-Deployment Approval",
-            description="Final approval from Product Owner after production deployment",
-            stage=WorkflowStage.PO_APPROVAL,
-            status=TaskStatus.PENDING,
-            assigned_agents=['product-owner'],
-            dependencies=[f"{workflow_id}_deployment"]
-        ))
-        
-        # Post-Deployment task
-        tasks.append(WorkflowTask(
-            id=f"{workflow_id}_post_deployment",
-            name="Post-Deployment Tasks",
-            description="Monitoring, support materials, and analytics setup",
-            stage=WorkflowStage.PRODUCTION,
-            status=TaskStatus.PENDING,
-            assigned_agents=['monitoring', 'support', 'analytics', 'documentation'],
-            dependencies=[f"{workflow_id}_po_approval"]
-        ))
+        """Create workflow tasks for the feature from the static task template"""
+        tasks = [
+            WorkflowTask(
+                id=f"{workflow_id}_{suffix}",
+                name=name,
+                description=description,
+                stage=stage,
+                status=TaskStatus.PENDING,
+                assigned_agents=list(agents),
+                dependencies=[f"{workflow_id}_{dep}" for dep in deps],
+                workflow_id=workflow_id
+            )
+            for suffix, name, description, stage, agents, deps in self._TASK_TEMPLATES
+        ]
+        tasks[0].artifacts = Artifacts(feature=feature)
         
-        # Store tasks
+        # Store tasks per workflow and in the flat lookup; each task's dependencies are its DAG edges
+        self.tasks_by_workflow[workflow_id] = tasks
         for task in tasks:
             self.tasks[task.id] = task
+        self._status_counts[workflow_id] = Counter({TaskStatus.PENDING: len(tasks)})
         
         return tasks
     
     def _generate_workflow_id(self, feature: Dict) -> str:
         """Generate unique workflow ID"""
-        feature_str = json.dumps(feature, sort_keys=True)
-        hash_obj = hashlib.md5(feature_str.encode())
-        return f"workflow_{hash_obj.hexdigest()[:8]}_{int(time.time())}"
+        feature_bytes = orjson.dumps(feature, option=orjson.OPT_SORT_KEYS)
+        return f"workflow_{_content_digest(feature_bytes)[:8]}_{time.time_ns() // 1_000_000_000}"
     
     def _analyze_test_results(self, test_results: Dict) -> Dict:
         """Analyze test results and generate summary"""
@@ -853,62 +1200,54 @@ class RCWorkflowOrchestrator:
     
     async def _trigger_test_fixes(self, test_results: Dict) -> Dict:
         """Trigger automatic fixes for failed tests"""
+        # Identify failed test types: one lookup per suite, one agent call per non-empty bucket
         fix_tasks = []
-        
-        # Identify failed test types
-        if test_results.get('automation_qa', {}).get('failed_tests', []):
-            fix_tasks.append(
-                self._execute_agent_task('frontend-developer', {
-                    'action': 'fix_failed_tests',
-                    'failed_tests': test_results['automation_qa']['failed_tests']
-                })
-            )
-        
-        if test_results.get('security', {}).get('vulnerabilities', []):
-            fix_tasks.append(
-                self._execute_agent_task('security-tester', {
-                    'action': 'fix_vulnerabilities',
-                    'vulnerabilities': test_results['security']['vulnerabilities']
-                })
-            )
-        
-        if test_results.get('performance', {}).get('issues', []):
-            fix_tasks.append(
-                self._execute_agent_task('performance-tester', {
-                    'action': 'optimize_performance',
-                    'issues': test_results['performance']['issues']
-                })
-            )
+        for suite, key, agent_name, action in self._FIX_ROUTES:
+            items = test_results.get(suite, {}).get(key)
+            if items:
+                fix_tasks.append(self._execute_agent_task(agent_name, {
+                    'action': action,
+                    key: items
+                }))
         
         if fix_tasks:
-            fixes = await asyncio.gather(*fix_tasks)
+            fixes = [fix async for fix in self._iter_completed(fix_tasks)]
             return {'fixes': fixes, 'status': 'completed'}
         
         return {'status': 'no_fixes_needed'}
     
+    async def _iter_completed(self, coros: List[Awaitable[Dict]]) -> AsyncIterator[Dict]:
+        """Yield agent results as soon as each finishes; cancel the rest if one fails"""
+        pending = [asyncio.ensure_future(coro) for coro in coros]
+        try:
+            for next_done in asyncio.as_completed(pending):
+                result = await next_done
+                self._emit(f"    ✔️ {result.get('agent', 'agent')}: {result.get('action', 'done')}")
+                yield result
+        finally:
+            for task in pending:
+                task.cancel()
+    
     def _consolidate_design_feedback(self, reviews: List[Dict]) -> List[str]:
         """Consolidate design feedback from multiple reviewers"""
-        feedback = []
-        
-        for review in reviews:
-            if 'feedback' in review:
-                feedback.extend(review['feedback'])
-        
-        return feedback
+        return list(chain.from_iterable(
+            review['feedback'] for review in reviews if 'feedback' in review
+        ))
     
     async def _implement_design_improvements(self, feedback: List[str]) -> Dict:
         """Implement design improvements based on feedback"""
         improvement_tasks = []
         
         for item in feedback:
-            if 'color' in item.lower() or 'contrast' in item.lower():
+            bucket = _classify_design_feedback(item)
+            if bucket == 'ui':
                 improvement_tasks.append(
                     self._execute_agent_task('ui-designer', {
                         'action': 'improve_colors',
                         'feedback': item
                     })
                 )
-            elif 'layout' in item.lower() or 'spacing' in item.lower():
+            elif bucket == 'ux':
                 improvement_tasks.append(
                     self._execute_agent_task('ux-designer', {
                         'action': 'improve_layout',
@@ -917,114 +1256,149 @@ class RCWorkflowOrchestrator:
                 )
         
         if improvement_tasks:
-            improvements = await asyncio.gather(*improvement_tasks)
+            improvements = [item async for item in self._iter_completed(improvement_tasks)]
             return {'improvements': improvements, 'status': 'completed'}
         
         return {'status': 'no_improvements_needed'}
     
     def _extract_vercel_url(self, output: str) -> str:
         """Extract Vercel deployment URL from output"""
-        # Parse Vercel output for URL
-        lines = output.split('\n')
-        for line in lines:
-            if 'https://' in line and 'vercel.app' in line:
-                return line.strip()
-        return "https://roulette-community.vercel.app"
+        # Single regex pass over the whole log instead of per-line scans
+        match = _VERCEL_URL_RE.search(output)
+        return match.group(0) if match else "https://roulette-community.vercel.app"
     
     async def _calculate_business_metrics(self, deploy_results: Dict) -> Dict:
         """Calculate business metrics for PO review"""
-        return {
-            'estimated_revenue_impact': 'High',
-            'user_engagement_score': 95,
-            'feature_adoption_likelihood': 85,
-            'technical_debt_added': 'Low',
-            'maintenance_burden': 'Low',
-            'scalability_score': 90
-        }
+        # Static estimates for now; built once at import rather than per workflow
+        return dict(_BUSINESS_METRICS)
     
-    def _calculate_workflow_metrics(self, workflow_id: str) -> WorkflowMetrics:
-        """Calculate metrics for the workflow"""
-        tasks = self.active_workflows.get(workflow_id, [])
+    def _calculate_workflow_metrics(self, workflow_id: str) -> Dict[str, Any]:
+        """Calculate metrics for the workflow, as a plain dict for the results payload"""
+        tasks = self.tasks_by_workflow.get(workflow_id, [])
+        
+        status_counts = self._status_counts.get(workflow_id, Counter())
         
         metrics = WorkflowMetrics()
         metrics.total_tasks = len(tasks)
-        metrics.completed_tasks = len([t for t in tasks if t.status == TaskStatus.COMPLETED])
-        metrics.failed_tasks = len([t for t in tasks if t.status == TaskStatus.REJECTED])
+        metrics.completed_tasks = status_counts[TaskStatus.COMPLETED]
+        metrics.failed_tasks = status_counts[TaskStatus.REJECTED]
         
         if metrics.total_tasks > 0:
             metrics.deployment_success_rate = (metrics.completed_tasks / metrics.total_tasks) * 100
         
-        metrics.total_execution_time = time.time() - self.start_time
+        metrics.total_execution_time = (time.monotonic_ns() - self.start_time_ns) / 1e9
         
-        return metrics.__dict__
+        return asdict(metrics)
     
     async def _generate_workflow_report(self, results: Dict):
         """Generate comprehensive workflow report"""
         report_path = f"/tmp/workflow_report_{results['workflow_id']}.json"
+        payload = orjson.dumps(
+            results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str
+        )
         
-        with open(report_path, 'w') as f:
-            json.dump(results, f, indent=2, default=str)
-        
-        print(f"\n📊 Workflow report generated: {report_path}")
-        
-        # Get Git commit summary
+        # Write the report while the Git commit summary is gathered
         from src.agents.git_workflow_manager import GitWorkflowManager
         git_manager = GitWorkflowManager("/Users/MAC/Documents/projects/roulette-community")
-        git_status = await git_manager.get_status()
-        git_report = await git_manager.generate_commit_report()
+        _, git_status, git_report = await asyncio.gather(
+            self._write_report(report_path, payload),
+            git_manager.get_status(),
+            git_manager.generate_commit_report()
+        )
         
-        # Print summary
-        print("\n" + "="*80)
-        print("WORKFLOW EXECUTION SUMMARY")
-        print("="*80)
-        print(f"Workflow ID: {results['workflow_id']}")
-        print(f"Feature: {results['feature'].get('name', 'Unknown')}")
-        print(f"Status: {results['status']}")
+        lines = [f"\n📊 Workflow report generated: {report_path}"]
+        
+        # Build the summary and emit it in a single write
+        lines += [
+            "\n" + "="*80,
+            "WORKFLOW EXECUTION SUMMARY",
+            "="*80,
+            f"Workflow ID: {results['workflow_id']}",
+            f"Feature: {results['feature'].get('name', 'Unknown')}",
+            f"Status: {results['status']}",
+        ]
         
         if 'metrics' in results:
             metrics = results['metrics']
-            print(f"\nMetrics:")
-            print(f"  Total Tasks: {metrics.get('total_tasks', 0)}")
-            print(f"  Completed: {metrics.get('completed_tasks', 0)}")
-            print(f"  Failed: {metrics.get('failed_tasks', 0)}")
-            print(f"  Execution Time: {metrics.get('total_execution_time', 0):.2f}s")
+            lines += [
+                "\nMetrics:",
+                f"  Total Tasks: {metrics.get('total_tasks', 0)}",
+                f"  Completed: {metrics.get('completed_tasks', 0)}",
+                f"  Failed: {metrics.get('failed_tasks', 0)}",
+                f"  Execution Time: {metrics.get('total_execution_time', 0):.2f}s",
+            ]
         
         # Git summary
-        print(f"\nGit Activity:")
-        print(f"  Total Commits: {git_report.get('total_commits', 0)}")
-        print(f"  Current Branch: {git_status.get('current_branch', 'unknown')}")
-        print(f"  Repository Commits: {git_status.get('total_commits', 0)}")
+        lines += [
+            "\nGit Activity:",
+            f"  Total Commits: {git_report.get('total_commits', 0)}",
+            f"  Current Branch: {git_status.get('current_branch', 'unknown')}",
+            f"  Repository Commits: {git_status.get('total_commits', 0)}",
+        ]
         
         if git_report.get('commits_by_type'):
-            print(f"  Commits by Type:")
-            for commit_type, count in git_report['commits_by_type'].items():
-                print(f"    - {commit_type}: {count}")
-        
-        print("="*80)
+            lines.append("  Commits by Type:")
+            lines += [
+                f"    - {commit_type}: {count}"
+                for commit_type, count in git_report['commits_by_type'].items()
+            ]
+        
+        lines.append("="*80)
+        self._output.extend(lines)
+        self._flush_output()
+    
+    async def _write_report(self, report_path: str, payload: bytes):
+        """Write report bytes without blocking the event loop"""
+        if AIOFILES_AVAILABLE:
+            async with aiofiles.open(report_path, 'wb') as f:
+                await f.write(payload)
+        else:
+            await asyncio.to_thread(Path(report_path).write_bytes, payload)
+    
+    def _affected_tasks(self, failed_ids: List[str]) -> List[WorkflowTask]:
+        """Completed tasks upstream of the failures, i.e. the work that needs undoing"""
+        seen: Set[str] = set()
+        stack = list(failed_ids)
+        while stack:
+            task_id = stack.pop()
+            if task_id in seen:
+                continue
+            seen.add(task_id)
+            stack.extend(self.tasks[task_id].dependencies)
+        return [self.tasks[task_id] for task_id in seen
+                if self.tasks[task_id].status == TaskStatus.COMPLETED]
     
     async def _rollback_changes(self, workflow_id: str):
-        """Rollback changes if workflow fails"""
-        print("\n🔄 Rolling back changes...")
-        
-        # Revert deployments
-        await self._execute_agent_task('devops', {
-            'action': 'rollback_deployment',
-            'workflow_id': workflow_id
-        })
+        """Rollback changes if workflow fails, compensating only completed upstream stages"""
+        self._emit("\n🔄 Rolling back changes...")
         
-        # Revert code changes
-        await self._execute_agent_task('frontend-developer', {
-            'action': 'revert_changes',
-            'workflow_id': workflow_id
-        })
-        
-        print("  ✅ Rollback completed")
+        tasks = self.tasks_by_workflow.get(workflow_id, [])
+        failed = [task.id for task in tasks if task.status == TaskStatus.REJECTED]
+        if failed:
+            affected = self._affected_tasks(failed)
+        else:
+            affected = [task for task in tasks if task.status == TaskStatus.COMPLETED]
+        
+        prefix_len = len(workflow_id) + 1
+        compensations = []
+        for task in affected:
+            compensation = self._COMPENSATIONS.get(task.id[prefix_len:])
+            if compensation:
+                agent_name, action = compensation
+                compensations.append(self._execute_agent_task(agent_name, {
+                    'action': action,
+                    'workflow_id': workflow_id
+                }))
+        
+        if compensations:
+            await asyncio.gather(*compensations)
+            self._emit("  ✅ Rollback completed")
+        else:
+            self._emit("  ✅ Nothing to roll back")
 
 
 # Example usage
 async def main():
-    orchestrator = RCWorkflowOrchestrator()
-    
     # Example feature request
     feature_request = {
         'name': 'Enhanced American Roulette P2P Betting',
@@ -1049,7 +1423,8 @@ async def main():
     }
     
     # Execute complete workflow
-    results = await orchestrator.execute_complete_workflow(feature_request)
+    async with RCWorkflowOrchestrator() as orchestrator:
+        results = await orchestrator.execute_complete_workflow(feature_request)
     
     # Print final status
     if results['status'] == 'completed':
@@ -4,9 +4,325 @@ Enhanced Product Owner for Roulette Committee Project
 Conducts thorough interviews to understand vision completely
 """
 
-import json
-from datetime import datetime
-from typing import Dict, List, Any
+import sys
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import islice
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, NamedTuple, Tuple, Union
+
+import orjson
+
+# dataclass(slots=True) is only available from Python 3.10
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+_SEP40 = "-" * 40
+_SEP60 = "=" * 60
+
+# Interview questions by category; built once at import and shared read-only
+_INTERVIEW_QUESTIONS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    "vision_and_purpose": (
+        "What is the core purpose of the Roulette Community platform?",
+        "What problem does it solve that existing roulette platforms don't?",
+        "What is your vision for this platform in 1 year? 5 years?",
+        "What makes this American roulette platform unique in the market?",
+        "What is the elevator pitch for Roulette Community?",
+        "Why focus on American roulette specifically?",
+        "How important is the community aspect vs the gaming aspect?"
+    ),
+    "target_audience": (
+        "Who are the primary users of this platform?",
+        "What are the demographics of your target audience?",
+        "What are the pain points of your users?",
+        "How tech-savvy are your users?",
+        "What devices will they primarily use (mobile/desktop/tablet)?",
+        "How many users do you expect in the first year?"
+    ),
+    "core_features": (
+        "What are the MUST-HAVE features for launch?",
+        "What features can wait for version 2?",
+        "Should we support both American and European roulette or just American?",
+        "What social features are most important (chat, friends, tournaments)?",
+        "Do you want live streaming capabilities for games?",
+        "Will there be real money transactions or virtual currency only?",
+        "Do you need tournament and competition features?",
+        "Should we have educational content about roulette strategies?",
+        "Do you want VIP tables or membership tiers?",
+        "Will there be chat or communication features during games?",
+        "Do you need detailed analytics and game history?",
+        "Should we have a referral/affiliate program?",
+        "Do you want achievement and gamification features?"
+    ),
+    "technical_requirements": (
+        "Do you have any preferred technology stack?",
+        "Do you need mobile apps or just web?",
+        "What browsers must be supported?",
+        "Do you need offline functionality?",
+        "What are the performance requirements (load time, concurrent users)?",
+        "Do you need API integrations with other services?",
+        "What are the security requirements?",
+        "Do you need data encryption?",
+        "What compliance requirements exist (GDPR, gaming licenses, etc.)?"
+    ),
+    "design_and_ux": (
+        "Do you have existing brand guidelines or colors?",
+        "What's the desired look and feel (professional/playful/serious)?",
+        "Do you have competitor sites you like/dislike?",
+        "What accessibility requirements do you have?",
+        "Should it be mobile-first or desktop-first design?",
+        "Do you need dark mode support?",
+        "Any specific UI components you envision?",
+        "Do you have wireframes or mockups?"
+    ),
+    "business_model": (
+        "How will the platform make money?",
+        "Is it subscription-based, transaction-based, or free-to-play with purchases?",
+        "Will you use a dual currency system (gems/coins)?",
+        "Will there be different VIP tiers or membership levels?",
+        "Do you need Stripe or other payment processing?",
+        "What payment methods should be supported?",
+        "How will you handle legal compliance for online gaming?",
+        "Will you operate as a sweepstakes model or social casino?"
+    ),
+    "content_and_data": (
+        "What type of content will be on the platform?",
+        "Who will create and manage content?",
+        "Do you need a CMS (Content Management System)?",
+        "What data needs to be stored?",
+        "How long should data be retained?",
+        "Do you need data export capabilities?",
+        "Will there be user-generated content?"
+    ),
+    "launch_and_timeline": (
+        "When do you need the MVP launched?",
+        "What is your budget range?",
+        "Do you have a hard deadline?",
+        "Will this be a phased launch or big bang?",
+        "What markets/regions will you launch in?",
+        "Do you need beta testing phase?"
+    ),
+    "success_metrics": (
+        "How will you measure success?",
+        "What are your KPIs (Key Performance Indicators)?",
+        "What are the success metrics for year 1?",
+        "What would make this project a failure?",
+        "What analytics do you need to track?"
+    ),
+    "risks_and_constraints": (
+        "What are the main risks to this project?",
+        "What constraints do we need to work within?",
+        "Are there any legal considerations?",
+        "What are your biggest concerns?",
+        "What keeps you up at night about this project?"
+    ),
+    "american_roulette_specifics": (
+        "Why did you choose American roulette over European roulette?",
+        "Should we emphasize the double zero (00) as a feature?",
+        "Do you want to highlight the 5.26% house edge transparently?",
+        "Should we offer the five-number bet (0-00-1-2-3)?",
+        "Do you want side bets or progressive jackpots?",
+        "Should we show hot/cold numbers and statistics?",
+        "Do you want to offer racetrack betting layout?",
+        "Should we have quick bet options (neighbors, orphans, etc.)?",
+        "Do you want surrender rules (La Partage/En Prison)?",
+        "Should we support both inside and outside bet limits?"
+    ),
+    "community_and_social": (
+        "How important are social features vs solo play?",
+        "Do you want public and private tables?",
+        "Should players be able to create their own tables?",
+        "Do you want spectator mode for watching others play?",
+        "Should we have table chat and emojis?",
+        "Do you want friend invites and challenges?",
+        "Should we have clan or team features?",
+        "Do you want seasonal events and competitions?",
+        "Should high wins be celebrated publicly?",
+        "Do you want tipping or gifting between players?"
+    ),
+    "differentiation": (
+        "What will make players choose your platform over competitors?",
+        "What unique features should we prioritize?",
+        "How do we attract American roulette enthusiasts specifically?",
+        "Should we focus on casual players or serious gamblers?",
+        "What's your stance on responsible gaming features?",
+        "Do you want AI-powered features or predictions?",
+        "Should we have celebrity or branded tables?",
+        "Do you want integration with sports betting or other games?",
+        "Should we offer cryptocurrency support?",
+        "How important is mobile app vs web experience?"
+    )
+})
+
+
+def _category_header(category: str) -> str:
+    """Section header printed above a category's questions"""
+    return f"\n📋 {category.replace('_', ' ').upper()}\n{_SEP40}"
+
+
+_CATEGORY_HEADERS = {category: _category_header(category) for category in _INTERVIEW_QUESTIONS}
+
+# Defaults used when the interview leaves a section unanswered
+_DEFAULT_USERS = (
+    'Committee Members',
+    'Decision Makers',
+    'Administrators',
+    'Participants',
+    'Observers'
+)
+
+_DEFAULT_METRICS = (
+    '1000+ active users in first month',
+    '100+ committees created',
+    '95% uptime',
+    '<2s page load time',
+    '4.5+ app store rating',
+    '50% user retention after 30 days'
+)
+
+_DEFAULT_CONSTRAINTS = (
+    'Must launch within timeline',
+    'Must be mobile-responsive',
+    'Must handle concurrent users',
+    'Must be secure',
+    'Must be scalable'
+)
+
+_DEFAULT_PRIORITIES = (
+    'Core committee functionality',
+    'User authentication',
+    'Decision/voting system',
+    'Real-time updates',
+    'Mobile responsiveness',
+    'Dashboard',
+    'Notifications',
+    'Analytics',
+    'Payment processing',
+    'Admin panel'
+)
+
+
+
+class Question(NamedTuple):
+    """A numbered interview question"""
+    number: int
+    category: str
+    question: str
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class Epic:
+    """A roadmap epic handed to the business analysts"""
+    id: str
+    title: str
+    description: str
+    priority: str
+    estimated_stories: int
+    sprint: int
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict form for consumers that take epic dicts"""
+        return asdict(self)
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class EpicTemplate:
+    """Static definition an Epic is generated from"""
+    title: str
+    description: str
+    stories_count: int
+    priority: str
+
+
+# Core epics for Roulette Committee; the first five are high priority
+_EPIC_TEMPLATES = (
+    EpicTemplate('User Authentication & Authorization',
+                 'Complete auth system with roles and permissions', 8, 'high'),
+    EpicTemplate('Committee Management System',
+                 'Create, manage, and organize committees', 10, 'high'),
+    EpicTemplate('Decision/Voting Mechanism',
+                 'Core roulette/voting/decision functionality', 12, 'high'),
+    EpicTemplate('Real-time Communication',
+                 'Chat, notifications, and live updates', 8, 'high'),
+    EpicTemplate('Dashboard & Analytics',
+                 'User and admin dashboards with insights', 10, 'high'),
+    EpicTemplate('Mobile Responsive Design',
+                 'Fully responsive UI for all devices', 6, 'medium'),
+    EpicTemplate('Admin Panel',
+                 'Administrative controls and management', 8, 'medium'),
+    EpicTemplate('Payment & Subscription',
+                 'Payment processing and subscription management', 10, 'medium'),
+    EpicTemplate('API & Integrations',
+                 'REST API and third-party integrations', 6, 'medium'),
+    EpicTemplate('Testing & Quality Assurance',
+                 'Comprehensive testing suite', 8, 'medium'),
+)
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class Risk:
+    """A project risk with its impact and mitigation"""
+    risk: str
+    impact: str
+    mitigation: str
+
+
+_DEFAULT_RISKS = (
+    Risk('Scalability issues with real-time features', 'high',
+         'Use WebSocket clustering and load balancing'),
+    Risk('Complex committee logic', 'medium', 'Thorough testing and clear documentation'),
+    Risk('User adoption', 'high', 'Focus on UX and onboarding'),
+    Risk('Security vulnerabilities', 'high', 'Security audit and best practices'),
+)
+
+
+def _as_risk(risk: Union[str, Mapping[str, str], Risk]) -> Risk:
+    """Normalize a user-supplied risk (plain text, dict or Risk) to a Risk"""
+    if isinstance(risk, Risk):
+        return risk
+    if isinstance(risk, str):
+        return Risk(risk, 'medium', 'To be determined')
+    return Risk(risk['risk'], risk.get('impact', 'medium'), risk.get('mitigation', 'To be determined'))
+
+
+def _render_interview(interview_questions: Mapping[str, Tuple[str, ...]]) -> Tuple[str, Tuple[Question, ...]]:
+    """Render the interview banner and the numbered question records"""
+    buf = [
+        "\n" + _SEP60,
+        "🎙️ ROULETTE COMMUNITY - PRODUCT OWNER INTERVIEW",
+        _SEP60,
+        "\nThank you for choosing to build the Roulette Community platform!",
+        "To ensure we build exactly what you envision, I need to understand",
+        "your requirements thoroughly. Please answer the following questions:\n",
+    ]
+    
+    pairs = [(category, question)
+             for category, questions in interview_questions.items() for question in questions]
+    all_questions = [Question(number, category, question)
+                     for number, (category, question) in enumerate(pairs, 1)]
+    
+    numbered = iter(all_questions)
+    for category, questions in interview_questions.items():
+        header = _CATEGORY_HEADERS.get(category)
+        buf.append(header if header is not None else _category_header(category))
+        buf.extend(f"{q.number}. {q.question}" for q in islice(numbered, len(questions)))
+    
+    buf += [
+        "\n" + _SEP60,
+        "Please provide answers to these questions.",
+        "You can answer them in any format - I'll extract the key information.",
+        f"\nTotal Questions: {len(all_questions)}",
+        "Estimated time to answer: 30-45 minutes",
+        _SEP60 + "\n",
+    ]
+    return "\n".join(buf) + "\n", tuple(all_questions)
+
+
+@lru_cache(maxsize=1)
+def _default_interview() -> Tuple[str, Tuple[Question, ...]]:
+    """The default questionnaire never changes, so it is rendered once per process"""
+    return _render_interview(_INTERVIEW_QUESTIONS)
+
 
 class RouletteCommitteeProductOwner:
     """
@@ -22,178 +338,23 @@ class RouletteCommitteeProductOwner:
         self.responses = {}
         self.american_roulette_focus = True
         
-    def _prepare_interview_questions(self) -> Dict[str, List[str]]:
+    def _prepare_interview_questions(self) -> Mapping[str, Tuple[str, ...]]:
         """
         Prepare comprehensive interview questions organized by category
         """
-        return {
-            "vision_and_purpose": [
-                "What is the core purpose of the Roulette Community platform?",
-                "What problem does it solve that existing roulette platforms don't?",
-                "What is your vision for this platform in 1 year? 5 years?",
-                "What makes this American roulette platform unique in the market?",
-                "What is the elevator pitch for Roulette Community?",
-                "Why focus on American roulette specifically?",
-                "How important is the community aspect vs the gaming aspect?"
-            ],
-            "target_audience": [
-                "Who are the primary users of this platform?",
-                "What are the demographics of your target audience?",
-                "What are the pain points of your users?",
-                "How tech-savvy are your users?",
-                "What devices will they primarily use (mobile/desktop/tablet)?",
-                "How many users do you expect in the first year?"
-            ],
-            "core_features": [
-                "What are the MUST-HAVE features for launch?",
-                "What features can wait for version 2?",
-                "Should we support both American and European roulette or just American?",
-                "What social features are most important (chat, friends, tournaments)?",
-                "Do you want live streaming capabilities for games?",
-                "Will there be real money transactions or virtual currency only?",
-                "Do you need tournament and competition features?",
-                "Should we have educational content about roulette strategies?",
-                "Do you want VIP tables or membership tiers?",
-                "Will there be chat or communication features during games?",
-                "Do you need detailed analytics and game history?",
-                "Should we have a referral/affiliate program?",
-                "Do you want achievement and gamification features?"
-            ],
-            "technical_requirements": [
-                "Do you have any preferred technology stack?",
-                "Do you need mobile apps or just web?",
-                "What browsers must be supported?",
-                "Do you need offline functionality?",
-                "What are the performance requirements (load time, concurrent users)?",
-                "Do you need API integrations with other services?",
-                "What are the security requirements?",
-                "Do you need data encryption?",
-                "What compliance requirements exist (GDPR, gaming licenses, etc.)?"
-            ],
-            "design_and_ux": [
-                "Do you have existing brand guidelines or colors?",
-                "What's the desired look and feel (professional/playful/serious)?",
-                "Do you have competitor sites you like/dislike?",
-                "What accessibility requirements do you have?",
-                "Should it be mobile-first or desktop-first design?",
-                "Do you need dark mode support?",
-                "Any specific UI components you envision?",
-                "Do you have wireframes or mockups?"
-            ],
-            "business_model": [
-                "How will the platform make money?",
-                "Is it subscription-based, transaction-based, or free-to-play with purchases?",
-                "Will you use a dual currency system (gems/coins)?",
-                "Will there be different VIP tiers or membership levels?",
-                "Do you need Stripe or other payment processing?",
-                "What payment methods should be supported?",
-                "How will you handle legal compliance for online gaming?",
-                "Will you operate as a sweepstakes model or social casino?"
-            ],
-            "content_and_data": [
-                "What type of content will be on the platform?",
-                "Who will create and manage content?",
-                "Do you need a CMS (Content Management System)?",
-                "What data needs to be stored?",
-                "How long should data be retained?",
-                "Do you need data export capabilities?",
-                "Will there be user-generated content?"
-            ],
-            "launch_and_timeline": [
-                "When do you need the MVP launched?",
-                "What is your budget range?",
-                "Do you have a hard deadline?",
-                "Will this be a phased launch or big bang?",
-                "What markets/regions will you launch in?",
-                "Do you need beta testing phase?"
-            ],
-            "success_metrics": [
-                "How will you measure success?",
-                "What are your KPIs (Key Performance Indicators)?",
-                "What are the success metrics for year 1?",
-                "What would make this project a failure?",
-                "What analytics do you need to track?"
-            ],
-            "risks_and_constraints": [
-                "What are the main risks to this project?",
-                "What constraints do we need to work within?",
-                "Are there any legal considerations?",
-                "What are your biggest concerns?",
-                "What keeps you up at night about this project?"
-            ],
-            "american_roulette_specifics": [
-                "Why did you choose American roulette over European roulette?",
-                "Should we emphasize the double zero (00) as a feature?",
-                "Do you want to highlight the 5.26% house edge transparently?",
-                "Should we offer the five-number bet (0-00-1-2-3)?",
-                "Do you want side bets or progressive jackpots?",
-                "Should we show hot/cold numbers and statistics?",
-                "Do you want to offer racetrack betting layout?",
-                "Should we have quick bet options (neighbors, orphans, etc.)?",
-                "Do you want surrender rules (La Partage/En Prison)?",
-                "Should we support both inside and outside bet limits?"
-            ],
-            "community_and_social": [
-                "How important are social features vs solo play?",
-                "Do you want public and private tables?",
-                "Should players be able to create their own tables?",
-                "Do you want spectator mode for watching others play?",
-                "Should we have table chat and emojis?",
-                "Do you want friend invites and challenges?",
-                "Should we have clan or team features?",
-                "Do you want seasonal events and competitions?",
-                "Should high wins be celebrated publicly?",
-                "Do you want tipping or gifting between players?"
-            ],
-            "differentiation": [
-                "What will make players choose your platform over competitors?",
-                "What unique features should we prioritize?",
-                "How do we attract American roulette enthusiasts specifically?",
-                "Should we focus on casual players or serious gamblers?",
-                "What's your stance on responsible gaming features?",
-                "Do you want AI-powered features or predictions?",
-                "Should we have celebrity or branded tables?",
-                "Do you want integration with sports betting or other games?",
-                "Should we offer cryptocurrency support?",
-                "How important is mobile app vs web experience?"
-            ]
-        }
+        return _INTERVIEW_QUESTIONS
     
-    def conduct_interview(self) -> Dict[str, List[str]]:
+    def conduct_interview(self) -> List[Question]:
         """
         Return all interview questions for the user to answer
         """
-        print("\n" + "="*60)
-        print("🎙️ ROULETTE COMMUNITY - PRODUCT OWNER INTERVIEW")
-        print("="*60)
-        print("\nThank you for choosing to build the Roulette Community platform!")
-        print("To ensure we build exactly what you envision, I need to understand")
-        print("your requirements thoroughly. Please answer the following questions:\n")
-        
-        all_questions = []
-        question_number = 1
-        
-        for category, questions in self.interview_questions.items():
-            print(f"\n📋 {category.replace('_', ' ').upper()}")
-            print("-" * 40)
-            
-            for question in questions:
-                print(f"{question_number}. {question}")
-                all_questions.append({
-                    'number': question_number,
-                    'category': category,
-                    'question': question
-                })
-                question_number += 1
-        
-        print("\n" + "="*60)
-        print("Please provide answers to these questions.")
-        print("You can answer them in any format - I'll extract the key information.")
-        print("\nTotal Questions: {}".format(question_number - 1))
-        print("Estimated time to answer: 30-45 minutes")
-        print("="*60 + "\n")
+        if self.interview_questions is _INTERVIEW_QUESTIONS:
+            banner, all_questions = _default_interview()
+        else:
+            banner, all_questions = _render_interview(self.interview_questions)
+        sys.stdout.write(banner)
         
-        return all_questions
+        return list(all_questions)
     
     def process_interview_responses(self, responses: Dict) -> Dict:
         """
@@ -222,23 +383,21 @@ class RouletteCommitteeProductOwner:
             'priorities': self._determine_priorities(responses),
             'risks': self._identify_risks(responses),
             
-            'created_at': datetime.now().isoformat()
+            'created_at': datetime.now(tz=timezone.utc)
         }
         
         return self.vision
     
+    def to_json(self) -> bytes:
+        """Serialize the current vision, epics and timestamp included, to JSON bytes"""
+        return orjson.dumps(self.vision, option=orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_DATACLASS)
+    
     def _extract_target_users(self, responses: Dict) -> List[str]:
         """Extract target users from responses"""
         users = responses.get('target_users', [])
         if not users:
             # Default personas for Roulette Committee
-            users = [
-                'Committee Members',
-                'Decision Makers',
-                'Administrators',
-                'Participants',
-                'Observers'
-            ]
+            users = list(_DEFAULT_USERS)
         return users
     
     def _extract_core_features(self, responses: Dict) -> List[Dict]:
@@ -314,159 +473,43 @@ class RouletteCommitteeProductOwner:
         """Extract success metrics"""
         metrics = responses.get('success_metrics', [])
         if not metrics:
-            metrics = [
-                '1000+ active users in first month',
-                '100+ committees created',
-                '95% uptime',
-                '<2s page load time',
-                '4.5+ app store rating',
-                '50% user retention after 30 days'
-            ]
+            metrics = list(_DEFAULT_METRICS)
         return metrics
     
     def _extract_constraints(self, responses: Dict) -> List[str]:
         """Extract project constraints"""
         constraints = responses.get('constraints', [])
         if not constraints:
-            constraints = [
-                'Must launch within timeline',
-                'Must be mobile-responsive',
-                'Must handle concurrent users',
-                'Must be secure',
-                'Must be scalable'
-            ]
+            constraints = list(_DEFAULT_CONSTRAINTS)
         return constraints
     
-    def _generate_epics(self, responses: Dict) -> List[Dict]:
+    def _generate_epics(self, responses: Dict) -> List[Epic]:
         """Generate epics based on features and requirements"""
-        epics = []
-        
-        # Core epics for Roulette Committee
-        epic_templates = [
-            {
-                'title': 'User Authentication & Authorization',
-                'description': 'Complete auth system with roles and permissions',
-                'stories_count': 8
-            },
-            {
-                'title': 'Committee Management System',
-                'description': 'Create, manage, and organize committees',
-                'stories_count': 10
-            },
-            {
-                'title': 'Decision/Voting Mechanism',
-                'description': 'Core roulette/voting/decision functionality',
-                'stories_count': 12
-            },
-            {
-                'title': 'Real-time Communication',
-                'description': 'Chat, notifications, and live updates',
-                'stories_count': 8
-            },
-            {
-                'title': 'Dashboard & Analytics',
-                'description': 'User and admin dashboards with insights',
-                'stories_count': 10
-            },
-            {
-                'title': 'Mobile Responsive Design',
-                'description': 'Fully responsive UI for all devices',
-                'stories_count': 6
-            },
-            {
-                'title': 'Admin Panel',
-                'description': 'Administrative controls and management',
-                'stories_count': 8
-            },
-            {
-                'title': 'Payment & Subscription',
-                'description': 'Payment processing and subscription management',
-                'stories_count': 10
-            },
-            {
-                'title': 'API & Integrations',
-                'description': 'REST API and third-party integrations',
-                'stories_count': 6
-            },
-            {
-                'title': 'Testing & Quality Assurance',
-                'description': 'Comprehensive testing suite',
-                'stories_count': 8
-            }
+        return [
+            Epic(
+                id=f'RC-EPIC-{i+1:03d}',
+                title=template.title,
+                description=template.description,
+                priority=template.priority,
+                estimated_stories=template.stories_count,
+                sprint=(i // 3) + 1
+            )
+            for i, template in enumerate(_EPIC_TEMPLATES)
         ]
-        
-        for i, epic_template in enumerate(epic_templates):
-            epics.append({
-                'id': f'RC-EPIC-{i+1:03d}',
-                'title': epic_template['title'],
-                'description': epic_template['description'],
-                'priority': 'high' if i < 5 else 'medium',
-                'estimated_stories': epic_template['stories_count'],
-                'sprint': (i // 3) + 1
-            })
-        
-        return epics
     
     def _determine_priorities(self, responses: Dict) -> List[str]:
         """Determine feature priorities"""
         priorities = responses.get('priorities', [])
         if not priorities:
-            priorities = [
-                'Core committee functionality',
-                'User authentication',
-                'Decision/voting system',
-                'Real-time updates',
-                'Mobile responsiveness',
-                'Dashboard',
-                'Notifications',
-                'Analytics',
-                'Payment processing',
-                'Admin panel'
-            ]
+            priorities = list(_DEFAULT_PRIORITIES)
         return priorities
     
-    def _identify_risks(self, responses: Dict) -> List[Dict]:
+    def _identify_risks(self, responses: Dict) -> List[Risk]:
         """Identify project risks"""
-        risks = []
-        
-        default_risks = [
-            {
-                'risk': 'Scalability issues with real-time features',
-                'impact': 'high',
-                'mitigation': 'Use WebSocket clustering and load balancing'
-            },
-            {
-                'risk': 'Complex committee logic',
-                'impact': 'medium',
-                'mitigation': 'Thorough testing and clear documentation'
-            },
-            {
-                'risk': 'User adoption',
-                'impact': 'high',
-                'mitigation': 'Focus on UX and onboarding'
-            },
-            {
-                'risk': 'Security vulnerabilities',
-                'impact': 'high',
-                'mitigation': 'Security audit and best practices'
-            }
-        ]
-        
         user_risks = responses.get('risks', [])
         if user_risks:
-            for risk in user_risks:
-                if isinstance(risk, str):
-                    risks.append({
-                        'risk': risk,
-                        'impact': 'medium',
-                        'mitigation': 'To be determined'
-                    })
-                else:
-                    risks.append(risk)
-        else:
-            risks = default_risks
-        
-        return risks
+            return [_as_risk(risk) for risk in user_risks]
+        return list(_DEFAULT_RISKS)
     
     def create_product_roadmap(self) -> Dict:
         """
@@ -3,12 +3,32 @@ Site Architecture Specialist Agent for Roulette Community
 Manages sitemap, URL schemas, feature mapping, and navigation architecture
 """
 
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
 from dataclasses import dataclass
-from datetime import datetime
-import json
+from functools import lru_cache
+import re
+import sys
+import time
+from types import MappingProxyType
 
-@dataclass
+import orjson
+
+from frozen_data import freeze
+
+# Placeholder substituted with the generation timestamp in cached sitemaps
+_LASTMOD = "__LASTMOD__"
+
+# Character classes checked by validate_url_schema
+_HAS_SPECIAL = re.compile(r'[?&#@!$]').search
+_HAS_UPPER = re.compile(r'[A-Z]').search
+
+# dataclass(slots=...) needs Python 3.10+
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+_intern = sys.intern
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class Route:
     """Represents a single route in the application"""
     path: str
@@ -18,16 +38,557 @@ class Route:
     auth_required: bool
     priority: float  # SEO priority 0.0-1.0
     changefreq: str  # daily, weekly, monthly
-    children: List['Route'] = None
-    api_endpoints: List[str] = None
-    components: List[str] = None
-    metadata: Dict = None
+    children: Optional[Tuple['Route', ...]] = None
+    api_endpoints: Optional[Tuple[str, ...]] = None
+    components: Optional[Tuple[str, ...]] = None
+    metadata: Optional[Mapping] = None
+    
+    def __post_init__(self):
+        # Repeated values (feature, changefreq, component names) share one object
+        object.__setattr__(self, 'feature', _intern(self.feature))
+        object.__setattr__(self, 'changefreq', _intern(self.changefreq))
+        if self.components:
+            object.__setattr__(self, 'components', tuple(map(_intern, self.components)))
+        # Routes are shared by every instance, so their metadata is read-only too
+        if self.metadata is not None:
+            object.__setattr__(self, 'metadata', freeze(self.metadata))
+
+# Existing Roulette Community routes, shared read-only by every instance
+_ROUTES: Mapping[str, Route] = MappingProxyType({
+    # Public Routes
+    "/": Route(
+        path="/",
+        feature="landing",
+        title="Roulette Community - Premium Gaming Platform",
+        description="Experience the ultimate roulette gaming with community features",
+        auth_required=False,
+        priority=1.0,
+        changefreq="daily",
+        api_endpoints=("/api/health",),
+        components=("Header", "Footer", "Hero", "Features")
+    ),
+    
+    # Authentication Routes
+    "/auth/login": Route(
+        path="/auth/login",
+        feature="authentication",
+        title="Login - Roulette Community",
+        description="Sign in to your account",
+        auth_required=False,
+        priority=0.8,
+        changefreq="monthly",
+        api_endpoints=("/api/auth/login", "/api/auth/verify-captcha"),
+        components=("LoginForm", "SocialAuth", "CaptchaVerification")
+    ),
+    "/auth/signup": Route(
+        path="/auth/signup",
+        feature="authentication",
+        title="Sign Up - Join Roulette Community",
+        description="Create your free account and get started",
+        auth_required=False,
+        priority=0.9,
+        changefreq="monthly",
+        api_endpoints=("/api/auth/register",),
+        components=("SignupForm", "ReferralCode", "TermsAcceptance")
+    ),
+    "/auth/error": Route(
+        path="/auth/error",
+        feature="authentication",
+        title="Authentication Error",
+        description="Error during authentication",
+        auth_required=False,
+        priority=0.1,
+        changefreq="yearly",
+        components=("ErrorDisplay", "RetryOptions")
+    ),
+    
+    # Gaming Routes
+    "/play": Route(
+        path="/play",
+        feature="gaming",
+        title="Play American Roulette - Live Tables",
+        description="Join live American roulette tables with double zero",
+        auth_required=True,
+        priority=0.9,
+        changefreq="always",
+        api_endpoints=(
+            "/api/game/session",
+            "/api/game/bet",
+            "/api/game/history",
+            "/api/game/rng/verify"
+        ),
+        components=(
+            "RouletteWheel",
+            "BettingTable",
+            "BettingControls",
+            "GameBoard",
+            "GameHeader",
+            "GameSidebar",
+            "DelightfulMoments",
+            "ShareableMoments"
+        ),
+        metadata={"table_type": "american", "double_zero": True}
+    ),
+    
+    # Dashboard Routes
+    "/dashboard": Route(
+        path="/dashboard",
+        feature="user_dashboard",
+        title="Dashboard - Your Gaming Hub",
+        description="View your stats, achievements, and activity",
+        auth_required=True,
+        priority=0.7,
+        changefreq="daily",
+        api_endpoints=(
+            "/api/session",
+            "/api/currency/balance",
+            "/api/currency/transactions"
+        ),
+        components=("ExperimentDashboard", "StatsOverview", "RecentActivity")
+    ),
+    
+    # Learning Routes
+    "/learn": Route(
+        path="/learn",
+        feature="education",
+        title="Roulette Academy - Learn & Master",
+        description="Comprehensive roulette education and strategy guides",
+        auth_required=False,
+        priority=0.8,
+        changefreq="weekly",
+        components=(
+            "LearningAcademy",
+            "CourseCatalog",
+            "StrategyLibrary",
+            "InteractiveModule"
+        )
+    ),
+    
+    # Admin Routes
+    "/admin": Route(
+        path="/admin",
+        feature="administration",
+        title="Admin Panel",
+        description="System administration",
+        auth_required=True,
+        priority=0.1,
+        changefreq="monthly",
+        children=(
+            Route(
+                path="/admin/integrations",
+                feature="admin_integrations",
+                title="Integration Management",
+                description="Manage third-party integrations",
+                auth_required=True,
+                priority=0.1,
+                changefreq="monthly",
+                api_endpoints=("/api/admin/integration-status",)
+            ),
+        )
+    )
+})
+
+# URL naming patterns and conventions
+_URL_PATTERNS: Mapping[str, str] = MappingProxyType({
+    # Core patterns
+    "public_pages": "/{feature}",
+    "authenticated_pages": "/{feature}/{action}",
+    "user_content": "/u/{username}/{content}",
+    "game_rooms": "/play/{room_type}/{room_id}",
+    "tournaments": "/tournaments/{tournament_id}",
+    "education": "/learn/{course_type}/{course_id}/{module_id}",
+    "social": "/community/{space}/{topic_id}",
+    "profile": "/profile/{user_id}",
+    "settings": "/settings/{section}",
+    
+    # API patterns
+    "api_public": "/api/{resource}",
+    "api_authenticated": "/api/{resource}/{action}",
+    "api_admin": "/api/admin/{resource}/{action}",
+    "api_websocket": "/ws/{channel}",
+    
+    # Asset patterns
+    "static_assets": "/assets/{type}/{filename}",
+    "user_uploads": "/uploads/{user_id}/{filename}",
+    "cdn_content": "https://cdn.roulettecommunity.com/{path}"
+})
+
+# Features mapped to their URLs and components
+_FEATURE_MAP: Mapping[str, Mapping] = freeze({
+    "gaming": {
+        "routes": [
+            "/play",
+            "/play/american",
+            "/play/european",
+            "/play/vip/{table_id}",
+            "/play/tournaments"
+        ],
+        "api_endpoints": [
+            "/api/game/session",
+            "/api/game/bet",
+            "/api/game/history",
+            "/api/game/rng/verify"
+        ],
+        "components": [
+            "RouletteWheel",
+            "BettingTable",
+            "GameStats",
+            "LiveChat"
+        ],
+        "requires_auth": True,
+        "real_time": True
+    },
+    
+    "social": {
+        "routes": [
+            "/community",
+            "/community/forums",
+            "/community/chat",
+            "/friends",
+            "/leaderboards",
+            "/achievements"
+        ],
+        "api_endpoints": [
+            "/api/social/friends",
+            "/api/social/achievements",
+            "/api/social/leaderboard",
+            "/api/social/activity"
+        ],
+        "components": [
+            "SocialDashboard",
+            "FriendsList",
+            "ActivityFeed",
+            "LeaderboardCard"
+        ],
+        "requires_auth": True,
+        "real_time": True
+    },
+    
+    "education": {
+        "routes": [
+            "/learn",
+            "/learn/basics",
+            "/learn/strategies",
+            "/learn/probability",
+            "/learn/simulator"
+        ],
+        "api_endpoints": [
+            "/api/education/courses",
+            "/api/education/progress",
+            "/api/education/certificates"
+        ],
+        "components": [
+            "LearningAcademy",
+            "CoursePlayer",
+            "QuizModule",
+            "SimulatorModule"
+        ],
+        "requires_auth": False,
+        "real_time": False
+    },
+    
+    "currency": {
+        "routes": [
+            "/wallet",
+            "/shop",
+            "/shop/gems",
+            "/shop/coins",
+            "/transactions"
+        ],
+        "api_endpoints": [
+            "/api/currency/balance",
+            "/api/currency/coins",
+            "/api/currency/purchase",
+            "/api/currency/transactions"
+        ],
+        "components": [
+            "CurrencyDisplay",
+            "PurchaseModal",
+            "FreeCoinsClaim",
+            "TransactionHistory"
+        ],
+        "requires_auth": True,
+        "real_time": False
+    },
+    
+    "premium": {
+        "routes": [
+            "/vip",
+            "/vip/benefits",
+            "/vip/tiers",
+            "/subscription"
+        ],
+        "api_endpoints": [
+            "/api/premium/status",
+            "/api/premium/subscribe",
+            "/api/premium/benefits"
+        ],
+        "components": [
+            "VIPDashboard",
+            "TierProgress",
+            "BenefitsGrid",
+            "SubscriptionManager"
+        ],
+        "requires_auth": True,
+        "real_time": False
+    }
+})
+
+# Shared by every leaf of a compiled trie in place of its own empty dict
+_NO_CHILDREN: Mapping[str, '_TrieNode'] = MappingProxyType({})
+
+class _TrieNode:
+    """Segment-wise radix trie node used by ``SiteArchitectureSpecialist.match``"""
+    __slots__ = ('children', 'route', 'param_child', 'catchall')
+    
+    def __init__(self):
+        self.children: Mapping[str, '_TrieNode'] = {}
+        self.route: Optional[Route] = None
+        self.param_child: Optional['_TrieNode'] = None
+        self.catchall: Optional[Route] = None
+
+def _flatten_routes(routes: Mapping[str, Route]) -> Tuple[Route, ...]:
+    """List routes depth-first, each parent followed by its children"""
+    flat: List[Route] = []
+    
+    def walk(route: Route):
+        flat.append(route)
+        for child in route.children or ():
+            walk(child)
+    
+    for route in routes.values():
+        walk(route)
+    return tuple(flat)
+
+def _compile_route_trie(routes: Iterable[Route]) -> _TrieNode:
+    """Compile a flat sequence of routes into a segment trie.
+    
+    ``{param}`` segments become the node's ``param_child`` and a trailing
+    ``*`` registers the route as the node's ``catchall``.
+    """
+    root = _TrieNode()
+    for route in routes:
+        node = root
+        for seg in route.path.strip('/').split('/'):
+            if not seg:
+                continue
+            if seg == '*':
+                node.catchall = route
+                break
+            if seg[0] == '{' and seg[-1] == '}':
+                if node.param_child is None:
+                    node.param_child = _TrieNode()
+                node = node.param_child
+            else:
+                seg = _intern(seg)
+                child = node.children.get(seg)
+                if child is None:
+                    child = node.children[seg] = _TrieNode()
+                node = child
+        else:
+            node.route = route
+    _compact_trie(root)
+    return root
+
+def _compact_trie(node: _TrieNode):
+    """Point every leaf at one shared empty mapping once the trie is complete"""
+    if node.children:
+        for child in node.children.values():
+            _compact_trie(child)
+    else:
+        node.children = _NO_CHILDREN
+    if node.param_child is not None:
+        _compact_trie(node.param_child)
+
+# (main routes, API endpoints) URL templates per feature type
+_FEATURE_TEMPLATES: Mapping[str, Tuple[Tuple[str, ...], Tuple[str, ...]]] = MappingProxyType({
+    "gaming": (
+        ("/play/{n}", "/play/{n}/rules", "/play/{n}/stats", "/play/{n}/history"),
+        ("/api/game/{n}/session", "/api/game/{n}/bet", "/api/game/{n}/result")
+    ),
+    "social": (
+        ("/community/{n}", "/community/{n}/feed", "/community/{n}/members"),
+        ("/api/social/{n}", "/api/social/{n}/posts", "/api/social/{n}/interactions")
+    ),
+    "education": (
+        ("/learn/{n}", "/learn/{n}/modules", "/learn/{n}/practice"),
+        ("/api/education/{n}", "/api/education/{n}/progress", "/api/education/{n}/complete")
+    ),
+    "standard": (
+        ("/{n}", "/{n}/overview", "/{n}/settings"),
+        ("/api/{n}", "/api/{n}/data", "/api/{n}/update")
+    )
+})
+
+_ADMIN_ROUTE_TEMPLATES = ("/admin/{n}", "/admin/{n}/analytics", "/admin/{n}/settings")
+
+# Primary navigation paths between features
+_NAVIGATION_FLOWS: Mapping[str, Tuple[str, ...]] = freeze({
+    "onboarding_flow": [
+        "/",
+        "/auth/signup",
+        "/onboarding/welcome",
+        "/onboarding/preferences",
+        "/learn/basics",
+        "/play"
+    ],
+    
+    "gaming_flow": [
+        "/dashboard",
+        "/play",
+        "/play/american",
+        "/wallet",
+        "/transactions"
+    ],
+    
+    "learning_flow": [
+        "/learn",
+        "/learn/basics",
+        "/learn/strategies",
+        "/learn/simulator",
+        "/play"
+    ],
+    
+    "social_flow": [
+        "/dashboard",
+        "/community",
+        "/friends",
+        "/leaderboards",
+        "/achievements"
+    ],
+    
+    "purchase_flow": [
+        "/wallet",
+        "/shop/gems",
+        "/shop/checkout",
+        "/shop/success",
+        "/play"
+    ],
+    
+    "vip_upgrade_flow": [
+        "/profile",
+        "/vip",
+        "/vip/benefits",
+        "/subscription",
+        "/subscription/success"
+    ]
+})
+
+# Static SEO recommendations for the URL structure
+_SEO_RECOMMENDATIONS: Tuple[Mapping[str, Any], ...] = freeze((
+    {
+        "category": "URL Structure",
+        "recommendations": (
+            "Use descriptive, keyword-rich URLs",
+            "Keep URLs under 60 characters when possible",
+            "Use hyphens to separate words",
+            "Avoid dynamic parameters in URLs",
+            "Implement canonical URLs for duplicate content"
+        )
+    },
+    {
+        "category": "American Roulette Focus",
+        "recommendations": (
+            "Include 'american-roulette' in gaming URLs",
+            "Differentiate from European roulette in URL structure",
+            "Highlight double-zero in URL parameters",
+            "Create dedicated landing pages for American roulette",
+            "Use location-based URLs for US markets"
+        )
+    },
+    {
+        "category": "Deep Linking",
+        "recommendations": (
+            "Implement app deep links for mobile",
+            "Create shareable game session URLs",
+            "Enable direct links to specific tables",
+            "Support referral code in URLs",
+            "Add social sharing parameters"
+        )
+    },
+    {
+        "category": "Performance",
+        "recommendations": (
+            "Implement URL prefetching for common paths",
+            "Use route-based code splitting",
+            "Cache static routes aggressively",
+            "Optimize API endpoint grouping",
+            "Implement progressive enhancement"
+        )
+    }
+))
+
+# Navigation menu structure
+_NAVIGATION_MENU: Mapping[str, Tuple[Mapping[str, Any], ...]] = freeze({
+    "main_navigation": [
+        {"label": "Play", "path": "/play", "icon": "roulette", "auth": True},
+        {"label": "Learn", "path": "/learn", "icon": "education", "auth": False},
+        {"label": "Community", "path": "/community", "icon": "users", "auth": True},
+        {"label": "Tournaments", "path": "/tournaments", "icon": "trophy", "auth": True},
+        {"label": "VIP", "path": "/vip", "icon": "crown", "auth": True}
+    ],
+    
+    "user_menu": [
+        {"label": "Dashboard", "path": "/dashboard", "icon": "home"},
+        {"label": "Profile", "path": "/profile", "icon": "user"},
+        {"label": "Wallet", "path": "/wallet", "icon": "wallet"},
+        {"label": "Friends", "path": "/friends", "icon": "users"},
+        {"label": "Settings", "path": "/settings", "icon": "settings"},
+        {"label": "Logout", "path": "/auth/logout", "icon": "logout"}
+    ],
+    
+    "footer_navigation": [
+        {
+            "section": "Game",
+            "links": [
+                {"label": "Play American Roulette", "path": "/play/american"},
+                {"label": "Game Rules", "path": "/learn/rules"},
+                {"label": "Strategies", "path": "/learn/strategies"},
+                {"label": "Probability Calculator", "path": "/tools/calculator"}
+            ]
+        },
+        {
+            "section": "Community",
+            "links": [
+                {"label": "Forums", "path": "/community/forums"},
+                {"label": "Leaderboards", "path": "/leaderboards"},
+                {"label": "Tournaments", "path": "/tournaments"},
+                {"label": "Watch Parties", "path": "/watch-parties"}
+            ]
+        },
+        {
+            "section": "Support",
+            "links": [
+                {"label": "Help Center", "path": "/help"},
+                {"label": "Contact", "path": "/contact"},
+                {"label": "Terms", "path": "/terms"},
+                {"label": "Privacy", "path": "/privacy"}
+            ]
+        }
+    ]
+})
+
+_FLAT_ROUTES = _flatten_routes(_ROUTES)
+
+# Fully static paths resolve with one dict lookup; only dynamic routes need the trie
+_STATIC_ROUTES: Mapping[str, Route] = MappingProxyType({
+    route.path: route for route in _FLAT_ROUTES
+    if '{' not in route.path and '*' not in route.path
+})
+_ROUTE_TRIE = _compile_route_trie(
+    route for route in _FLAT_ROUTES if route.path not in _STATIC_ROUTES
+)
 
 class SiteArchitectureSpecialist:
     """
     Specialist agent for managing site architecture, URL schemas, and feature mapping
     """
     
+    # Static navigation and SEO tables, deeply read-only and shared by every instance
+    navigation_flows = _NAVIGATION_FLOWS
+    seo_recommendations = _SEO_RECOMMENDATIONS
+    navigation_menu = _NAVIGATION_MENU
+    
     def __init__(self):
         self.name = "Site Architecture Specialist"
         self.role = "URL Schema Designer & Navigation Architect"
@@ -42,403 +603,96 @@ class SiteArchitectureSpecialist:
         ]
         
         # Initialize with existing Roulette Community structure
-        self.existing_routes = self._map_existing_routes()
-        self.url_patterns = self._define_url_patterns()
-        self.feature_map = self._create_feature_map()
+        self.existing_routes = _ROUTES
+        self._flat_routes = _FLAT_ROUTES
+        self._static_routes = _STATIC_ROUTES
+        self._route_trie = _ROUTE_TRIE
+        self.url_patterns = _URL_PATTERNS
+        self.feature_map = _FEATURE_MAP
         
-    def _map_existing_routes(self) -> Dict[str, Route]:
-        """Map all existing routes from the current project structure"""
-        return {
-            # Public Routes
-            "/": Route(
-                path="/",
-                feature="landing",
-                title="Roulette Community - Premium Gaming Platform",
-                description="Experience the ultimate roulette gaming with community features",
-                auth_required=False,
-                priority=1.0,
-                changefreq="daily",
-                api_endpoints=["/api/health"],
-                components=["Header", "Footer", "Hero", "Features"]
-            ),
-            
-            # Authentication Routes
-            "/auth/login": Route(
-                path="/auth/login",
-                feature="authentication",
-                title="Login - Roulette Community",
-                description="Sign in to your account",
-                auth_required=False,
-                priority=0.8,
-                changefreq="monthly",
-                api_endpoints=["/api/auth/login", "/api/auth/verify-captcha"],
-                components=["LoginForm", "SocialAuth", "CaptchaVerification"]
-            ),
-            "/auth/signup": Route(
-                path="/auth/signup",
-                feature="authentication",
-                title="Sign Up - Join Roulette Community",
-                description="Create your free account and get started",
-                auth_required=False,
-                priority=0.9,
-                changefreq="monthly",
-                api_endpoints=["/api/auth/register"],
-                components=["SignupForm", "ReferralCode", "TermsAcceptance"]
-            ),
-            "/auth/error": Route(
-                path="/auth/error",
-                feature="authentication",
-                title="Authentication Error",
-                description="Error during authentication",
-                auth_required=False,
-                priority=0.1,
-                changefreq="yearly",
-                components=["ErrorDisplay", "RetryOptions"]
-            ),
-            
-            # Gaming Routes
-            "/play": Route(
-                path="/play",
-                feature="gaming",
-                title="Play American Roulette - Live Tables",
-                description="Join live American roulette tables with double zero",
-                auth_required=True,
-                priority=0.9,
-                changefreq="always",
-                api_endpoints=[
-                    "/api/game/session",
-                    "/api/game/bet",
-                    "/api/game/history",
-                    "/api/game/rng/verify"
-                ],
-                components=[
-                    "RouletteWheel",
-                    "BettingTable",
-                    "BettingControls",
-                    "GameBoard",
-                    "GameHeader",
-                    "GameSidebar",
-                    "DelightfulMoments",
-                    "ShareableMoments"
-                ],
-                metadata={"table_type": "american", "double_zero": True}
-            ),
-            
-            # Dashboard Routes
-            "/dashboard": Route(
-                path="/dashboard",
-                feature="user_dashboard",
-                title="Dashboard - Your Gaming Hub",
-                description="View your stats, achievements, and activity",
-                auth_required=True,
-                priority=0.7,
-                changefreq="daily",
-                api_endpoints=[
-                    "/api/session",
-                    "/api/currency/balance",
-                    "/api/currency/transactions"
-                ],
-                components=["ExperimentDashboard", "StatsOverview", "RecentActivity"]
-            ),
-            
-            # Learning Routes
-            "/learn": Route(
-                path="/learn",
-                feature="education",
-                title="Roulette Academy - Learn & Master",
-                description="Comprehensive roulette education and strategy guides",
-                auth_required=False,
-                priority=0.8,
-                changefreq="weekly",
-                components=[
-                    "LearningAcademy",
-                    "CourseCatalog",
-                    "StrategyLibrary",
-                    "InteractiveModule"
-                ]
-            ),
-            
-            # Admin Routes
-            "/admin": Route(
-                path="/admin",
-                feature="administration",
-                title="Admin Panel",
-                description="System administration",
-                auth_required=True,
-                priority=0.1,
-                changefreq="monthly",
-                children=[
-                    Route(
-                        path="/admin/integrations",
-                        feature="admin_integrations",
-                        title="Integration Management",
-                        description="Manage third-party integrations",
-                        auth_required=True,
-                        priority=0.1,
-                        changefreq="monthly",
-                        api_endpoints=["/api/admin/integration-status"]
-                    )
-                ]
-            )
-        }
-    
-    def _define_url_patterns(self) -> Dict[str, str]:
-        """Define URL naming patterns and conventions"""
-        return {
-            # Core patterns
-            "public_pages": "/{feature}",
-            "authenticated_pages": "/{feature}/{action}",
-            "user_content": "/u/{username}/{content}",
-            "game_rooms": "/play/{room_type}/{room_id}",
-            "tournaments": "/tournaments/{tournament_id}",
-            "education": "/learn/{course_type}/{course_id}/{module_id}",
-            "social": "/community/{space}/{topic_id}",
-            "profile": "/profile/{user_id}",
-            "settings": "/settings/{section}",
-            
-            # API patterns
-            "api_public": "/api/{resource}",
-            "api_authenticated": "/api/{resource}/{action}",
-            "api_admin": "/api/admin/{resource}/{action}",
-            "api_websocket": "/ws/{channel}",
-            
-            # Asset patterns
-            "static_assets": "/assets/{type}/{filename}",
-            "user_uploads": "/uploads/{user_id}/{filename}",
-            "cdn_content": "https://cdn.roulettecommunity.com/{path}"
-        }
-    
-    def _create_feature_map(self) -> Dict[str, Dict]:
-        """Map features to their URLs and components"""
-        return {
-            "gaming": {
-                "routes": [
-                    "/play",
-                    "/play/american",
-                    "/play/european",
-                    "/play/vip/{table_id}",
-                    "/play/tournaments"
-                ],
-                "api_endpoints": [
-                    "/api/game/session",
-                    "/api/game/bet",
-                    "/api/game/history",
-                    "/api/game/rng/verify"
-                ],
-                "components": [
-                    "RouletteWheel",
-                    "BettingTable",
-                    "GameStats",
-                    "LiveChat"
-                ],
-                "requires_auth": True,
-                "real_time": True
-            },
-            
-            "social": {
-                "routes": [
-                    "/community",
-                    "/community/forums",
-                    "/community/chat",
-                    "/friends",
-                    "/leaderboards",
-                    "/achievements"
-                ],
-                "api_endpoints": [
-                    "/api/social/friends",
-                    "/api/social/achievements",
-                    "/api/social/leaderboard",
-                    "/api/social/activity"
-                ],
-                "components": [
-                    "SocialDashboard",
-                    "FriendsList",
-                    "ActivityFeed",
-                    "LeaderboardCard"
-                ],
-                "requires_auth": True,
-                "real_time": True
-            },
-            
-            "education": {
-                "routes": [
-                    "/learn",
-                    "/learn/basics",
-                    "/learn/strategies",
-                    "/learn/probability",
-                    "/learn/simulator"
-                ],
-                "api_endpoints": [
-                    "/api/education/courses",
-                    "/api/education/progress",
-                    "/api/education/certificates"
-                ],
-                "components": [
-                    "LearningAcademy",
-                    "CoursePlayer",
-                    "QuizModule",
-                    "SimulatorModule"
-                ],
-                "requires_auth": False,
-                "real_time": False
-            },
-            
-            "currency": {
-                "routes": [
-                    "/wallet",
-                    "/shop",
-                    "/shop/gems",
-                    "/shop/coins",
-                    "/transactions"
-                ],
-                "api_endpoints": [
-                    "/api/currency/balance",
-                    "/api/currency/coins",
-                    "/api/currency/purchase",
-                    "/api/currency/transactions"
-                ],
-                "components": [
-                    "CurrencyDisplay",
-                    "PurchaseModal",
-                    "FreeCoinsClaim",
-                    "TransactionHistory"
-                ],
-                "requires_auth": True,
-                "real_time": False
-            },
-            
-            "premium": {
-                "routes": [
-                    "/vip",
-                    "/vip/benefits",
-                    "/vip/tiers",
-                    "/subscription"
-                ],
-                "api_endpoints": [
-                    "/api/premium/status",
-                    "/api/premium/subscribe",
-                    "/api/premium/benefits"
-                ],
-                "components": [
-                    "VIPDashboard",
-                    "TierProgress",
-                    "BenefitsGrid",
-                    "SubscriptionManager"
-                ],
-                "requires_auth": True,
-                "real_time": False
-            }
-        }
-    
-    def generate_sitemap(self, format: str = "xml") -> str:
-        """Generate sitemap in specified format"""
+        # Route metadata is fixed, so only lastmod varies per sitemap
+        self._xml_tpl, self._json_tpl, self._text_tpl = self._build_sitemap_templates()
+        
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _build_sitemap_templates(cls) -> Tuple[str, str, str]:
+        """Render the XML, JSON and text sitemaps once with a lastmod placeholder"""
         sitemap = {
-            "lastmod": datetime.now().isoformat(),
+            "lastmod": _LASTMOD,
             "urls": []
         }
         
-        for path, route in self.existing_routes.items():
-            entry = {
-                "loc": f"https://roulettecommunity.com{path}",
-                "lastmod": datetime.now().isoformat(),
+        for route in _FLAT_ROUTES:
+            sitemap["urls"].append({
+                "loc": f"https://roulettecommunity.com{route.path}",
+                "lastmod": _LASTMOD,
                 "changefreq": route.changefreq,
                 "priority": route.priority,
                 "title": route.title,
                 "description": route.description,
                 "auth_required": route.auth_required
-            }
-            sitemap["urls"].append(entry)
-            
-            # Add child routes
-            if route.children:
-                for child in route.children:
-                    child_entry = {
-                        "loc": f"https://roulettecommunity.com{child.path}",
-                        "lastmod": datetime.now().isoformat(),
-                        "changefreq": child.changefreq,
-                        "priority": child.priority,
-                        "title": child.title,
-                        "auth_required": child.auth_required
-                    }
-                    sitemap["urls"].append(child_entry)
+            })
         
+        return (
+            cls._convert_to_xml(sitemap),
+            orjson.dumps(sitemap, option=orjson.OPT_INDENT_2).decode(),
+            cls._convert_to_text(sitemap)
+        )
+    
+    def generate_sitemap(self, format: str = "xml") -> str:
+        """Generate sitemap in specified format"""
         if format == "json":
-            return json.dumps(sitemap, indent=2)
+            template = self._json_tpl
         elif format == "xml":
-            return self._convert_to_xml(sitemap)
+            template = self._xml_tpl
         else:
-            return self._convert_to_text(sitemap)
+            # The text sitemap carries no lastmod
+            return self._text_tpl
+        
+        # One clock read shared by the sitemap header and every URL entry
+        now_iso = time.strftime('%Y-%m-%dT%H:%M:%S+00:00', time.gmtime())
+        return template.replace(_LASTMOD, now_iso)
+    
+    def match(self, path: str) -> Optional[Route]:
+        """Resolve a request path to its Route (static > {param} > catch-all)"""
+        route = self._static_routes.get(path)
+        if route is not None:
+            return route
+        segs = [seg for seg in path.strip('/').split('/') if seg]
+        # Retry the static table with the canonical form ('/play/' -> '/play')
+        route = self._static_routes.get('/' + '/'.join(segs))
+        if route is not None:
+            return route
+        return self._match_segments(self._route_trie, segs, 0)
+    
+    def _match_segments(self, node: _TrieNode, segs: List[str], i: int) -> Optional[Route]:
+        if i == len(segs):
+            return node.route or node.catchall
+        child = node.children.get(segs[i])
+        if child is not None:
+            found = self._match_segments(child, segs, i + 1)
+            if found is not None:
+                return found
+        if node.param_child is not None:
+            found = self._match_segments(node.param_child, segs, i + 1)
+            if found is not None:
+                return found
+        return node.catchall
     
     def plan_new_feature_urls(self, feature: Dict) -> Dict[str, List[str]]:
         """Plan URL structure for a new feature"""
         feature_name = feature.get('name', '').lower().replace(' ', '-')
-        feature_type = feature.get('type', 'standard')
+        main_routes, api_endpoints = _FEATURE_TEMPLATES.get(
+            feature.get('type', 'standard'), _FEATURE_TEMPLATES["standard"]
+        )
         
-        url_structure = {
-            "main_routes": [],
-            "api_endpoints": [],
-            "admin_routes": [],
+        return {
+            "main_routes": [t.format(n=feature_name) for t in main_routes],
+            "api_endpoints": [t.format(n=feature_name) for t in api_endpoints],
+            # Admin routes are added for all features
+            "admin_routes": [t.format(n=feature_name) for t in _ADMIN_ROUTE_TEMPLATES],
             "static_assets": []
         }
-        
-        # Generate main routes based on feature type
-        if feature_type == "gaming":
-            url_structure["main_routes"] = [
-                f"/play/{feature_name}",
-                f"/play/{feature_name}/rules",
-                f"/play/{feature_name}/stats",
-                f"/play/{feature_name}/history"
-            ]
-            url_structure["api_endpoints"] = [
-                f"/api/game/{feature_name}/session",
-                f"/api/game/{feature_name}/bet",
-                f"/api/game/{feature_name}/result"
-            ]
-            
-        elif feature_type == "social":
-            url_structure["main_routes"] = [
-                f"/community/{feature_name}",
-                f"/community/{feature_name}/feed",
-                f"/community/{feature_name}/members"
-            ]
-            url_structure["api_endpoints"] = [
-                f"/api/social/{feature_name}",
-                f"/api/social/{feature_name}/posts",
-                f"/api/social/{feature_name}/interactions"
-            ]
-            
-        elif feature_type == "education":
-            url_structure["main_routes"] = [
-                f"/learn/{feature_name}",
-                f"/learn/{feature_name}/modules",
-                f"/learn/{feature_name}/practice"
-            ]
-            url_structure["api_endpoints"] = [
-                f"/api/education/{feature_name}",
-                f"/api/education/{feature_name}/progress",
-                f"/api/education/{feature_name}/complete"
-            ]
-        
-        else:  # standard feature
-            url_structure["main_routes"] = [
-                f"/{feature_name}",
-                f"/{feature_name}/overview",
-                f"/{feature_name}/settings"
-            ]
-            url_structure["api_endpoints"] = [
-                f"/api/{feature_name}",
-                f"/api/{feature_name}/data",
-                f"/api/{feature_name}/update"
-            ]
-        
-        # Add admin routes for all features
-        url_structure["admin_routes"] = [
-            f"/admin/{feature_name}",
-            f"/admin/{feature_name}/analytics",
-            f"/admin/{feature_name}/settings"
-        ]
-        
-        return url_structure
     
     def validate_url_schema(self, url: str) -> Dict[str, any]:
         """Validate if a URL follows the established patterns"""
@@ -455,13 +709,13 @@ class SiteArchitectureSpecialist:
             validation["seo_score"] -= 20
         
         # Check for special characters
-        if any(char in url for char in ['?', '&', '#', '@', '!', '$']):
+        if _HAS_SPECIAL(url):
             validation["issues"].append("Contains special characters")
             validation["suggestions"].append("Use hyphens instead of special characters")
             validation["seo_score"] -= 15
         
         # Check for uppercase
-        if url != url.lower():
+        if _HAS_UPPER(url):
             validation["issues"].append("Contains uppercase letters")
             validation["suggestions"].append("Convert to lowercase")
             validation["seo_score"] -= 10
@@ -472,7 +726,11 @@ class SiteArchitectureSpecialist:
             validation["seo_score"] -= 5
         
         # Check depth
-        depth = len([p for p in url.split('/') if p])
+        if '//' in url:
+            depth = len([p for p in url.split('/') if p])
+        else:
+            # Non-empty segments, counted without splitting the URL
+            depth = url.count('/') + bool(url) - url.startswith('/') - url.endswith('/')
         if depth > 4:
             validation["suggestions"].append(f"URL depth is {depth}, consider flattening")
             validation["seo_score"] -= 10
@@ -481,188 +739,48 @@ class SiteArchitectureSpecialist:
         
         return validation
     
-    def analyze_navigation_flow(self) -> Dict[str, List[str]]:
+    def analyze_navigation_flow(self) -> Mapping[str, Tuple[str, ...]]:
         """Analyze and optimize navigation paths between features"""
-        navigation_flows = {
-            "onboarding_flow": [
-                "/",
-                "/auth/signup",
-                "/onboarding/welcome",
-                "/onboarding/preferences",
-                "/learn/basics",
-                "/play"
-            ],
-            
-            "gaming_flow": [
-                "/dashboard",
-                "/play",
-                "/play/american",
-                "/wallet",
-                "/transactions"
-            ],
-            
-            "learning_flow": [
-                "/learn",
-                "/learn/basics",
-                "/learn/strategies",
-                "/learn/simulator",
-                "/play"
-            ],
-            
-            "social_flow": [
-                "/dashboard",
-                "/community",
-                "/friends",
-                "/leaderboards",
-                "/achievements"
-            ],
-            
-            "purchase_flow": [
-                "/wallet",
-                "/shop/gems",
-                "/shop/checkout",
-                "/shop/success",
-                "/play"
-            ],
-            
-            "vip_upgrade_flow": [
-                "/profile",
-                "/vip",
-                "/vip/benefits",
-                "/subscription",
-                "/subscription/success"
-            ]
-        }
-        
-        return navigation_flows
+        return self.navigation_flows
     
-    def recommend_seo_improvements(self) -> List[Dict]:
+    def recommend_seo_improvements(self) -> Tuple[Mapping[str, Any], ...]:
         """Provide SEO recommendations for URL structure"""
-        recommendations = [
-            {
-                "category": "URL Structure",
-                "recommendations": [
-                    "Use descriptive, keyword-rich URLs",
-                    "Keep URLs under 60 characters when possible",
-                    "Use hyphens to separate words",
-                    "Avoid dynamic parameters in URLs",
-                    "Implement canonical URLs for duplicate content"
-                ]
-            },
-            {
-                "category": "American Roulette Focus",
-                "recommendations": [
-                    "Include 'american-roulette' in gaming URLs",
-                    "Differentiate from European roulette in URL structure",
-                    "Highlight double-zero in URL parameters",
-                    "Create dedicated landing pages for American roulette",
-                    "Use location-based URLs for US markets"
-                ]
-            },
-            {
-                "category": "Deep Linking",
-                "recommendations": [
-                    "Implement app deep links for mobile",
-                    "Create shareable game session URLs",
-                    "Enable direct links to specific tables",
-                    "Support referral code in URLs",
-                    "Add social sharing parameters"
-                ]
-            },
-            {
-                "category": "Performance",
-                "recommendations": [
-                    "Implement URL prefetching for common paths",
-                    "Use route-based code splitting",
-                    "Cache static routes aggressively",
-                    "Optimize API endpoint grouping",
-                    "Implement progressive enhancement"
-                ]
-            }
-        ]
-        
-        return recommendations
+        return self.seo_recommendations
     
-    def generate_navigation_menu(self) -> Dict:
+    def generate_navigation_menu(self) -> Mapping[str, Tuple[Mapping[str, Any], ...]]:
         """Generate navigation menu structure"""
-        return {
-            "main_navigation": [
-                {"label": "Play", "path": "/play", "icon": "roulette", "auth": True},
-                {"label": "Learn", "path": "/learn", "icon": "education", "auth": False},
-                {"label": "Community", "path": "/community", "icon": "users", "auth": True},
-                {"label": "Tournaments", "path": "/tournaments", "icon": "trophy", "auth": True},
-                {"label": "VIP", "path": "/vip", "icon": "crown", "auth": True}
-            ],
-            
-            "user_menu": [
-                {"label": "Dashboard", "path": "/dashboard", "icon": "home"},
-                {"label": "Profile", "path": "/profile", "icon": "user"},
-                {"label": "Wallet", "path": "/wallet", "icon": "wallet"},
-                {"label": "Friends", "path": "/friends", "icon": "users"},
-                {"label": "Settings", "path": "/settings", "icon": "settings"},
-                {"label": "Logout", "path": "/auth/logout", "icon": "logout"}
-            ],
-            
-            "footer_navigation": [
-                {
-                    "section": "Game",
-                    "links": [
-                        {"label": "Play American Roulette", "path": "/play/american"},
-                        {"label": "Game Rules", "path": "/learn/rules"},
-                        {"label": "Strategies", "path": "/learn/strategies"},
-                        {"label": "Probability Calculator", "path": "/tools/calculator"}
-                    ]
-                },
-                {
-                    "section": "Community",
-                    "links": [
-                        {"label": "Forums", "path": "/community/forums"},
-                        {"label": "Leaderboards", "path": "/leaderboards"},
-                        {"label": "Tournaments", "path": "/tournaments"},
-                        {"label": "Watch Parties", "path": "/watch-parties"}
-                    ]
-                },
-                {
-                    "section": "Support",
-                    "links": [
-                        {"label": "Help Center", "path": "/help"},
-                        {"label": "Contact", "path": "/contact"},
-                        {"label": "Terms", "path": "/terms"},
-                        {"label": "Privacy", "path": "/privacy"}
-                    ]
-                }
-            ]
-        }
+        return self.navigation_menu
     
-    def _convert_to_xml(self, sitemap: Dict) -> str:
+    @staticmethod
+    def _convert_to_xml(sitemap: Dict) -> str:
         """Convert sitemap to XML format"""
-        xml = '<?xml version="1.0" encoding="UTF-8"?>\n'
-        xml += '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
-        
-        for url in sitemap["urls"]:
-            xml += '  <url>\n'
-            xml += f'    <loc>{url["loc"]}</loc>\n'
-            xml += f'    <lastmod>{url["lastmod"]}</lastmod>\n'
-            xml += f'    <changefreq>{url["changefreq"]}</changefreq>\n'
-            xml += f'    <priority>{url["priority"]}</priority>\n'
-            xml += '  </url>\n'
-        
-        xml += '</urlset>'
-        return xml
+        urls = ''.join(
+            f'  <url>\n'
+            f'    <loc>{url["loc"]}</loc>\n'
+            f'    <lastmod>{url["lastmod"]}</lastmod>\n'
+            f'    <changefreq>{url["changefreq"]}</changefreq>\n'
+            f'    <priority>{url["priority"]}</priority>\n'
+            f'  </url>\n'
+            for url in sitemap["urls"]
+        )
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+            f'{urls}</urlset>'
+        )
     
-    def _convert_to_text(self, sitemap: Dict) -> str:
+    @staticmethod
+    def _convert_to_text(sitemap: Dict) -> str:
         """Convert sitemap to readable text format"""
-        text = "ROULETTE COMMUNITY SITEMAP\n"
-        text += "=" * 50 + "\n\n"
-        
-        for url in sitemap["urls"]:
-            text += f"📍 {url['title']}\n"
-            text += f"   URL: {url['loc']}\n"
-            text += f"   Auth: {'Yes' if url['auth_required'] else 'No'}\n"
-            text += f"   Priority: {url['priority']}\n"
-            text += f"   Update: {url['changefreq']}\n\n"
-        
-        return text
+        urls = ''.join(
+            f"📍 {url['title']}\n"
+            f"   URL: {url['loc']}\n"
+            f"   Auth: {'Yes' if url['auth_required'] else 'No'}\n"
+            f"   Priority: {url['priority']}\n"
+            f"   Update: {url['changefreq']}\n\n"
+            for url in sitemap["urls"]
+        )
+        return f"ROULETTE COMMUNITY SITEMAP\n{'=' * 50}\n\n{urls}"
 
 
 # Example usage and testing
@@ -0,0 +1,106 @@
+"""
+Story Task Queue for Roulette Committee
+Runs developer implementation and tester verification as Celery tasks,
+with per-task status and results kept in Redis
+"""
+
+import asyncio
+import os
+import uuid
+from typing import Any, Dict, Optional
+
+import orjson
+
+from tester_fullstack_agents import FullStackDeveloperAgent, TesterAgent, to_json
+
+try:
+    import redis
+    from celery import Celery
+    CELERY_AVAILABLE = True
+except ImportError:
+    CELERY_AVAILABLE = False
+
+BROKER_URL = os.getenv('CELERY_BROKER_URL', 'redis://localhost:6379/0')
+STATE_URL = os.getenv('RC_TASK_STATE_URL', 'redis://localhost:6379/1')
+STATE_TTL_SECONDS = 7 * 24 * 3600
+
+# Redis client for task state, created on first use by _state()
+_state_client = None
+
+
+def _state_key(task_id: str) -> str:
+    """Redis key holding a task's status and result"""
+    return f"task:{task_id}"
+
+
+def _require_celery():
+    """Fail early with a clear message when the optional queue packages are missing"""
+    if not CELERY_AVAILABLE:
+        raise RuntimeError("The story task queue needs the celery and redis packages")
+
+
+def _state():
+    """Redis client for task state, connected lazily so importing this module stays cheap"""
+    global _state_client
+    if _state_client is None:
+        _state_client = redis.Redis.from_url(STATE_URL)
+    return _state_client
+
+
+def _set_state(task_id: str, status: str, result: Any = None):
+    """Record a task's status (and result once finished) under task:{task_id}"""
+    _state().set(_state_key(task_id), to_json({'status': status, 'result': result}), ex=STATE_TTL_SECONDS)
+
+
+if CELERY_AVAILABLE:
+    app = Celery('rc_story_tasks', broker=BROKER_URL)
+
+    @app.task(bind=True, max_retries=3, default_retry_delay=60)
+    def run_implement(self, task_id: str, story: Dict, project_path: str) -> str:
+        """Implement a story on a developer worker"""
+        _set_state(task_id, 'in_progress')
+        developer = FullStackDeveloperAgent(f"DEV-{self.request.hostname}")
+        implementation = asyncio.run(developer.implement_story(story, project_path))
+
+        if implementation['status'] == 'failed':
+            if self.request.retries < self.max_retries:
+                _set_state(task_id, 'retrying', implementation)
+                raise self.retry()
+            _set_state(task_id, 'failed', implementation)
+        else:
+            _set_state(task_id, 'completed', implementation)
+        return task_id
+
+    @app.task(bind=True, max_retries=3, default_retry_delay=60)
+    def run_test(self, task_id: str, story: Dict, implementation: Dict) -> str:
+        """Test an implemented story on a tester worker"""
+        _set_state(task_id, 'in_progress')
+        tester = TesterAgent(f"TEST-{self.request.hostname}")
+        test_result = asyncio.run(tester.test_story(story, implementation))
+        _set_state(task_id, 'completed', test_result)
+        return task_id
+
+
+def submit_implement(story: Dict, project_path: str) -> str:
+    """Queue a story for implementation and return its task id"""
+    _require_celery()
+    task_id = uuid.uuid4().hex
+    _set_state(task_id, 'queued')
+    run_implement.delay(task_id, story, project_path)
+    return task_id
+
+
+def submit_test(story: Dict, implementation: Dict) -> str:
+    """Queue an implemented story for testing and return its task id"""
+    _require_celery()
+    task_id = uuid.uuid4().hex
+    _set_state(task_id, 'queued')
+    run_test.delay(task_id, story, implementation)
+    return task_id
+
+
+def get_task_state(task_id: str) -> Optional[Dict]:
+    """Current status and result of a queued task, or None if unknown or expired"""
+    _require_celery()
+    payload = _state().get(_state_key(task_id))
+    return orjson.loads(payload) if payload is not None else None
@@ -4,221 +4,180 @@ Tester and Full-Stack Developer Agents for Roulette Committee
 Complete implementation and testing pipeline
 """
 
-import json
 import asyncio
-from datetime import datetime
+from collections import deque
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any, Tuple
-import random
+from string import Template
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Set, Tuple
+import io
+import tarfile
+import time
+import zlib
 
-class FullStackDeveloperAgent:
-    """
-    Full-Stack Developer Agent - Implements frontend, backend, and database
-    """
-    
-    def __init__(self, developer_id: str):
-        self.id = developer_id
-        self.current_story = None
-        self.completed_stories = []
-        self.tech_stack = {
-            'frontend': 'Next.js 14 + TypeScript + Tailwind',
-            'backend': 'Node.js + Express + Prisma',
-            'database': 'PostgreSQL',
-            'testing': 'Jest + Cypress'
-        }
-        
-    async def implement_story(self, story: Dict, project_path: str) -> Dict:
-        """
-        Implement a complete full-stack story
-        """
-        self.current_story = story
-        implementation = {
-            'story_id': story['id'],
-            'developer': self.id,
-            'status': 'in_progress',
-            'components': {},
-            'started_at': datetime.now().isoformat()
-        }
-        
-        try:
-            # Implement all layers based on story type
-            story_type = story.get('story_type', 'fullstack')
-            
-            # Frontend implementation
-            implementation['components']['frontend'] = await self._implement_frontend(story, project_path)
-            
-            # Backend implementation
-            implementation['components']['backend'] = await self._implement_backend(story, project_path)
-            
-            # Database implementation
-            implementation['components']['database'] = await self._implement_database(story, project_path)
-            
-            # API routes
-            implementation['components']['api'] = await self._implement_api(story, project_path)
-            
-            # Tests
-            implementation['components']['tests'] = await self._implement_tests(story, project_path)
-            
-            implementation['status'] = 'ready_for_testing'
-            implementation['completed_at'] = datetime.now().isoformat()
-            
-            # Mark implementation details for validators
-            implementation['accessibility_compliant'] = True
-            implementation['performance_optimized'] = True
-            implementation['responsive'] = True
-            implementation['uses_design_system_colors'] = True
-            implementation['uses_design_system_typography'] = True
-            implementation['uses_design_system_spacing'] = True
-            implementation['components_consistent'] = True
-            
-        except Exception as e:
-            implementation['status'] = 'failed'
-            implementation['error'] = str(e)
-        
-        self.completed_stories.append(implementation)
-        self.current_story = None
-        
-        return implementation
-    
-    async def _implement_frontend(self, story: Dict, project_path: str) -> Dict:
-        """Implement frontend components"""
-        # Create Next.js page/component
-        component_name = story['id'].replace('-', '')
-        component_path = Path(project_path) / 'src' / 'app' / f"{story['id']}" / 'page.tsx'
-        component_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Generate TypeScript React component
-        component_code = f"""
+import orjson
+
+try:
+    import aiofiles
+    AIOFILES_AVAILABLE = True
+except ImportError:
+    AIOFILES_AVAILABLE = False
+
+
+def _compile_template(text: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Split ``$name``/``${name}`` template text into literal chunks and placeholder names"""
+    template = Template(text)
+    parts, slots, chunk = [], [], []
+    pos = 0
+    for match in template.pattern.finditer(text):
+        chunk.append(text[pos:match.start()])
+        pos = match.end()
+        if match.group('escaped') is not None:
+            chunk.append(template.delimiter)
+            continue
+        name = match.group('named') or match.group('braced')
+        if name is None:
+            raise ValueError(f"Invalid placeholder in template at offset {match.start()}")
+        parts.append(''.join(chunk))
+        slots.append(name)
+        chunk = []
+    chunk.append(text[pos:])
+    parts.append(''.join(chunk))
+    return tuple(parts), tuple(slots)
+
+
+def _render(compiled: Tuple[Tuple[str, ...], Tuple[str, ...]], ctx: Dict[str, str]) -> str:
+    """Fill a compiled template: literal chunks interleaved with context values"""
+    parts, slots = compiled
+    out = [parts[0]]
+    for name, part in zip(slots, parts[1:]):
+        out.append(ctx[name])
+        out.append(part)
+    return ''.join(out)
+
+
+# Source templates for generated story code, pre-split at import and filled
+# from FullStackDeveloperAgent._story_context
+_FRONTEND_TEMPLATE = _compile_template("""
 'use client';
 
-import {{ useState, useEffect }} from 'react';
-import {{ Button }} from '@/components/ui/button';
-import {{ Card }} from '@/components/ui/card';
-import {{ useToast }} from '@/hooks/use-toast';
+import { useState, useEffect } from 'react';
+import { Button } from '@/components/ui/button';
+import { Card } from '@/components/ui/card';
+import { useToast } from '@/hooks/use-toast';
 
-// {story['title']}
-// {story.get('user_story', '')}
+// ${title}
+// ${user_story}
 
-interface {component_name}Props {{
+interface ${component_name}Props {
   userId?: string;
   committeeId?: string;
-}}
+}
 
-export default function {component_name}Page({{ userId, committeeId }}: {component_name}Props) {{
+export default function ${component_name}Page({ userId, committeeId }: ${component_name}Props) {
   const [loading, setLoading] = useState(false);
   const [data, setData] = useState<any>(null);
-  const {{ toast }} = useToast();
+  const { toast } = useToast();
   
-  useEffect(() => {{
+  useEffect(() => {
     loadData();
-  }}, []);
+  }, []);
   
-  const loadData = async () => {{
+  const loadData = async () => {
     setLoading(true);
-    try {{
-      const response = await fetch(`/api/{story['id']}`);
+    try {
+      const response = await fetch(`/api/${story_id}`);
       const result = await response.json();
       setData(result);
-    }} catch (error) {{
-      toast({{
+    } catch (error) {
+      toast({
         title: 'Error',
         description: 'Failed to load data',
         variant: 'destructive'
-      }});
-    }} finally {{
+      });
+    } finally {
       setLoading(false);
-    }}
-  }};
+    }
+  };
   
-  const handleAction = async () => {{
-    try {{
-      const response = await fetch(`/api/{story['id']}`, {{
+  const handleAction = async () => {
+    try {
+      const response = await fetch(`/api/${story_id}`, {
         method: 'POST',
-        headers: {{ 'Content-Type': 'application/json' }},
-        body: JSON.stringify({{ userId, committeeId }})
-      }});
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ userId, committeeId })
+      });
       
-      if (response.ok) {{
-        toast({{
+      if (response.ok) {
+        toast({
           title: 'Success',
           description: 'Action completed successfully'
-        }});
+        });
         await loadData();
-      }}
-    }} catch (error) {{
-      toast({{
+      }
+    } catch (error) {
+      toast({
         title: 'Error',
         description: 'Action failed',
         variant: 'destructive'
-      }});
-    }}
-  }};
+      });
+    }
+  };
   
   return (
     <div className="container mx-auto py-8">
       <Card className="p-6">
-        <h1 className="text-3xl font-bold mb-4">{story['title']}</h1>
+        <h1 className="text-3xl font-bold mb-4">${title}</h1>
         
-        {{loading ? (
+        {loading ? (
           <div className="flex justify-center py-8">
             <div className="animate-spin rounded-full h-8 w-8 border-b-2 border-primary"></div>
           </div>
         ) : (
           <div className="space-y-4">
-            {{data && (
+            {data && (
               <div className="bg-muted p-4 rounded-lg">
-                <pre className="text-sm">{{JSON.stringify(data, null, 2)}}</pre>
+                <pre className="text-sm">{JSON.stringify(data, null, 2)}</pre>
               </div>
-            )}}
+            )}
             
             <div className="flex gap-4">
-              <Button onClick={{handleAction}} variant="default">
+              <Button onClick={handleAction} variant="default">
                 Perform Action
               </Button>
-              <Button onClick={{loadData}} variant="outline">
+              <Button onClick={loadData} variant="outline">
                 Refresh
               </Button>
             </div>
           </div>
-        )}}
+        )}
       </Card>
     </div>
   );
-}}
-"""
-        
-        component_path.write_text(component_code)
-        
-        return {
-            'file': str(component_path),
-            'type': 'React Component',
-            'lines': len(component_code.split('\n'))
-        }
-    
-    async def _implement_backend(self, story: Dict, project_path: str) -> Dict:
-        """Implement backend service"""
-        service_path = Path(project_path) / 'src' / 'services' / f"{story['id']}.service.ts"
-        service_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        service_code = f"""
-import {{ PrismaClient }} from '@prisma/client';
-import {{ Logger }} from '@/utils/logger';
-import {{ ValidationError, NotFoundError }} from '@/utils/errors';
+}
+""")
+
+_BACKEND_TEMPLATE = _compile_template("""
+import { PrismaClient } from '@prisma/client';
+import { Logger } from '@/utils/logger';
+import { ValidationError, NotFoundError } from '@/utils/errors';
 
 const prisma = new PrismaClient();
-const logger = new Logger('{story['id']}-service');
+const logger = new Logger('${story_id}-service');
 
-// {story['title']} Service
-// {story.get('user_story', '')}
+// ${title} Service
+// ${user_story}
 
-export class {story['id'].replace('-', '')}Service {{
+export class ${component_name}Service {
   /**
    * Process the main business logic
    */
-  async process(data: any) {{
-    logger.info('Processing request', {{ data }});
+  async process(data: any) {
+    logger.info('Processing request', { data });
     
-    try {{
+    try {
       // Validate input
       this.validate(data);
       
@@ -226,124 +185,97 @@ export class {story['id'].replace('-', '')}Service {{
       const result = await this.executeBusinessLogic(data);
       
       // Log success
-      logger.info('Processing completed', {{ result }});
+      logger.info('Processing completed', { result });
       
-      return {{
+      return {
         success: true,
         data: result
-      }};
-    }} catch (error) {{
+      };
+    } catch (error) {
       logger.error('Processing failed', error);
       throw error;
-    }}
-  }}
+    }
+  }
   
   /**
    * Validate input data
    */
-  private validate(data: any) {{
-    if (!data) {{
+  private validate(data: any) {
+    if (!data) {
       throw new ValidationError('Data is required');
-    }}
+    }
     
     // Add specific validation rules
-    {self._generate_validation_rules(story)}
-  }}
+    ${validation_rules}
+  }
   
   /**
    * Execute core business logic
    */
-  private async executeBusinessLogic(data: any) {{
+  private async executeBusinessLogic(data: any) {
     // Database operations
-    const result = await prisma.$transaction(async (tx) => {{
+    const result = await prisma.$$transaction(async (tx) => {
       // Implement business logic
       // This would be customized based on the story requirements
       
-      return {{ processed: true, timestamp: new Date() }};
-    }});
+      return { processed: true, timestamp: new Date() };
+    });
     
     return result;
-  }}
+  }
   
   /**
    * Get data by ID
    */
-  async getById(id: string) {{
-    const item = await prisma.{story['id'].replace('-', '_').lower()}.findUnique({{
-      where: {{ id }}
-    }});
+  async getById(id: string) {
+    const item = await prisma.${model_name}.findUnique({
+      where: { id }
+    });
     
-    if (!item) {{
+    if (!item) {
       throw new NotFoundError('Item not found');
-    }}
+    }
     
     return item;
-  }}
+  }
   
   /**
    * List all items with pagination
    */
-  async list(page: number = 1, limit: number = 10) {{
+  async list(page: number = 1, limit: number = 10) {
     const offset = (page - 1) * limit;
     
     const [items, total] = await Promise.all([
-      prisma.{story['id'].replace('-', '_').lower()}.findMany({{
+      prisma.${model_name}.findMany({
         skip: offset,
         take: limit,
-        orderBy: {{ createdAt: 'desc' }}
-      }}),
-      prisma.{story['id'].replace('-', '_').lower()}.count()
+        orderBy: { createdAt: 'desc' }
+      }),
+      prisma.${model_name}.count()
     ]);
     
-    return {{
+    return {
       items,
       total,
       page,
       totalPages: Math.ceil(total / limit)
-    }};
-  }}
-}}
+    };
+  }
+}
 
-export default new {story['id'].replace('-', '')}Service();
-"""
-        
-        service_path.write_text(service_code)
-        
-        return {
-            'file': str(service_path),
-            'type': 'TypeScript Service',
-            'lines': len(service_code.split('\n'))
-        }
-    
-    def _generate_validation_rules(self, story: Dict) -> str:
-        """Generate validation rules based on story"""
-        rules = []
-        
-        if 'auth' in story['title'].lower():
-            rules.append("if (!data.email || !data.password) { throw new ValidationError('Email and password required'); }")
-        elif 'committee' in story['title'].lower():
-            rules.append("if (!data.name || !data.description) { throw new ValidationError('Name and description required'); }")
-        else:
-            rules.append("// Add custom validation rules here")
-        
-        return '\n    '.join(rules)
-    
-    async def _implement_database(self, story: Dict, project_path: str) -> Dict:
-        """Implement database schema"""
-        schema_path = Path(project_path) / 'prisma' / 'migrations' / f"{story['id']}.prisma"
-        schema_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Generate Prisma schema
-        schema_code = f"""
-// {story['title']} Database Schema
+export default new ${component_name}Service();
+""")
 
-model {story['id'].replace('-', '')} {{
+_DATABASE_TEMPLATE = _compile_template("""
+// ${title} Database Schema
+
+model ${component_name} {
   id          String   @id @default(cuid())
   createdAt   DateTime @default(now())
   updatedAt   DateTime @updatedAt
   
   // Story-specific fields
-  {self._generate_schema_fields(story)}
+  ${schema_fields}
   
   // Relations
   userId      String
@@ -351,270 +283,528 @@ model {story['id'].replace('-', '')} {{
   
   @@index([userId])
   @@index([createdAt])
-}}
-"""
-        
-        schema_path.write_text(schema_code)
-        
-        return {
-            'file': str(schema_path),
-            'type': 'Prisma Schema',
-            'lines': len(schema_code.split('\n'))
-        }
-    
-    def _generate_schema_fields(self, story: Dict) -> str:
-        """Generate schema fields based on story"""
-        fields = []
-        
-        if 'committee' in story['title'].lower():
-            fields.extend([
-                "name        String",
-                "description String?",
-                "isActive    Boolean  @default(true)",
-                "memberCount Int      @default(0)"
-            ])
-        elif 'voting' in story['title'].lower():
-            fields.extend([
-                "title       String",
-                "options     Json",
-                "startTime   DateTime",
-                "endTime     DateTime",
-                "status      String   @default('pending')"
-            ])
-        else:
-            fields.extend([
-                "data        Json",
-                "status      String   @default('active')"
-            ])
-        
-        return '\n  '.join(fields)
-    
-    async def _implement_api(self, story: Dict, project_path: str) -> Dict:
-        """Implement API routes"""
-        api_path = Path(project_path) / 'src' / 'app' / 'api' / story['id'] / 'route.ts'
-        api_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        api_code = f"""
-import {{ NextRequest, NextResponse }} from 'next/server';
-import {{ getServerSession }} from 'next-auth';
-import {{ authOptions }} from '@/lib/auth';
-import service from '@/services/{story['id']}.service';
-import {{ handleApiError }} from '@/utils/api-errors';
+}
+""")
 
-// {story['title']} API Routes
+_API_TEMPLATE = _compile_template("""
+import { NextRequest, NextResponse } from 'next/server';
+import { getServerSession } from 'next-auth';
+import { authOptions } from '@/lib/auth';
+import service from '@/services/${story_id}.service';
+import { handleApiError } from '@/utils/api-errors';
 
-export async function GET(req: NextRequest) {{
-  try {{
+// ${title} API Routes
+
+export async function GET(req: NextRequest) {
+  try {
     const session = await getServerSession(authOptions);
-    if (!session) {{
-      return NextResponse.json({{ error: 'Unauthorized' }}, {{ status: 401 }});
-    }}
+    if (!session) {
+      return NextResponse.json({ error: 'Unauthorized' }, { status: 401 });
+    }
     
-    const {{ searchParams }} = new URL(req.url);
+    const { searchParams } = new URL(req.url);
     const page = parseInt(searchParams.get('page') || '1');
     const limit = parseInt(searchParams.get('limit') || '10');
     
     const result = await service.list(page, limit);
     
     return NextResponse.json(result);
-  }} catch (error) {{
+  } catch (error) {
     return handleApiError(error);
-  }}
-}}
+  }
+}
 
-export async function POST(req: NextRequest) {{
-  try {{
+export async function POST(req: NextRequest) {
+  try {
     const session = await getServerSession(authOptions);
-    if (!session) {{
-      return NextResponse.json({{ error: 'Unauthorized' }}, {{ status: 401 }});
-    }}
+    if (!session) {
+      return NextResponse.json({ error: 'Unauthorized' }, { status: 401 });
+    }
     
     const data = await req.json();
-    const result = await service.process({{
+    const result = await service.process({
       ...data,
       userId: session.user.id
-    }});
+    });
     
     return NextResponse.json(result);
-  }} catch (error) {{
+  } catch (error) {
     return handleApiError(error);
-  }}
-}}
+  }
+}
 
-export async function PUT(req: NextRequest) {{
-  try {{
+export async function PUT(req: NextRequest) {
+  try {
     const session = await getServerSession(authOptions);
-    if (!session) {{
-      return NextResponse.json({{ error: 'Unauthorized' }}, {{ status: 401 }});
-    }}
+    if (!session) {
+      return NextResponse.json({ error: 'Unauthorized' }, { status: 401 });
+    }
     
     const data = await req.json();
     const result = await service.update(data);
     
     return NextResponse.json(result);
-  }} catch (error) {{
+  } catch (error) {
     return handleApiError(error);
-  }}
-}}
+  }
+}
 
-export async function DELETE(req: NextRequest) {{
-  try {{
+export async function DELETE(req: NextRequest) {
+  try {
     const session = await getServerSession(authOptions);
-    if (!session) {{
-      return NextResponse.json({{ error: 'Unauthorized' }}, {{ status: 401 }});
-    }}
+    if (!session) {
+      return NextResponse.json({ error: 'Unauthorized' }, { status: 401 });
+    }
     
-    const {{ searchParams }} = new URL(req.url);
+    const { searchParams } = new URL(req.url);
     const id = searchParams.get('id');
     
-    if (!id) {{
-      return NextResponse.json({{ error: 'ID required' }}, {{ status: 400 }});
-    }}
+    if (!id) {
+      return NextResponse.json({ error: 'ID required' }, { status: 400 });
+    }
     
     await service.delete(id);
     
-    return NextResponse.json({{ success: true }});
-  }} catch (error) {{
+    return NextResponse.json({ success: true });
+  } catch (error) {
     return handleApiError(error);
-  }}
-}}
-"""
-        
-        api_path.write_text(api_code)
-        
-        return {
-            'file': str(api_path),
-            'type': 'Next.js API Route',
-            'lines': len(api_code.split('\n'))
-        }
-    
-    async def _implement_tests(self, story: Dict, project_path: str) -> Dict:
-        """Implement tests for the story"""
-        test_path = Path(project_path) / 'tests' / f"{story['id']}.test.ts"
-        test_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        test_code = f"""
-import {{ describe, it, expect, jest, beforeEach, afterEach }} from '@jest/globals';
-import {{ render, screen, fireEvent, waitFor }} from '@testing-library/react';
-import {{ {story['id'].replace('-', '')}Service }} from '@/services/{story['id']}.service';
-import {story['id'].replace('-', '')}Page from '@/app/{story['id']}/page';
+  }
+}
+""")
 
-// Tests for {story['title']}
+_UNIT_TEST_TEMPLATE = _compile_template("""
+import { describe, it, expect, jest, beforeEach, afterEach } from '@jest/globals';
+import { render, screen, fireEvent, waitFor } from '@testing-library/react';
+import { ${component_name}Service } from '@/services/${story_id}.service';
+import ${component_name}Page from '@/app/${story_id}/page';
 
-describe('{story['id']} Service', () => {{
-  beforeEach(() => {{
+// Tests for ${title}
+
+describe('${story_id} Service', () => {
+  beforeEach(() => {
     jest.clearAllMocks();
-  }});
+  });
   
-  describe('process', () => {{
-    it('should process valid data successfully', async () => {{
-      const testData = {{ test: 'data' }};
+  describe('process', () => {
+    it('should process valid data successfully', async () => {
+      const testData = { test: 'data' };
       const result = await service.process(testData);
       
       expect(result.success).toBe(true);
       expect(result.data).toBeDefined();
-    }});
+    });
     
-    it('should throw error for invalid data', async () => {{
+    it('should throw error for invalid data', async () => {
       await expect(service.process(null)).rejects.toThrow('Data is required');
-    }});
-  }});
+    });
+  });
   
-  describe('validation', () => {{
-    it('should validate required fields', () => {{
-      const invalidData = {{}};
+  describe('validation', () => {
+    it('should validate required fields', () => {
+      const invalidData = {};
       expect(() => service.validate(invalidData)).toThrow();
-    }});
-  }});
-}});
-
-describe('{story['id']} Component', () => {{
-  it('should render without crashing', () => {{
-    render(<{story['id'].replace('-', '')}Page />);
-    expect(screen.getByText(/{story['title']}/i)).toBeInTheDocument();
-  }});
+    });
+  });
+});
+
+describe('${story_id} Component', () => {
+  it('should render without crashing', () => {
+    render(<${component_name}Page />);
+    expect(screen.getByText(/${title}/i)).toBeInTheDocument();
+  });
   
-  it('should handle loading state', async () => {{
-    render(<{story['id'].replace('-', '')}Page />);
+  it('should handle loading state', async () => {
+    render(<${component_name}Page />);
     expect(screen.getByTestId('loading-spinner')).toBeInTheDocument();
     
-    await waitFor(() => {{
+    await waitFor(() => {
       expect(screen.queryByTestId('loading-spinner')).not.toBeInTheDocument();
-    }});
-  }});
+    });
+  });
   
-  it('should handle user interactions', async () => {{
-    render(<{story['id'].replace('-', '')}Page />);
+  it('should handle user interactions', async () => {
+    render(<${component_name}Page />);
     
-    const button = screen.getByRole('button', {{ name: /perform action/i }});
+    const button = screen.getByRole('button', { name: /perform action/i });
     fireEvent.click(button);
     
-    await waitFor(() => {{
+    await waitFor(() => {
       expect(screen.getByText(/success/i)).toBeInTheDocument();
-    }});
-  }});
-}});
+    });
+  });
+});
 
 // Integration tests
-describe('{story['id']} Integration', () => {{
-  it('should work end-to-end', async () => {{
+describe('${story_id} Integration', () => {
+  it('should work end-to-end', async () => {
     // Test the complete flow
-    const testData = {{ userId: 'test-user', committeeId: 'test-committee' }};
+    const testData = { userId: 'test-user', committeeId: 'test-committee' };
     
     // Call API
-    const response = await fetch('/api/{story['id']}', {{
+    const response = await fetch('/api/${story_id}', {
       method: 'POST',
-      headers: {{ 'Content-Type': 'application/json' }},
+      headers: { 'Content-Type': 'application/json' },
       body: JSON.stringify(testData)
-    }});
+    });
     
     expect(response.ok).toBe(true);
     
     const result = await response.json();
     expect(result.success).toBe(true);
-  }});
-}});
-"""
-        
-        test_path.write_text(test_code)
-        
-        # Also create Cypress E2E test
-        e2e_path = Path(project_path) / 'cypress' / 'e2e' / f"{story['id']}.cy.ts"
-        e2e_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        e2e_code = f"""
-describe('{story['title']} E2E', () => {{
-  beforeEach(() => {{
+  });
+});
+""")
+
+_E2E_TEST_TEMPLATE = _compile_template("""
+describe('${title} E2E', () => {
+  beforeEach(() => {
     cy.login(); // Custom command for authentication
-    cy.visit('/{story["id"]}');
-  }});
+    cy.visit('/${story_id}');
+  });
   
-  it('should load the page', () => {{
-    cy.contains('{story['title']}').should('be.visible');
-  }});
+  it('should load the page', () => {
+    cy.contains('${title}').should('be.visible');
+  });
   
-  it('should perform main action', () => {{
+  it('should perform main action', () => {
     cy.get('[data-testid="action-button"]').click();
     cy.contains('Success').should('be.visible');
-  }});
+  });
   
-  it('should be responsive', () => {{
+  it('should be responsive', () => {
     // Test mobile
     cy.viewport('iphone-x');
-    cy.contains('{story['title']}').should('be.visible');
+    cy.contains('${title}').should('be.visible');
     
     // Test tablet
     cy.viewport('ipad-2');
-    cy.contains('{story['title']}').should('be.visible');
+    cy.contains('${title}').should('be.visible');
     
     // Test desktop
     cy.viewport(1920, 1080);
-    cy.contains('{story['title']}').should('be.visible');
-  }});
-}});
-"""
+    cy.contains('${title}').should('be.visible');
+  });
+});
+""")
+
+
+def _outcome_byte(story_id: str, lane: int) -> int:
+    """Deterministic 0-255 draw per story and test lane for the simulated runners"""
+    return (zlib.crc32(story_id.encode()) >> (8 * lane)) & 0xff
+
+
+# Completed implementations and test results kept per agent
+_HISTORY_LIMIT = 1000
+
+# Title-keyword variants of the generated validation rules and Prisma fields;
+# the handful of possible outputs are joined once here
+_VALIDATION_RULES = MappingProxyType({
+    'auth': "if (!data.email || !data.password) { throw new ValidationError('Email and password required'); }",
+    'committee': "if (!data.name || !data.description) { throw new ValidationError('Name and description required'); }",
+    'generic': "// Add custom validation rules here"
+})
+
+_SCHEMA_FIELDS = MappingProxyType({
+    'committee': '\n  '.join((
+        "name        String",
+        "description String?",
+        "isActive    Boolean  @default(true)",
+        "memberCount Int      @default(0)"
+    )),
+    'voting': '\n  '.join((
+        "title       String",
+        "options     Json",
+        "startTime   DateTime",
+        "endTime     DateTime",
+        "status      String   @default('pending')"
+    )),
+    'generic': '\n  '.join((
+        "data        Json",
+        "status      String   @default('active')"
+    ))
+})
+
+
+@lru_cache(maxsize=32)
+def _project_dirs(project_path: str) -> Mapping[str, Path]:
+    """Directories every story writes into, built once per project path"""
+    base = Path(project_path)
+    app = base / 'src' / 'app'
+    return MappingProxyType({
+        'app': app,
+        'api': app / 'api',
+        'services': base / 'src' / 'services',
+        'migrations': base / 'prisma' / 'migrations',
+        'tests': base / 'tests',
+        'e2e': base / 'cypress' / 'e2e'
+    })
+
+
+def _write_bundle(bundle_path: Path, project_path: str, files: List[Tuple[Path, str]]) -> str:
+    """Write a story's generated sources as one gzipped tar, paths relative to the project"""
+    bundle_path.parent.mkdir(parents=True, exist_ok=True)
+    with tarfile.open(bundle_path, 'w:gz') as tar:
+        for path, text in files:
+            data = text.encode()
+            info = tarfile.TarInfo(str(path.relative_to(project_path)))
+            info.size = len(data)
+            info.mtime = int(time.time())
+            tar.addfile(info, io.BytesIO(data))
+    return str(bundle_path)
+
+
+def to_json(obj: Any) -> bytes:
+    """Serialize implementation and test results; datetimes are emitted as RFC 3339"""
+    return orjson.dumps(obj)
+
+
+class FullStackDeveloperAgent:
+    """
+    Full-Stack Developer Agent - Implements frontend, backend, and database
+    """
+    
+    # Implementation layers, in the order implement_story generates them
+    _LAYERS = ('frontend', 'backend', 'database', 'api', 'tests')
+    
+    # Flags every finished implementation carries for the validators
+    _STATIC_MARKERS = MappingProxyType({
+        'accessibility_compliant': True,
+        'performance_optimized': True,
+        'responsive': True,
+        'uses_design_system_colors': True,
+        'uses_design_system_typography': True,
+        'uses_design_system_spacing': True,
+        'components_consistent': True
+    })
+    
+    # Shared by all developers: project paths with a skeleton, and directories known to exist.
+    # Entries can go stale if the tree is deleted; _write_source recreates missing directories
+    _skeleton_cache: Set[str] = set()
+    _created_dirs: Set[Path] = set()
+    
+    def __init__(self, developer_id: str, bundle_dir: Optional[str] = None):
+        self.id = developer_id
+        # When set, each story's sources go into one {story_id}.tar.gz here
+        # instead of being written into the project tree
+        self.bundle_dir = bundle_dir
+        self.current_story = None
+        self.completed_stories = deque(maxlen=_HISTORY_LIMIT)
+        self.tech_stack = {
+            'frontend': 'Next.js 14 + TypeScript + Tailwind',
+            'backend': 'Node.js + Express + Prisma',
+            'database': 'PostgreSQL',
+            'testing': 'Jest + Cypress'
+        }
         
-        e2e_path.write_text(e2e_code)
+    async def implement_story(self, story: Dict, project_path: str) -> Dict:
+        """
+        Implement a complete full-stack story
+        """
+        self.current_story = story
+        implementation = {
+            'story_id': story['id'],
+            'developer': self.id,
+            'status': 'in_progress',
+            'components': {},
+            'started_at': datetime.now(timezone.utc)
+        }
+        
+        try:
+            # Implement all layers based on story type
+            story_type = story.get('story_type', 'fullstack')
+            ctx = self._story_context(story)
+            paths = self._story_paths(project_path, ctx['story_id'])
+            
+            # Generate every layer first, reporting every failing layer rather
+            # than just the first, then write the story's files in one batch
+            files: List[Tuple[Path, str]] = []
+            errors = []
+            for layer, build in zip(self._LAYERS, (
+                self._implement_frontend, self._implement_backend, self._implement_database,
+                self._implement_api, self._implement_tests
+            )):
+                try:
+                    implementation['components'][layer] = build(ctx, paths, files)
+                except Exception as e:
+                    errors.append(f"{layer}: {e}")
+            if errors:
+                raise RuntimeError('; '.join(errors))
+            
+            if self.bundle_dir is None:
+                if project_path not in self._skeleton_cache:
+                    await asyncio.to_thread(self.ensure_project_skeleton, project_path)
+                await asyncio.gather(*(self._write_source(path, text) for path, text in files))
+            else:
+                implementation['bundle'] = await asyncio.to_thread(
+                    _write_bundle, Path(self.bundle_dir) / f"{ctx['story_id']}.tar.gz", project_path, files
+                )
+            
+            implementation['status'] = 'ready_for_testing'
+            implementation['completed_at'] = datetime.now(timezone.utc)
+            
+            # Mark implementation details for validators
+            implementation.update(self._STATIC_MARKERS)
+            
+        except Exception as e:
+            implementation['status'] = 'failed'
+            implementation['error'] = str(e)
+        
+        self.completed_stories.append(implementation)
+        self.current_story = None
+        
+        return implementation
+    
+    @classmethod
+    def ensure_project_skeleton(cls, project_path: str):
+        """Create the standard project directories once per project path"""
+        if project_path in cls._skeleton_cache:
+            return
+        
+        for path in _project_dirs(project_path).values():
+            path.mkdir(parents=True, exist_ok=True)
+            cls._created_dirs.add(path)
+        cls._skeleton_cache.add(project_path)
+    
+    def _story_paths(self, project_path: str, story_id: str) -> Dict[str, Path]:
+        """Every file path a story writes, built once from the cached project directories"""
+        dirs = _project_dirs(project_path)
+        return {
+            'page': dirs['app'] / story_id / 'page.tsx',
+            'service': dirs['services'] / f"{story_id}.service.ts",
+            'schema': dirs['migrations'] / f"{story_id}.prisma",
+            'api_route': dirs['api'] / story_id / 'route.ts',
+            'unit_test': dirs['tests'] / f"{story_id}.test.ts",
+            'e2e_test': dirs['e2e'] / f"{story_id}.cy.ts"
+        }
+    
+    def _story_context(self, story: Dict) -> Dict[str, str]:
+        """Derive every template value for a story once"""
+        story_id = story['id']
+        title = story['title']
+        title_lower = title.lower()
+        return {
+            'story_id': story_id,
+            'component_name': story_id.replace('-', ''),
+            'model_name': story_id.replace('-', '_').lower(),
+            'title': title,
+            'user_story': story.get('user_story', ''),
+            'validation_rules': self._generate_validation_rules(story, title_lower),
+            'schema_fields': self._generate_schema_fields(story, title_lower)
+        }
+    
+    async def _write_source(self, path: Path, text: str):
+        """Write a generated source file without blocking the event loop"""
+        parent = path.parent
+        if parent not in self._created_dirs:
+            await asyncio.to_thread(parent.mkdir, parents=True, exist_ok=True)
+            self._created_dirs.add(parent)
+        
+        try:
+            await self._write_text(path, text)
+        except FileNotFoundError:
+            # The cached directory was removed since it was created; recreate it and retry
+            await asyncio.to_thread(parent.mkdir, parents=True, exist_ok=True)
+            await self._write_text(path, text)
+    
+    @staticmethod
+    async def _write_text(path: Path, text: str):
+        """Write text to path with aiofiles, or on a worker thread without it"""
+        if AIOFILES_AVAILABLE:
+            async with aiofiles.open(path, 'w') as f:
+                await f.write(text)
+        else:
+            await asyncio.to_thread(path.write_text, text)
+    
+    def _implement_frontend(self, ctx: Dict[str, str], paths: Dict[str, Path], files: List[Tuple[Path, str]]) -> Dict:
+        """Implement frontend components"""
+        # Create Next.js page/component
+        component_path = paths['page']
+        
+        # Generate TypeScript React component
+        component_code = _render(_FRONTEND_TEMPLATE, ctx)
+        
+        files.append((component_path, component_code))
+        
+        return {
+            'file': str(component_path),
+            'type': 'React Component',
+            'lines': component_code.count('\n') + 1
+        }
+    
+    def _implement_backend(self, ctx: Dict[str, str], paths: Dict[str, Path], files: List[Tuple[Path, str]]) -> Dict:
+        """Implement backend service"""
+        service_path = paths['service']
+        
+        service_code = _render(_BACKEND_TEMPLATE, ctx)
+        
+        files.append((service_path, service_code))
+        
+        return {
+            'file': str(service_path),
+            'type': 'TypeScript Service',
+            'lines': service_code.count('\n') + 1
+        }
+    
+    def _generate_validation_rules(self, story: Dict, title: Optional[str] = None) -> str:
+        """Generate validation rules based on story"""
+        title = story['title'].lower() if title is None else title
+        if 'auth' in title:
+            return _VALIDATION_RULES['auth']
+        if 'committee' in title:
+            return _VALIDATION_RULES['committee']
+        return _VALIDATION_RULES['generic']
+    
+    def _implement_database(self, ctx: Dict[str, str], paths: Dict[str, Path], files: List[Tuple[Path, str]]) -> Dict:
+        """Implement database schema"""
+        schema_path = paths['schema']
+        
+        # Generate Prisma schema
+        schema_code = _render(_DATABASE_TEMPLATE, ctx)
+        
+        files.append((schema_path, schema_code))
+        
+        return {
+            'file': str(schema_path),
+            'type': 'Prisma Schema',
+            'lines': schema_code.count('\n') + 1
+        }
+    
+    def _generate_schema_fields(self, story: Dict, title: Optional[str] = None) -> str:
+        """Generate schema fields based on story"""
+        title = story['title'].lower() if title is None else title
+        if 'committee' in title:
+            return _SCHEMA_FIELDS['committee']
+        if 'voting' in title:
+            return _SCHEMA_FIELDS['voting']
+        return _SCHEMA_FIELDS['generic']
+    
+    def _implement_api(self, ctx: Dict[str, str], paths: Dict[str, Path], files: List[Tuple[Path, str]]) -> Dict:
+        """Implement API routes"""
+        api_path = paths['api_route']
+        
+        api_code = _render(_API_TEMPLATE, ctx)
+        
+        files.append((api_path, api_code))
+        
+        return {
+            'file': str(api_path),
+            'type': 'Next.js API Route',
+            'lines': api_code.count('\n') + 1
+        }
+    
+    def _implement_tests(self, ctx: Dict[str, str], paths: Dict[str, Path], files: List[Tuple[Path, str]]) -> Dict:
+        """Implement tests for the story"""
+        test_path = paths['unit_test']
+        
+        test_code = _render(_UNIT_TEST_TEMPLATE, ctx)
+        
+        # Also create Cypress E2E test
+        e2e_path = paths['e2e_test']
+        
+        e2e_code = _render(_E2E_TEST_TEMPLATE, ctx)
+        
+        files.append((test_path, test_code))
+        files.append((e2e_path, e2e_code))
         
         return {
             'unit_tests': str(test_path),
@@ -628,9 +818,14 @@ class TesterAgent:
     Tester Agent - Tests stories after developer implementation
     """
     
+    # Test categories, in the order test_story runs them
+    _TEST_CATEGORIES = ('unit', 'integration', 'e2e', 'performance', 'security', 'accessibility')
+    
     def __init__(self, tester_id: str):
         self.id = tester_id
-        self.test_results = []
+        self.test_results = deque(maxlen=_HISTORY_LIMIT)
+        # Latest result per story, so report lookups don't scan the history
+        self._results_by_story: Dict[str, Dict] = {}
         
     async def test_story(self, story: Dict, implementation: Dict) -> Dict:
         """
@@ -639,35 +834,51 @@ class TesterAgent:
         test_result = {
             'story_id': story['id'],
             'tester': self.id,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': datetime.now(timezone.utc),
             'tests': {},
             'status': 'testing'
         }
         
-        # Run different types of tests
-        test_result['tests']['unit'] = await self._run_unit_tests(story, implementation)
-        test_result['tests']['integration'] = await self._run_integration_tests(story, implementation)
-        test_result['tests']['e2e'] = await self._run_e2e_tests(story, implementation)
-        test_result['tests']['performance'] = await self._run_performance_tests(story, implementation)
-        test_result['tests']['security'] = await self._run_security_tests(story, implementation)
-        test_result['tests']['accessibility'] = await self._run_accessibility_tests(story, implementation)
-        
-        # Determine overall status
-        all_passed = all(
-            test['passed'] for test in test_result['tests'].values()
-        )
+        # Unit, integration and e2e runners wait on external tools, so they run
+        # side by side; the static checks do no I/O and are called directly
+        results = list(await asyncio.gather(
+            self._run_unit_tests(story, implementation),
+            self._run_integration_tests(story, implementation),
+            self._run_e2e_tests(story, implementation),
+            return_exceptions=True
+        ))
+        for run in (self._run_performance_tests, self._run_security_tests, self._run_accessibility_tests):
+            try:
+                results.append(run(story, implementation))
+            except Exception as e:
+                results.append(e)
+        
+        # Collect each category and fold the overall status in the same pass
+        all_passed = True
+        for category, result in zip(self._TEST_CATEGORIES, results):
+            if isinstance(result, BaseException):
+                # A crashed runner counts as a failed category rather than aborting the story
+                result = {'passed': False, 'error': str(result)}
+            test_result['tests'][category] = result
+            all_passed = all_passed and bool(result['passed'])
         
         test_result['status'] = 'passed' if all_passed else 'failed'
         test_result['ready_for_ux_review'] = all_passed
         
+        if len(self.test_results) == self.test_results.maxlen:
+            # The oldest result is about to be evicted; drop it from the index too
+            oldest = self.test_results[0]
+            if self._results_by_story.get(oldest['story_id']) is oldest:
+                del self._results_by_story[oldest['story_id']]
         self.test_results.append(test_result)
+        self._results_by_story[story['id']] = test_result
         return test_result
     
     async def _run_unit_tests(self, story: Dict, implementation: Dict) -> Dict:
         """Run unit tests"""
         # Simulate running unit tests
         return {
-            'passed': random.random() > 0.1,  # 90% pass rate
+            'passed': _outcome_byte(story['id'], 0) > 25,  # ~90% pass rate
             'coverage': 85,
             'tests_run': 25,
             'tests_passed': 24,
@@ -677,7 +888,7 @@ class TesterAgent:
     async def _run_integration_tests(self, story: Dict, implementation: Dict) -> Dict:
         """Run integration tests"""
         return {
-            'passed': random.random() > 0.15,  # 85% pass rate
+            'passed': _outcome_byte(story['id'], 1) > 38,  # ~85% pass rate
             'tests_run': 10,
             'tests_passed': 9,
             'duration': '5.1s'
@@ -686,14 +897,14 @@ class TesterAgent:
     async def _run_e2e_tests(self, story: Dict, implementation: Dict) -> Dict:
         """Run end-to-end tests"""
         return {
-            'passed': random.random() > 0.2,  # 80% pass rate
+            'passed': _outcome_byte(story['id'], 2) > 51,  # ~80% pass rate
             'scenarios': 5,
             'scenarios_passed': 4,
             'duration': '12.5s',
             'browsers_tested': ['Chrome', 'Firefox', 'Safari']
         }
     
-    async def _run_performance_tests(self, story: Dict, implementation: Dict) -> Dict:
+    def _run_performance_tests(self, story: Dict, implementation: Dict) -> Dict:
         """Run performance tests"""
         return {
             'passed': True,
@@ -703,7 +914,7 @@ class TesterAgent:
             'lighthouse_score': 95
         }
     
-    async def _run_security_tests(self, story: Dict, implementation: Dict) -> Dict:
+    def _run_security_tests(self, story: Dict, implementation: Dict) -> Dict:
         """Run security tests"""
         return {
             'passed': True,
@@ -713,7 +924,7 @@ class TesterAgent:
             'xss_protection': 'enabled'
         }
     
-    async def _run_accessibility_tests(self, story: Dict, implementation: Dict) -> Dict:
+    def _run_accessibility_tests(self, story: Dict, implementation: Dict) -> Dict:
         """Run accessibility tests"""
         return {
             'passed': True,
@@ -726,18 +937,23 @@ class TesterAgent:
     
     def generate_test_report(self, story_id: str) -> Dict:
         """Generate comprehensive test report"""
-        result = next((r for r in self.test_results if r['story_id'] == story_id), None)
+        result = self._results_by_story.get(story_id)
         
         if not result:
             return {'error': 'No test results found'}
         
+        total_tests = passed = 0
+        for test in result['tests'].values():
+            total_tests += test.get('tests_run', 1)
+            passed += test['passed']
+        
         return {
             'story_id': story_id,
             'overall_status': result['status'],
             'test_summary': {
-                'total_tests': sum(t.get('tests_run', 1) for t in result['tests'].values()),
-                'passed': sum(1 for t in result['tests'].values() if t['passed']),
-                'failed': sum(1 for t in result['tests'].values() if not t['passed']),
+                'total_tests': total_tests,
+                'passed': passed,
+                'failed': len(result['tests']) - passed,
             },
             'details': result['tests'],
             'recommendations': self._generate_recommendations(result),
@@ -6,9 +6,165 @@ Create designs, validate implementations, ensure consistency
 
 import json
 from datetime import datetime
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Mapping, Tuple
 from pathlib import Path
 
+from frozen_data import freeze, thaw
+
+# UX standards every implementation is validated against
+_USABILITY_CRITERIA: Mapping[str, Mapping] = freeze({
+    'accessibility': {
+        'wcag_level': 'AA',
+        'color_contrast': 4.5,
+        'font_size_min': 14,
+        'touch_target_min': 44,
+        'keyboard_navigation': True,
+        'screen_reader_compatible': True
+    },
+    'performance': {
+        'page_load_time': 2.0,  # seconds
+        'interaction_delay': 0.1,  # seconds
+        'animation_duration': 0.3,  # seconds
+        'scroll_performance': 60  # fps
+    },
+    'usability': {
+        'clicks_to_goal': 3,  # maximum
+        'error_recovery': True,
+        'clear_feedback': True,
+        'consistent_patterns': True,
+        'intuitive_navigation': True
+    }
+})
+
+# Design tokens shared by every UI designer
+_DESIGN_SYSTEM: Mapping[str, Mapping] = freeze({
+    'colors': {
+        'primary': {
+            '50': '#eff6ff',
+            '100': '#dbeafe',
+            '500': '#3b82f6',
+            '600': '#2563eb',
+            '700': '#1d4ed8',
+            '900': '#1e3a8a'
+        },
+        'secondary': {
+            '50': '#f0fdf4',
+            '100': '#dcfce7',
+            '500': '#10b981',
+            '600': '#059669',
+            '700': '#047857'
+        },
+        'neutral': {
+            '50': '#f9fafb',
+            '100': '#f3f4f6',
+            '200': '#e5e7eb',
+            '500': '#6b7280',
+            '800': '#1f2937',
+            '900': '#111827'
+        },
+        'success': '#10b981',
+        'warning': '#f59e0b',
+        'error': '#ef4444',
+        'info': '#3b82f6'
+    },
+    'typography': {
+        'fontFamily': {
+            'sans': 'Inter, system-ui, -apple-system, sans-serif',
+            'mono': 'JetBrains Mono, monospace'
+        },
+        'fontSize': {
+            'xs': '0.75rem',
+            'sm': '0.875rem',
+            'base': '1rem',
+            'lg': '1.125rem',
+            'xl': '1.25rem',
+            '2xl': '1.5rem',
+            '3xl': '1.875rem',
+            '4xl': '2.25rem'
+        },
+        'fontWeight': {
+            'normal': 400,
+            'medium': 500,
+            'semibold': 600,
+            'bold': 700
+        },
+        'lineHeight': {
+            'tight': 1.25,
+            'normal': 1.5,
+            'relaxed': 1.75
+        }
+    },
+    'spacing': {
+        'unit': 4,  # Base unit in px
+        'scale': [0, 4, 8, 12, 16, 20, 24, 32, 40, 48, 64, 80, 96, 128]
+    },
+    'borderRadius': {
+        'none': '0',
+        'sm': '0.125rem',
+        'md': '0.375rem',
+        'lg': '0.5rem',
+        'xl': '0.75rem',
+        'full': '9999px'
+    },
+    'shadows': {
+        'sm': '0 1px 2px 0 rgb(0 0 0 / 0.05)',
+        'md': '0 4px 6px -1px rgb(0 0 0 / 0.1)',
+        'lg': '0 10px 15px -3px rgb(0 0 0 / 0.1)',
+        'xl': '0 20px 25px -5px rgb(0 0 0 / 0.1)'
+    },
+    'animation': {
+        'duration': {
+            'fast': '150ms',
+            'normal': '300ms',
+            'slow': '500ms'
+        },
+        'easing': {
+            'linear': 'linear',
+            'in': 'cubic-bezier(0.4, 0, 1, 1)',
+            'out': 'cubic-bezier(0, 0, 0.2, 1)',
+            'inOut': 'cubic-bezier(0.4, 0, 0.2, 1)'
+        }
+    }
+})
+
+# Component styling rules, expressed in design-system token names
+_STYLE_GUIDE: Mapping[str, Mapping] = freeze({
+    'buttons': {
+        'primary': {
+            'bg': 'primary-600',
+            'text': 'white',
+            'hover': 'primary-700',
+            'padding': '12px 24px',
+            'borderRadius': 'md'
+        },
+        'secondary': {
+            'bg': 'white',
+            'text': 'neutral-700',
+            'border': 'neutral-300',
+            'hover': 'neutral-50',
+            'padding': '12px 24px',
+            'borderRadius': 'md'
+        }
+    },
+    'forms': {
+        'input': {
+            'border': 'neutral-300',
+            'bg': 'white',
+            'focus': 'primary-500',
+            'padding': '8px 12px',
+            'borderRadius': 'md'
+        }
+    },
+    'cards': {
+        'bg': 'white',
+        'border': 'neutral-200',
+        'shadow': 'md',
+        'padding': '24px',
+        'borderRadius': 'lg'
+    }
+})
+
+
 class UXDesignerAgent:
     """
     UX Designer Agent - Focuses on user experience, flow, and usability
@@ -19,33 +175,11 @@ class UXDesignerAgent:
         self.design_system = {}
         self.user_flows = {}
         self.wireframes = {}
-        self.usability_criteria = self._define_usability_criteria()
+        self.usability_criteria = _USABILITY_CRITERIA
         
-    def _define_usability_criteria(self) -> Dict:
+    def _define_usability_criteria(self) -> Mapping[str, Mapping]:
         """Define UX standards and criteria"""
-        return {
-            'accessibility': {
-                'wcag_level': 'AA',
-                'color_contrast': 4.5,
-                'font_size_min': 14,
-                'touch_target_min': 44,
-                'keyboard_navigation': True,
-                'screen_reader_compatible': True
-            },
-            'performance': {
-                'page_load_time': 2.0,  # seconds
-                'interaction_delay': 0.1,  # seconds
-                'animation_duration': 0.3,  # seconds
-                'scroll_performance': 60  # fps
-            },
-            'usability': {
-                'clicks_to_goal': 3,  # maximum
-                'error_recovery': True,
-                'clear_feedback': True,
-                'consistent_patterns': True,
-                'intuitive_navigation': True
-            }
-        }
+        return _USABILITY_CRITERIA
     
     def create_user_flows(self, features: List[Dict]) -> Dict:
         """Create user flows for all features"""
@@ -220,139 +354,29 @@ class UIDesignerAgent:
     
     def __init__(self, project_name: str = "Roulette Committee"):
         self.project = project_name
-        self.design_system = self._create_design_system()
+        self.design_system = _DESIGN_SYSTEM
         self.component_library = {}
-        self.style_guide = self._create_style_guide()
+        self.style_guide = _STYLE_GUIDE
+    
+    @property
+    def design_system(self) -> Mapping[str, Mapping]:
+        """Design tokens this designer works from (read-only; reassign to change them)"""
+        return self._design_system
+    
+    @design_system.setter
+    def design_system(self, value: Mapping[str, Mapping]):
+        # Stored frozen, so reassignment is the only way to change the tokens,
+        # and reassignment invalidates the generated CSS
+        self._design_system = freeze(value)
+        self._css_cache = None
         
-    def _create_design_system(self) -> Dict:
+    def _create_design_system(self) -> Mapping[str, Mapping]:
         """Create comprehensive design system"""
-        return {
-            'colors': {
-                'primary': {
-                    '50': '#eff6ff',
-                    '100': '#dbeafe',
-                    '500': '#3b82f6',
-                    '600': '#2563eb',
-                    '700': '#1d4ed8',
-                    '900': '#1e3a8a'
-                },
-                'secondary': {
-                    '50': '#f0fdf4',
-                    '100': '#dcfce7',
-                    '500': '#10b981',
-                    '600': '#059669',
-                    '700': '#047857'
-                },
-                'neutral': {
-                    '50': '#f9fafb',
-                    '100': '#f3f4f6',
-                    '200': '#e5e7eb',
-                    '500': '#6b7280',
-                    '800': '#1f2937',
-                    '900': '#111827'
-                },
-                'success': '#10b981',
-                'warning': '#f59e0b',
-                'error': '#ef4444',
-                'info': '#3b82f6'
-            },
-            'typography': {
-                'fontFamily': {
-                    'sans': 'Inter, system-ui, -apple-system, sans-serif',
-                    'mono': 'JetBrains Mono, monospace'
-                },
-                'fontSize': {
-                    'xs': '0.75rem',
-                    'sm': '0.875rem',
-                    'base': '1rem',
-                    'lg': '1.125rem',
-                    'xl': '1.25rem',
-                    '2xl': '1.5rem',
-                    '3xl': '1.875rem',
-                    '4xl': '2.25rem'
-                },
-                'fontWeight': {
-                    'normal': 400,
-                    'medium': 500,
-                    'semibold': 600,
-                    'bold': 700
-                },
-                'lineHeight': {
-                    'tight': 1.25,
-                    'normal': 1.5,
-                    'relaxed': 1.75
-                }
-            },
-            'spacing': {
-                'unit': 4,  # Base unit in px
-                'scale': [0, 4, 8, 12, 16, 20, 24, 32, 40, 48, 64, 80, 96, 128]
-            },
-            'borderRadius': {
-                'none': '0',
-                'sm': '0.125rem',
-                'md': '0.375rem',
-                'lg': '0.5rem',
-                'xl': '0.75rem',
-                'full': '9999px'
-            },
-            'shadows': {
-                'sm': '0 1px 2px 0 rgb(0 0 0 / 0.05)',
-                'md': '0 4px 6px -1px rgb(0 0 0 / 0.1)',
-                'lg': '0 10px 15px -3px rgb(0 0 0 / 0.1)',
-                'xl': '0 20px 25px -5px rgb(0 0 0 / 0.1)'
-            },
-            'animation': {
-                'duration': {
-                    'fast': '150ms',
-                    'normal': '300ms',
-                    'slow': '500ms'
-                },
-                'easing': {
-                    'linear': 'linear',
-                    'in': 'cubic-bezier(0.4, 0, 1, 1)',
-                    'out': 'cubic-bezier(0, 0, 0.2, 1)',
-                    'inOut': 'cubic-bezier(0.4, 0, 0.2, 1)'
-                }
-            }
-        }
+        return _DESIGN_SYSTEM
     
-    def _create_style_guide(self) -> Dict:
+    def _create_style_guide(self) -> Mapping[str, Mapping]:
         """Create style guide for consistent UI"""
-        return {
-            'buttons': {
-                'primary': {
-                    'bg': 'primary-600',
-                    'text': 'white',
-                    'hover': 'primary-700',
-                    'padding': '12px 24px',
-                    'borderRadius': 'md'
-                },
-                'secondary': {
-                    'bg': 'white',
-                    'text': 'neutral-700',
-                    'border': 'neutral-300',
-                    'hover': 'neutral-50',
-                    'padding': '12px 24px',
-                    'borderRadius': 'md'
-                }
-            },
-            'forms': {
-                'input': {
-                    'border': 'neutral-300',
-                    'bg': 'white',
-                    'focus': 'primary-500',
-                    'padding': '8px 12px',
-                    'borderRadius': 'md'
-                }
-            },
-            'cards': {
-                'bg': 'white',
-                'border': 'neutral-200',
-                'shadow': 'md',
-                'padding': '24px',
-                'borderRadius': 'lg'
-            }
-        }
+        return _STYLE_GUIDE
     
     def create_component_designs(self, story: Dict) -> Dict:
         """Create visual designs for story components"""
@@ -502,38 +526,43 @@ class UIDesignerAgent:
         return implementation.get('components_consistent', True)
     
     def export_design_tokens(self) -> Dict:
-        """Export design tokens for developers"""
-        return {
+        """Export design tokens for developers, as plain data they can modify or serialize"""
+        return thaw({
             'colors': self.design_system['colors'],
             'typography': self.design_system['typography'],
             'spacing': self.design_system['spacing'],
             'borderRadius': self.design_system['borderRadius'],
             'shadows': self.design_system['shadows'],
             'animation': self.design_system['animation']
-        }
+        })
     
     def generate_css_variables(self) -> str:
-        """Generate CSS variables from design system"""
-        css = ":root {\n"
+        """Generate CSS variables from design system (built once per design system)"""
+        if self._css_cache is not None:
+            return self._css_cache
+        
+        design_system = self._design_system
+        parts = [":root {\n"]
         
         # Colors
-        for color_name, shades in self.design_system['colors'].items():
-            if isinstance(shades, dict):
+        for color_name, shades in design_system['colors'].items():
+            if isinstance(shades, Mapping):
                 for shade, value in shades.items():
-                    css += f"  --color-{color_name}-{shade}: {value};\n"
+                    parts.append(f"  --color-{color_name}-{shade}: {value};\n")
             else:
-                css += f"  --color-{color_name}: {shades};\n"
+                parts.append(f"  --color-{color_name}: {shades};\n")
         
         # Typography
-        for size_name, size_value in self.design_system['typography']['fontSize'].items():
-            css += f"  --font-size-{size_name}: {size_value};\n"
+        for size_name, size_value in design_system['typography']['fontSize'].items():
+            parts.append(f"  --font-size-{size_name}: {size_value};\n")
         
         # Spacing
-        for i, space in enumerate(self.design_system['spacing']['scale']):
-            css += f"  --spacing-{i}: {space}px;\n"
+        for i, space in enumerate(design_system['spacing']['scale']):
+            parts.append(f"  --spacing-{i}: {space}px;\n")
         
-        css += "}\n"
-        return css
+        parts.append("}\n")
+        self._css_cache = ''.join(parts)
+        return self._css_cache
 
 
 if __name__ == "__main__":
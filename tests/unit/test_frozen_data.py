@@ -0,0 +1,38 @@
+"""
+Unit tests for the frozen data helpers.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+# Agent modules import their siblings by bare name
+sys.path.insert(0, str(ROOT / 'src' / 'agents'))
+
+frozen_data = pytest.importorskip('frozen_data')
+
+TABLE = {'colors': {'primary': {'500': '#3b82f6'}}, 'scale': [0, 4, {'px': 8}]}
+
+
+class TestFreeze:
+    """Test read-only copies of nested tables."""
+
+    def test_every_level_is_read_only(self):
+        """Test nested dicts and lists can no longer be changed."""
+        frozen = frozen_data.freeze(TABLE)
+
+        with pytest.raises(TypeError):
+            frozen['colors']['primary']['500'] = '#000000'
+        with pytest.raises(TypeError):
+            frozen['scale'][2]['px'] = 16
+        assert frozen['scale'][:2] == (0, 4)
+
+    def test_thaw_round_trips(self):
+        """Test thawing gives back plain data equal to the original."""
+        thawed = frozen_data.thaw(frozen_data.freeze(TABLE))
+
+        assert thawed == TABLE
+        assert json.loads(json.dumps(thawed)) == TABLE
@@ -0,0 +1,197 @@
+"""
+Unit tests for the RC workflow orchestrator.
+"""
+
+import asyncio
+import gc
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+# Agent modules import their siblings by bare name
+sys.path[:0] = [str(ROOT), str(ROOT / 'src' / 'agents')]
+
+rc = pytest.importorskip('rc_workflow_orchestrator')
+
+
+class _FakeGitManager:
+    """Stands in for GitWorkflowManager, which needs the project checkout."""
+
+    def __init__(self, repo_path):
+        self.repo_path = repo_path
+
+    async def get_status(self):
+        return {'has_changes': False, 'current_branch': 'main', 'total_commits': 0}
+
+    async def generate_commit_report(self):
+        return {'total_commits': 0}
+
+
+async def _skip_report(self, results):
+    """Drop the workflow report; it is written against the project checkout."""
+    self._output.clear()
+
+
+@pytest.fixture
+def orchestrator(tmp_path, monkeypatch):
+    """Create an orchestrator with its event log in a temporary directory."""
+    monkeypatch.setattr('src.agents.git_workflow_manager.GitWorkflowManager', _FakeGitManager)
+    orch = rc.RCWorkflowOrchestrator(state_db_path=str(tmp_path / 'state.db'))
+    yield orch
+    asyncio.run(orch.close())
+
+
+class TestWorkflowContext:
+    """Test the task-local workflow context."""
+
+    def test_workflow_id_is_reset_after_run(self, orchestrator, monkeypatch):
+        """Test the workflow id does not leak into code run after the workflow."""
+        monkeypatch.setattr(rc.RCWorkflowOrchestrator, '_generate_workflow_report', _skip_report)
+
+        async def run():
+            await orchestrator.execute_complete_workflow({'name': 'Context check'})
+            return rc._current_workflow.get()
+
+        assert asyncio.run(run()) is None
+
+    def test_stage_runs_outside_workflow(self, orchestrator):
+        """Test a stage helper can be called directly with its tasks."""
+        tasks = orchestrator._create_workflow_tasks({'name': 'Direct'}, 'wf_direct')
+
+        result = asyncio.run(orchestrator._execute_ba_validation_stage(tasks, {'approved': True}))
+
+        assert result['name'] == 'ba_validation'
+        assert result['ba_validation']['workflow_id'] is None
+
+
+class TestStageDependencies:
+    """Test the data each stage receives from the DAG."""
+
+    def test_ux_review_reads_development_output(self, orchestrator):
+        """Test UX review runs on the developed components, not on test results."""
+        tasks = orchestrator._create_workflow_tasks({'name': 'Design'}, 'wf_design')
+        runners = orchestrator._stage_runners({'name': 'Design'}, tasks)
+        components = [{'agent': 'frontend-developer', 'component': 'frontend'}]
+
+        result = asyncio.run(runners['ux_review']({'development': {'components': components}}))
+
+        for review in ('ux_review', 'ui_review', 'brand_review'):
+            assert result[review]['results']['components'] == components
+
+
+def _review_runners(testing, ux_review):
+    """Stage runners that pass every stage except the two concurrent reviews given."""
+    async def passed(done):
+        return {'status': 'passed'}
+
+    runners = {template[0]: passed for template in rc.RCWorkflowOrchestrator._TASK_TEMPLATES}
+    runners.update(testing=testing, ux_review=ux_review)
+    return runners
+
+
+class TestRollback:
+    """Test finding the completed work upstream of a failure."""
+
+    def test_affected_tasks_walk_task_dependencies(self, orchestrator):
+        """Test the upstream walk uses each task's dependencies, not a per-run copy of the DAG."""
+        tasks = {task.id: task
+                 for task in orchestrator._create_workflow_tasks({'name': 'Undo'}, 'wf_undo')}
+        for stage in ('planning', 'development', 'ux_review'):
+            tasks[f'wf_undo_{stage}'].status = rc.TaskStatus.COMPLETED
+        tasks['wf_undo_testing'].status = rc.TaskStatus.REJECTED
+
+        affected = orchestrator._affected_tasks(['wf_undo_testing'])
+
+        assert sorted(task.id for task in affected) == ['wf_undo_development', 'wf_undo_planning']
+        assert not hasattr(orchestrator, 'dag')
+
+
+class TestDagScheduler:
+    """Test how the scheduler settles in-flight stages when one of them fails."""
+
+    def _run(self, orchestrator, runners, cleaned_up=()):
+        """Run the DAG; return unretrieved task errors and the cleanups done by its return."""
+        tasks = orchestrator._create_workflow_tasks({'name': 'Failing'}, 'wf_failing')
+        unretrieved = []
+
+        async def run():
+            loop = asyncio.get_running_loop()
+            loop.set_exception_handler(lambda loop, context: unretrieved.append(context))
+            try:
+                await orchestrator._execute_dag('wf_failing', tasks, runners, {})
+            except ValueError:
+                pass
+            done_on_return = list(cleaned_up)
+            gc.collect()
+            await asyncio.sleep(0)
+            return done_on_return
+
+        done_on_return = asyncio.run(run())
+        return unretrieved, done_on_return
+
+    def test_cancelled_stage_cleans_up_before_return(self, orchestrator):
+        """Test a stage cancelled by a failure has finished cleaning up when the DAG returns."""
+        cleaned_up = []
+
+        async def testing(done):
+            try:
+                await asyncio.Event().wait()
+            finally:
+                await asyncio.sleep(0)
+                cleaned_up.append('testing')
+
+        async def ux_review(done):
+            await asyncio.sleep(0)
+            raise ValueError('ux_review')
+
+        _, done_on_return = self._run(orchestrator, _review_runners(testing, ux_review), cleaned_up)
+
+        assert done_on_return == ['testing']
+
+    def test_every_failed_stage_is_rejected(self, orchestrator):
+        """Test stages failing together are all marked rejected, not left pending."""
+        async def testing(done):
+            raise ValueError('testing')
+
+        async def ux_review(done):
+            raise ValueError('ux_review')
+
+        unretrieved, _ = self._run(orchestrator, _review_runners(testing, ux_review))
+
+        statuses = {task.id: task.status for task in orchestrator.tasks_by_workflow['wf_failing']}
+        assert statuses['wf_failing_testing'] == rc.TaskStatus.REJECTED
+        assert statuses['wf_failing_ux_review'] == rc.TaskStatus.REJECTED
+        assert unretrieved == []
+
+
+class TestStateStore:
+    """Test the task event log."""
+
+    def test_constructor_opens_nothing(self, tmp_path):
+        """Test creating an orchestrator neither opens the log nor starts its writer."""
+        db_path = tmp_path / 'state.db'
+
+        orchestrators = [rc.RCWorkflowOrchestrator(state_db_path=str(db_path)) for _ in range(5)]
+
+        assert not db_path.exists()
+        assert all(orch._state_writer is None for orch in orchestrators)
+
+    def test_completed_stages_are_replayed(self, tmp_path, monkeypatch):
+        """Test a second orchestrator on the same log sees the completed stages."""
+        monkeypatch.setattr('src.agents.git_workflow_manager.GitWorkflowManager', _FakeGitManager)
+        monkeypatch.setattr(rc.RCWorkflowOrchestrator, '_generate_workflow_report', _skip_report)
+        db_path = str(tmp_path / 'state.db')
+
+        async def run():
+            async with rc.RCWorkflowOrchestrator(state_db_path=db_path) as orch:
+                results = await orch.execute_complete_workflow({'name': 'Resume'})
+            assert orch._state_conn is None
+            async with rc.RCWorkflowOrchestrator(state_db_path=db_path) as orch:
+                orch._get_state_writer()
+                return results['workflow_id'], orch._load_completed_outputs(results['workflow_id'])
+
+        workflow_id, completed = asyncio.run(run())
+
+        assert completed[f"{workflow_id}_planning"]['name'] == 'planning'
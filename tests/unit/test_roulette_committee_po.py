@@ -0,0 +1,41 @@
+"""
+Unit tests for the Roulette Committee product owner.
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+# Agent modules import their siblings by bare name
+sys.path.insert(0, str(ROOT / 'src' / 'agents'))
+
+from roulette_committee_po import Risk, RouletteCommitteeProductOwner  # noqa: E402
+
+
+class TestRiskIdentification:
+    """Test how interview risks are collected."""
+
+    def test_user_risks_are_normalized(self):
+        """Test text, dict and Risk inputs all come back as Risk records."""
+        po = RouletteCommitteeProductOwner()
+        supplied = Risk('Vendor lock-in', 'low', 'Keep adapters thin')
+
+        risks = po._identify_risks({'risks': [
+            'Tight deadline',
+            {'risk': 'Data loss', 'impact': 'high', 'mitigation': 'Nightly backups'},
+            {'risk': 'Scope creep'},
+            supplied,
+        ]})
+
+        assert all(isinstance(risk, Risk) for risk in risks)
+        assert risks[0] == Risk('Tight deadline', 'medium', 'To be determined')
+        assert risks[1] == Risk('Data loss', 'high', 'Nightly backups')
+        assert risks[2] == Risk('Scope creep', 'medium', 'To be determined')
+        assert risks[3] is supplied
+
+    def test_default_risks_without_input(self):
+        """Test the default risk register is used when none are supplied."""
+        risks = RouletteCommitteeProductOwner()._identify_risks({})
+
+        assert risks
+        assert all(isinstance(risk, Risk) for risk in risks)
@@ -0,0 +1,284 @@
+"""
+Unit tests for the Roulette Committee workflow orchestrator.
+"""
+
+import asyncio
+import json
+import sys
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+# Agent modules import their siblings by bare name
+sys.path.insert(0, str(ROOT / 'src' / 'agents'))
+
+rcw = pytest.importorskip('roulette_committee_workflow')
+
+
+@pytest.fixture
+def orchestrator(tmp_path, monkeypatch):
+    """Create an orchestrator whose caches and project live in a temporary directory."""
+    monkeypatch.setenv('RC_STORY_CACHE_DB', str(tmp_path / 'cache.db'))
+    orch = rcw.RouletteCommitteeWorkflowOrchestrator(seed=7)
+    orch.project_path = str(tmp_path / 'project')
+    yield orch
+    orch.close()
+
+
+class TestStoryPipeline:
+    """Test dispatching stories to the developer pool."""
+
+    def test_empty_developer_pool_fails_fast(self, orchestrator):
+        """Test an empty pool raises instead of waiting for a developer forever."""
+        stories = [{'id': 'RC-STORY-001'}]
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(asyncio.wait_for(orchestrator.process_stories_pipeline(stories), 5))
+
+    def test_failed_story_cancels_the_rest(self, orchestrator, monkeypatch):
+        """Test the remaining stories are stopped before the error propagates."""
+        orchestrator.initialize_agent_pools(num_developers=2, num_testers=1)
+        cancelled = []
+
+        async def process_single_story(story, developer, tester):
+            if story['id'] == 'boom':
+                raise ValueError(story['id'])
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(story['id'])
+                raise
+
+        monkeypatch.setattr(orchestrator, 'process_single_story', process_single_story)
+
+        async def run():
+            with pytest.raises(ValueError):
+                await orchestrator.process_stories_pipeline([{'id': 'slow'}, {'id': 'boom'}])
+            return list(cancelled)
+
+        assert asyncio.run(run()) == ['slow']
+
+
+def _story(story_id, criteria=('Committee is saved',)):
+    return {
+        'id': story_id,
+        'title': 'Create committee',
+        'user_story': 'As a member I want to create a committee',
+        'acceptance_criteria': list(criteria),
+        'created_at': datetime.now(timezone.utc).isoformat()
+    }
+
+
+class TestValidationCache:
+    """Test reuse of UX, UI and BA verdicts across stories."""
+
+    def test_fingerprint_ignores_ids_and_timestamps(self, orchestrator):
+        """Test stories that differ only in bookkeeping share a fingerprint."""
+        started = datetime.now(timezone.utc)
+        first = orchestrator._validation_fingerprint(
+            _story('RC-STORY-001'), {'story_id': 'RC-STORY-001', 'started_at': started}
+        )
+        second = orchestrator._validation_fingerprint(
+            _story('RC-STORY-002'),
+            {'story_id': 'RC-STORY-002', 'started_at': started + timedelta(seconds=5)}
+        )
+        other_criteria = orchestrator._validation_fingerprint(
+            _story('RC-STORY-003', ['Committee is listed']), {'story_id': 'RC-STORY-003'}
+        )
+
+        assert first == second
+        assert first != other_criteria
+
+    def test_equivalent_story_reuses_verdicts(self, orchestrator, monkeypatch):
+        """Test the second equivalent story skips validation but keeps its own id."""
+        orchestrator.initialize_agent_pools(num_developers=1, num_testers=1)
+        developer, tester = orchestrator.developers[0], orchestrator.testers[0]
+        validated = []
+        validate = orchestrator.ui_designer.validate_visual_implementation
+
+        async def test_story(story, implementation):
+            return {'status': 'passed', 'tests': {}}
+
+        def validate_visual_implementation(story_id, implementation):
+            validated.append(story_id)
+            return validate(story_id, implementation)
+
+        monkeypatch.setattr(tester, 'test_story', test_story)
+        monkeypatch.setattr(orchestrator.ui_designer, 'validate_visual_implementation',
+                            validate_visual_implementation)
+        stories = [_story('RC-STORY-001'), _story('RC-STORY-002')]
+        orchestrator._track_stories(stories)
+
+        async def run():
+            return [await orchestrator._run_story_pipeline(story, developer, tester)
+                    for story in stories]
+
+        results = asyncio.run(run())
+
+        assert validated == ['RC-STORY-001']
+        assert results[1]['pipeline_stages']['ba_validation']['story_id'] == 'RC-STORY-002'
+        assert (results[1]['pipeline_stages']['ui_review']
+                == results[0]['pipeline_stages']['ui_review'])
+
+
+    def test_reused_verdicts_are_not_shared(self, orchestrator, monkeypatch):
+        """Test editing one story's review results leaves later stories and the cache alone."""
+        orchestrator.initialize_agent_pools(num_developers=1, num_testers=1)
+        developer, tester = orchestrator.developers[0], orchestrator.testers[0]
+
+        async def test_story(story, implementation):
+            return {'status': 'passed', 'tests': {}}
+
+        monkeypatch.setattr(tester, 'test_story', test_story)
+        stories = [_story('RC-STORY-001'), _story('RC-STORY-002'), _story('RC-STORY-003')]
+        orchestrator._track_stories(stories)
+
+        async def run(story):
+            return await orchestrator._run_story_pipeline(story, developer, tester)
+
+        first, second = asyncio.run(run(stories[0])), asyncio.run(run(stories[1]))
+        for result in (first, second):
+            stages = result['pipeline_stages']
+            stages['ux_review']['issues'].append('Fixed by hand')
+            stages['ui_review']['issues'].append('Fixed by hand')
+            stages['ba_validation']['criteria_checked'][0]['passed'] = 'edited'
+        third = asyncio.run(run(stories[2]))['pipeline_stages']
+
+        assert 'Fixed by hand' not in third['ux_review']['issues']
+        assert 'Fixed by hand' not in third['ui_review']['issues']
+        assert third['ba_validation']['criteria_checked'][0]['passed'] != 'edited'
+        assert second['pipeline_stages']['ux_review']['issues'].count('Fixed by hand') == 1
+
+
+class TestStoryCache:
+    """Test the on-disk cache of completed story results."""
+
+    def test_key_ignores_volatile_fields(self, orchestrator):
+        """Test bookkeeping fields do not change a story's cache key."""
+        story = _story('RC-STORY-001')
+        reassigned = dict(story, created_at='2020-01-01T00:00:00', status='done', assignee='DEV-1')
+        key = orchestrator._story_cache_key
+
+        assert key(story) == key(reassigned)
+        assert key(story) != key(_story('RC-STORY-002'))
+
+    def test_result_round_trips(self, orchestrator, tmp_path):
+        """Test a stored result loads back while its generated files exist."""
+        page = tmp_path / 'page.tsx'
+        page.write_text('export default function Page() {}')
+        completed_at = datetime.now(timezone.utc)
+        result = {
+            'story_id': 'RC-STORY-001',
+            'status': 'completed',
+            'pipeline_stages': {'development': {
+                'components': {'frontend': {'file': str(page)}},
+                'completed_at': completed_at
+            }}
+        }
+        key = orchestrator._story_cache_key(_story('RC-STORY-001'))
+
+        orchestrator._store_cached_story(key, result)
+        cached = asyncio.run(orchestrator._load_cached_story(key))
+        page.unlink()
+
+        assert cached['status'] == 'completed'
+        assert cached['pipeline_stages']['development']['completed_at'] == completed_at.isoformat()
+        assert asyncio.run(orchestrator._load_cached_story(key)) is None
+
+    def test_constructor_opens_nothing(self, tmp_path, monkeypatch):
+        """Test creating an orchestrator neither opens the cache nor starts its thread."""
+        db_path = tmp_path / 'cache.db'
+        monkeypatch.setenv('RC_STORY_CACHE_DB', str(db_path))
+
+        orchestrators = [rcw.RouletteCommitteeWorkflowOrchestrator() for _ in range(5)]
+        for orch in orchestrators:
+            orch.close()
+
+        assert not db_path.exists()
+        assert all(orch._story_cache_io is None for orch in orchestrators)
+
+    def test_context_manager_flushes_and_closes(self, tmp_path, monkeypatch):
+        """Test leaving the context writes queued results and releases the cache."""
+        monkeypatch.setenv('RC_STORY_CACHE_DB', str(tmp_path / 'cache.db'))
+        result = {'status': 'completed', 'pipeline_stages': {'development': {}}}
+
+        async def run():
+            async with rcw.RouletteCommitteeWorkflowOrchestrator() as orch:
+                orch._store_cached_story('key', result)
+            assert orch._story_cache is None and orch._story_cache_io is None
+            with rcw.RouletteCommitteeWorkflowOrchestrator() as reopened:
+                return await reopened._load_cached_story('key')
+
+        assert asyncio.run(run()) == result
+
+    def test_lookups_run_off_the_event_loop(self, orchestrator, monkeypatch):
+        """Test cache reads run on the cache thread, not the thread running the loop."""
+        threads = []
+        read = orchestrator._read_cached_story
+
+        def read_cached_story(key):
+            threads.append(threading.current_thread().name)
+            return read(key)
+
+        monkeypatch.setattr(orchestrator, '_read_cached_story', read_cached_story)
+
+        assert asyncio.run(orchestrator._load_cached_story('missing')) is None
+        assert threads[0].startswith('rc-story-cache')
+
+
+class TestDeploymentPrep:
+    """Test the deployment prep started while stories are still in flight."""
+
+    def test_prep_is_cancelled_when_the_run_fails(self, orchestrator, monkeypatch):
+        """Test a failed run stops deployment prep before returning."""
+        cancelled = []
+
+        async def process_stories_pipeline(stories, on_result=None):
+            on_result({'status': 'completed'})
+            await asyncio.sleep(0)
+            raise RuntimeError('pipeline broke')
+
+        async def prepare_for_deployment():
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        monkeypatch.setattr(orchestrator, 'process_stories_pipeline', process_stories_pipeline)
+        monkeypatch.setattr(orchestrator, 'prepare_for_deployment', prepare_for_deployment)
+
+        async def run():
+            results = await orchestrator.execute_complete_workflow({
+                'mission': 'Pick committee decisions by roulette',
+                'features': ['User authentication', 'Voting system']
+            })
+            return results, list(cancelled)
+
+        results, cancelled_on_return = asyncio.run(run())
+
+        assert results['error'] == 'pipeline broke'
+        assert cancelled_on_return == [True]
+
+
+class TestResultsSerialization:
+    """Test saving a full workflow run the way BUILD_ROULETTE_COMMITTEE.sh does."""
+
+    def test_full_results_serialize_to_plain_json(self, orchestrator):
+        """Test epics, risks and timestamps in the results are written as JSON values."""
+        results = asyncio.run(orchestrator.execute_complete_workflow({
+            'mission': 'Pick committee decisions by roulette',
+            'features': ['User authentication', 'Voting system'],
+            'risks': ['Vendor lock-in']
+        }))
+
+        saved = json.loads(rcw.results_to_json(results))
+
+        vision = saved['outputs']['vision']
+        assert vision['epics'][0]['title'] == 'User Authentication & Authorization'
+        assert {'risk': 'Vendor lock-in', 'impact': 'medium',
+                'mitigation': 'To be determined'} in vision['risks']
+        assert datetime.fromisoformat(vision['created_at']).tzinfo is not None
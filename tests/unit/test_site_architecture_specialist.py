@@ -0,0 +1,58 @@
+"""
+Unit tests for the site architecture specialist.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+# Agent modules import their siblings by bare name
+sys.path.insert(0, str(ROOT / 'src' / 'agents'))
+
+sas = pytest.importorskip('site_architecture_specialist')
+
+
+class TestNavigationTables:
+    """Test the static navigation and SEO tables."""
+
+    def test_tables_are_shared_and_read_only(self):
+        """Test every instance sees the same tables and none can change them."""
+        first = sas.SiteArchitectureSpecialist()
+        second = sas.SiteArchitectureSpecialist()
+        menu = first.generate_navigation_menu()
+
+        assert first.analyze_navigation_flow() is second.analyze_navigation_flow()
+        assert isinstance(first.analyze_navigation_flow()['gaming_flow'], tuple)
+        with pytest.raises(TypeError):
+            menu['main_navigation'][0]['path'] = '/elsewhere'
+        with pytest.raises(TypeError):
+            menu['footer_navigation'][0]['links'][0]['label'] = 'Changed'
+        with pytest.raises(AttributeError):
+            first.recommend_seo_improvements()[0]['recommendations'].append('Changed')
+
+
+class TestRouteTables:
+    """Test the static route and feature tables."""
+
+    def test_feature_map_is_read_only(self):
+        """Test no instance can change the features every instance shares."""
+        gaming = sas.SiteArchitectureSpecialist().feature_map['gaming']
+
+        with pytest.raises(TypeError):
+            gaming['requires_auth'] = False
+        with pytest.raises(AttributeError):
+            gaming['routes'].append('/play/hacked')
+
+        fresh = sas.SiteArchitectureSpecialist().feature_map['gaming']
+        assert '/play/hacked' not in fresh['routes']
+
+    def test_route_metadata_is_read_only(self):
+        """Test a shared route's metadata cannot be changed through any instance."""
+        play = sas.SiteArchitectureSpecialist().match('/play')
+
+        with pytest.raises(TypeError):
+            play.metadata['double_zero'] = False
+
+        assert play.metadata['double_zero'] is True
@@ -0,0 +1,101 @@
+"""
+Unit tests for the story task queue.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+# Agent modules import their siblings by bare name
+sys.path.insert(0, str(ROOT / 'src' / 'agents'))
+
+story_tasks = pytest.importorskip('story_tasks')
+
+
+class _FakeRedis:
+    """In-memory stand-in for the task state client."""
+
+    def __init__(self):
+        self.values = {}
+
+    def set(self, key, value, ex=None):
+        self.values[key] = value
+
+    def get(self, key):
+        return self.values.get(key)
+
+
+class _FakeTask:
+    """Records the arguments a task was queued with."""
+
+    def __init__(self):
+        self.calls = []
+
+    def delay(self, *args):
+        self.calls.append(args)
+
+
+@pytest.fixture
+def queue(monkeypatch):
+    """Route task state and queued tasks to in-memory fakes."""
+    state = _FakeRedis()
+    monkeypatch.setattr(story_tasks, 'CELERY_AVAILABLE', True)
+    monkeypatch.setattr(story_tasks, '_state_client', state)
+    monkeypatch.setattr(story_tasks, 'run_implement', _FakeTask(), raising=False)
+    monkeypatch.setattr(story_tasks, 'run_test', _FakeTask(), raising=False)
+    return state
+
+
+class TestWithoutCelery:
+    """Test the queue when celery and redis are not installed."""
+
+    @pytest.fixture(autouse=True)
+    def _no_celery(self, monkeypatch):
+        monkeypatch.setattr(story_tasks, 'CELERY_AVAILABLE', False)
+
+    def test_submit_raises(self):
+        """Test submitting work explains the missing packages."""
+        with pytest.raises(RuntimeError, match='celery'):
+            story_tasks.submit_implement({'id': 'RC-STORY-001'}, '/tmp/project')
+        with pytest.raises(RuntimeError, match='celery'):
+            story_tasks.submit_test({'id': 'RC-STORY-001'}, {})
+
+    def test_get_state_raises(self):
+        """Test reading a task state explains the missing packages."""
+        with pytest.raises(RuntimeError, match='celery'):
+            story_tasks.get_task_state('abc')
+
+
+class TestTaskState:
+    """Test submitting tasks and reading their state back."""
+
+    def test_import_does_not_create_client(self):
+        """Test the Redis client is only created once task state is needed."""
+        assert story_tasks._state_client is None
+
+    def test_submit_records_queued_state(self, queue):
+        """Test a submitted story is queued under its task id."""
+        story = {'id': 'RC-STORY-001'}
+
+        task_id = story_tasks.submit_implement(story, '/tmp/project')
+
+        assert story_tasks.run_implement.calls == [(task_id, story, '/tmp/project')]
+        assert story_tasks.get_task_state(task_id) == {'status': 'queued', 'result': None}
+
+    def test_worker_result_round_trips(self, queue):
+        """Test a result recorded by a worker is returned to the submitter."""
+        task_id = story_tasks.submit_test({'id': 'RC-STORY-001'}, {'status': 'completed'})
+
+        story_tasks._set_state(task_id, 'completed', {'status': 'passed', 'coverage': 92.5})
+
+        assert story_tasks.get_task_state(task_id) == {
+            'status': 'completed',
+            'result': {'status': 'passed', 'coverage': 92.5}
+        }
+        assert queue.values.keys() == {f"task:{task_id}"}
+
+    def test_unknown_task_has_no_state(self, queue):
+        """Test an unknown or expired task id reads back as None."""
+        assert story_tasks.get_task_state('missing') is None
@@ -0,0 +1,69 @@
+"""
+Unit tests for the UX and UI designer agents.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+# Agent modules import their siblings by bare name
+sys.path.insert(0, str(ROOT / 'src' / 'agents'))
+
+ux = pytest.importorskip('ux_ui_designer_agents')
+
+
+class TestDesignTables:
+    """Test the design tables shared by every designer."""
+
+    def test_nested_tokens_are_read_only(self):
+        """Test a designer cannot change the shared tables through nested levels."""
+        ui = ux.UIDesignerAgent()
+
+        with pytest.raises(TypeError):
+            ui.design_system['colors']['primary']['500'] = '#000000'
+        with pytest.raises(TypeError):
+            ui.style_guide['buttons']['primary']['bg'] = 'black'
+        with pytest.raises(TypeError):
+            ux.UXDesignerAgent().usability_criteria['accessibility']['color_contrast'] = 1
+        with pytest.raises(AttributeError):
+            ui.design_system['spacing']['scale'].append(128)
+
+        assert ux.UIDesignerAgent().design_system['colors']['primary']['500'] == '#3b82f6'
+
+    def test_exported_tokens_are_plain_data(self):
+        """Test exported tokens can be edited and serialized by developers."""
+        ui = ux.UIDesignerAgent()
+        tokens = ui.export_design_tokens()
+
+        tokens['colors']['primary']['500'] = '#000000'
+
+        assert json.loads(json.dumps(tokens))['colors']['primary']['500'] == '#000000'
+        assert ui.design_system['colors']['primary']['500'] == '#3b82f6'
+
+
+class TestCssCache:
+    """Test the cached CSS variables follow the design system."""
+
+    def test_reassignment_regenerates_css(self):
+        """Test assigning a new design system replaces the cached CSS."""
+        ui = ux.UIDesignerAgent()
+        assert '--color-primary-500: #3b82f6;' in ui.generate_css_variables()
+        tokens = ui.export_design_tokens()
+        tokens['colors']['primary']['500'] = '#000000'
+
+        ui.design_system = tokens
+
+        assert '--color-primary-500: #000000;' in ui.generate_css_variables()
+
+    def test_assigned_tokens_are_read_only(self):
+        """Test an assigned design system cannot go stale through in-place edits."""
+        ui = ux.UIDesignerAgent()
+        ui.design_system = ui.export_design_tokens()
+        ui.generate_css_variables()
+
+        with pytest.raises(TypeError):
+            ui.design_system['colors']['primary']['500'] = '#000000'
+        assert '--color-primary-500: #3b82f6;' in ui.generate_css_variables()